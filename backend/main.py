@@ -1,19 +1,42 @@
 import sys
 import os
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 
 from backend.utils.paths import get_base_path
-from backend.routers import apis
+from backend.routers import apis, ws
+from backend.services.irsdk.recording import SessionRecorder
 from backend.routers.views import (
     main_views,
     overlay_window_views,
 )
 
-app = FastAPI()
+
+# Path of a recording of every published frame, disabled when unset.
+RECORDING_PATH = os.environ.get("REDWAVE_RECORDING")
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    recorder = None
+    if RECORDING_PATH:
+        recorder = SessionRecorder(apis.irsdk_service, RECORDING_PATH)
+        recorder.start()
+    apis.telemetry_sampler.start()
+    ws.snapshot_hub.start()
+    yield
+    ws.snapshot_hub.stop()
+    apis.telemetry_sampler.stop()
+    apis.track_map_service.svg_fetcher.close()
+    if recorder is not None:
+        recorder.stop()
+
+
+app = FastAPI(lifespan=lifespan)
 BASE_PATH = get_base_path()
 
 app.add_middleware(
@@ -33,6 +56,7 @@ app.mount(
 app.include_router(main_views.router)
 app.include_router(overlay_window_views.router)
 app.include_router(apis.router)
+app.include_router(ws.router)
 
 if __name__ == "__main__":
     import uvicorn
@@ -1,35 +1,215 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from starlette.concurrency import run_in_threadpool
 
+from backend.services.irsdk.notifier import FrameNotifier
+from backend.services.irsdk.sampler import TelemetrySampler
 from backend.services.irsdk.service import IRSDKService
+from backend.services.push.delta import SnapshotHistory
 from backend.services.radar.service import RadarService
 from backend.services.leaderboard.service import Leaderboard
 from backend.services.track_map.service import TrackMapService
 from backend.services.telemetry.service import TelemetryService
+from backend.services.track_map.assets import JSON_MEDIA_TYPE, SVG_MEDIA_TYPE
+from backend.utils.serialization import BodyCache, negotiate, snapshot_response
 
 router = APIRouter(prefix="/api")
 
 irsdk_service = IRSDKService()
+telemetry_sampler = TelemetrySampler(irsdk_service)
+frame_notifier = FrameNotifier(irsdk_service)
 radar_service = RadarService(irsdk_service)
 leaderboard_service = Leaderboard(irsdk_service)
 track_map_service = TrackMapService(irsdk_service)
 telemetry_service = TelemetryService(irsdk_service)
 
+# Recent snapshots per service and section projection, for ?since.
+snapshot_histories: dict[tuple, SnapshotHistory] = {}
+
+# Encoded plain snapshots, shared by every poll within one tick.
+snapshot_bodies = BodyCache()
+
+
+# Longest time a ?wait=<seconds> long poll is held.
+MAX_WAIT = 10.0
+
+# Assets never change under their content hash.
+IMMUTABLE_CACHE_CONTROL = "public, max-age=31536000, immutable"
+
+
+def _etag_variant(projection: frozenset[str] | None, media_type: str) -> str:
+    """
+    Part of the ETag naming the representation: the section
+    projection and the encoding, so that one tick's projections and
+    encodings never share a validator.
+    """
+    sections = "all" if projection is None else ",".join(sorted(projection))
+    encoding = "json" if media_type == JSON_MEDIA_TYPE else "msgpack"
+    return f"{sections};{encoding}"
+
+
+def _etag(tick: int, variant: str) -> str:
+    return f'"{tick};{variant}"'
+
+
+def _known_tick(
+    if_none_match: str | None, since: int | None, variant: str
+) -> int | None:
+    """
+    Return the tick the client already has, from its ETag of the same
+    representation or ?since.
+    """
+    for tag in (if_none_match or "").split(","):
+        tag = tag.strip().removeprefix("W/").strip('"')
+        tick, _, tag_variant = tag.partition(";")
+        if tag_variant == variant and tick.lstrip("-").isdigit():
+            return int(tick)
+    return since
+
+
+def _resolve_sections(service, sections: str | None) -> frozenset[str] | None:
+    """Parse ?sections=a,b, unknown sections are a 400."""
+    if sections is None:
+        return None
+    try:
+        return service.resolve_sections(
+            section for section in sections.split(",") if section
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+async def _snapshot(
+    service,
+    request: Request,
+    since: int | None,
+    wait: float,
+    sections: str | None,
+) -> Response:
+    """
+    Return the plain snapshot, or with ?since=<tick> the update from
+    that tick, see backend.services.push.delta. since=-1 requests a
+    keyframe. ?sections=a,b builds only those SECTIONS of the service.
+
+    The ETag is the tick the snapshot was built from with its sections
+    and encoding, a poll with a matching If-None-Match gets a 304
+    without building anything.
+    With ?wait=<seconds> the request is held until the sim ticks
+    past the client's tick, up to that many seconds. The wait is
+    on the event loop, it holds no threadpool worker.
+    Encoded as JSON, or as MessagePack when Accept asks for it.
+    """
+    projection = _resolve_sections(service, sections)
+    accept = request.headers.get("accept")
+    variant = _etag_variant(projection, negotiate(accept))
+    if_none_match = request.headers.get("if-none-match")
+    known = _known_tick(if_none_match, since, variant)
+    if wait:
+        if known is None:
+            known = await run_in_threadpool(irsdk_service.current_tick)
+        tick = await frame_notifier.wait_for_frame(known, wait)
+    else:
+        tick = await run_in_threadpool(irsdk_service.current_tick)
+    headers = {
+        "ETag": _etag(tick, variant),
+        "Cache-Control": "no-cache",
+        "Vary": "Accept",
+    }
+    if if_none_match and known == tick:
+        return Response(status_code=304, headers=headers)
+
+    return await run_in_threadpool(
+        _build_response,
+        service,
+        projection,
+        since,
+        accept,
+        variant,
+        headers,
+    )
+
+
+def _build_response(
+    service,
+    projection: frozenset[str] | None,
+    since: int | None,
+    accept: str | None,
+    variant: str,
+    headers: dict[str, str],
+) -> Response:
+    """Build and encode the snapshot, off the event loop."""
+    tick, snapshot = service.get_versioned_snapshot(projection)
+    headers["ETag"] = _etag(tick, variant)
+    key = (service, projection)
+    if since is not None:
+        history = snapshot_histories.setdefault(key, SnapshotHistory())
+        update = history.update_since(since, tick, snapshot)
+        return snapshot_response(update, accept, headers=headers)
+    return snapshot_response(
+        snapshot, accept, headers=headers, cache=snapshot_bodies, cache_key=key
+    )
+
 
 @router.get("/radar")
-def get_radar_data():
-    return radar_service.get_snapshot()
+async def get_radar_data(
+    request: Request,
+    since: int | None = None,
+    wait: float = Query(0.0, ge=0.0, le=MAX_WAIT),
+    sections: str | None = None,
+):
+    return await _snapshot(radar_service, request, since, wait, sections)
 
 
 @router.get("/leaderboard")
-def get_leaderboard_data():
-    return leaderboard_service.get_snapshot()
+async def get_leaderboard_data(
+    request: Request,
+    since: int | None = None,
+    wait: float = Query(0.0, ge=0.0, le=MAX_WAIT),
+    sections: str | None = None,
+):
+    return await _snapshot(leaderboard_service, request, since, wait, sections)
 
 
 @router.get("/track-map")
-def get_track_map_data():
-    return track_map_service.get_snapshot()
+async def get_track_map_data(
+    request: Request,
+    since: int | None = None,
+    wait: float = Query(0.0, ge=0.0, le=MAX_WAIT),
+    sections: str | None = None,
+):
+    return await _snapshot(track_map_service, request, since, wait, sections)
+
+
+def _asset_response(asset_hash: str, media_type: str) -> Response:
+    content = track_map_service.assets.get(asset_hash, media_type)
+    if content is None:
+        raise HTTPException(status_code=404, detail="Unknown track asset")
+    return Response(
+        content,
+        media_type=media_type,
+        headers={
+            "ETag": f'"{asset_hash}"',
+            "Cache-Control": IMMUTABLE_CACHE_CONTROL,
+        },
+    )
+
+
+@router.get("/track-map/assets/{asset_hash}.svg")
+def get_track_map_asset(asset_hash: str):
+    """Return a track SVG by the hash a track-map snapshot carries."""
+    return _asset_response(asset_hash, SVG_MEDIA_TYPE)
+
+
+@router.get("/track-map/assets/{asset_hash}.json")
+def get_track_map_racing_line(asset_hash: str):
+    """Return a racing line table by the hash a track-map snapshot carries."""
+    return _asset_response(asset_hash, JSON_MEDIA_TYPE)
 
 
 @router.get("/telemetry")
-def get_telemetry_data():
-    return telemetry_service.get_snapshot()
+async def get_telemetry_data(
+    request: Request,
+    since: int | None = None,
+    wait: float = Query(0.0, ge=0.0, le=MAX_WAIT),
+    sections: str | None = None,
+):
+    return await _snapshot(telemetry_service, request, since, wait, sections)
@@ -0,0 +1,142 @@
+import asyncio
+import json
+import logging
+
+from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+from starlette.concurrency import run_in_threadpool
+
+from backend.routers import apis
+from backend.services.push.hub import SnapshotHub, Subscription
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+# Topic names match the /api/<topic> endpoints.
+snapshot_hub = SnapshotHub(
+    apis.irsdk_service,
+    {
+        "radar": apis.radar_service,
+        "leaderboard": apis.leaderboard_service,
+        "track-map": apis.track_map_service,
+        "telemetry": apis.telemetry_service,
+    },
+)
+
+
+async def _send_loop(websocket: WebSocket, subscription: Subscription) -> None:
+    while True:
+        for message in await subscription.next_messages():
+            await websocket.send_text(message)
+
+
+async def _subscribe(
+    websocket: WebSocket,
+    subscription: Subscription,
+    topics: list[str],
+    sections: dict[str, list[str]],
+) -> None:
+    unknown = [topic for topic in topics if topic not in snapshot_hub.topics]
+    if unknown:
+        await websocket.send_text(json.dumps({"error": f"unknown topics: {unknown}"}))
+    added = []
+    for topic in topics:
+        if topic not in snapshot_hub.topics or topic in subscription.routes:
+            continue
+        resolved = None
+        if topic in sections:
+            requested = sections[topic]
+            if not isinstance(requested, list) or not all(
+                isinstance(section, str) for section in requested
+            ):
+                await websocket.send_text(json.dumps({"error": "invalid sections"}))
+                continue
+            try:
+                resolved = snapshot_hub.services[topic].resolve_sections(requested)
+            except ValueError as e:
+                await websocket.send_text(json.dumps({"error": str(e)}))
+                continue
+        subscription.add(topic, resolved)
+        added.append(topic)
+    await _send_current(subscription, added)
+
+
+async def _resync(subscription: Subscription, topics: list[str]) -> None:
+    """Send a keyframe of topics whose deltas the client cannot apply."""
+    topics = [topic for topic in topics if topic in subscription.routes]
+    for topic in topics:
+        subscription.request_keyframe(topic)
+    await _send_current(subscription, topics)
+
+
+async def _send_current(subscription: Subscription, topics: list[str]) -> None:
+    """Send the current state right away instead of waiting for the next tick."""
+    if not topics:
+        return
+    keys = [(topic, subscription.routes[topic]) for topic in topics]
+    updates = await run_in_threadpool(snapshot_hub.build, keys)
+    for (topic, _), update in updates.items():
+        subscription.offer(topic, update)
+
+
+def _is_valid_message(message) -> bool:
+    """Check the shape of a client message, sections are checked later."""
+    if not isinstance(message, dict):
+        return False
+    topics = [
+        message.get("subscribe", []),
+        message.get("unsubscribe", []),
+        message.get("keyframe", []),
+    ]
+    return (
+        all(isinstance(items, list) for items in topics)
+        and all(isinstance(topic, str) for items in topics for topic in items)
+        and isinstance(message.get("sections", {}), dict)
+    )
+
+
+@router.websocket("/ws")
+async def snapshots_ws(websocket: WebSocket):
+    """
+    Push overlay snapshots once per sim tick.
+
+    Clients send {"subscribe": [topics]} or {"unsubscribe": [topics]}
+    and receive {"topic", "tick", "data"} messages, data being the
+    same snapshot the matching /api/<topic> endpoint returns.
+    Sending {"delta": true} switches to keyframes and deltas
+    against the previous message, see backend.services.push.delta.
+    {"sections": {topic: [sections]}} next to "subscribe" limits a
+    topic to some sections of its snapshot. A client that lost track
+    of the deltas sends {"keyframe": [topics]} to get a keyframe.
+    """
+    await websocket.accept()
+    subscription = snapshot_hub.subscribe(asyncio.get_running_loop())
+    sender = asyncio.create_task(_send_loop(websocket, subscription))
+    try:
+        while True:
+            try:
+                message = json.loads(await websocket.receive_text())
+            except json.JSONDecodeError:
+                await websocket.send_text(json.dumps({"error": "invalid message"}))
+                continue
+            if not _is_valid_message(message):
+                await websocket.send_text(json.dumps({"error": "invalid message"}))
+                continue
+            if "delta" in message:
+                subscription.delta = bool(message["delta"])
+            await _subscribe(
+                websocket,
+                subscription,
+                message.get("subscribe", []),
+                message.get("sections", {}),
+            )
+            await _resync(subscription, message.get("keyframe", []))
+            for topic in message.get("unsubscribe", []):
+                subscription.discard(topic)
+    except WebSocketDisconnect:
+        pass
+    finally:
+        snapshot_hub.unsubscribe(subscription)
+        sender.cancel()
+        if subscription.dropped:
+            logger.debug("WebSocket client dropped %d frames", subscription.dropped)
@@ -1,5 +1,8 @@
-from dataclasses import dataclass
-from typing import Any
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, ClassVar, Iterable
+
+from backend.services.drivers import DriverTable
 
 
 @dataclass
@@ -20,16 +23,38 @@ class SessionStateContext:
             Whether the car is currently on pit road.
         multiclass (bool):
             Whether the session contains multiple car classes.
+        driver_table (DriverTable):
+            Driver records by CarIdx, the table the service keeps
+            across ticks and rebuilds once per DriverInfo revision.
 
     Used by BaseService implementations to pass pre-fetched,
     consistent data into snapshot builders.
     """
+    # Per-car arrays the builders index by car index.
+    CAR_ARRAYS: ClassVar[tuple[str, ...]] = (
+        "positions",
+        "class_positions",
+        "lap_dist_pct",
+        "is_pitroad",
+    )
+
     drivers: list[dict]
     positions: list[int]
     class_positions: list[int]
     lap_dist_pct: list[float]
     is_pitroad: list[bool]
     multiclass: bool
+    driver_table: DriverTable = field(kw_only=True)
+
+    def covers_drivers(self) -> bool:
+        """
+        Whether every per-car array has an entry for each driver.
+
+        The sim fills the CarIdx arrays for all 64 car slots, but .ibt
+        files record the player's car only and have none of them.
+        """
+        size = len(self.driver_table.class_ids)
+        return all(len(getattr(self, name)) >= size for name in self.CAR_ARRAYS)
 
 
 class BaseCarBuilder:
@@ -44,22 +69,20 @@ class BaseCarBuilder:
         """
         Build a base representation of a car.
         """
-        driver = ctx.drivers[idx]
-        if self._is_pace_car(driver):
+        driver = ctx.driver_table.get(idx)
+        if driver is None or driver.is_pace_car:
+            return None
+        # No telemetry for this car, as in a player-only .ibt file.
+        if idx >= len(ctx.lap_dist_pct) or idx >= len(ctx.is_pitroad):
             return None
 
         return {
             "car_idx": idx,
-            "car_number": driver.get("CarNumber"),
+            "car_number": driver.car_number,
             "lap_dist_pct": ctx.lap_dist_pct[idx],
             "is_in_pitroad": ctx.is_pitroad[idx],
         }
 
-    @staticmethod
-    def _is_pace_car(driver: dict) -> bool:
-        """Checks if a car is a pace car by name."""
-        return driver.get("UserName", "").upper() == "PACE CAR"
-
 
 class BaseService:
     """
@@ -69,26 +92,99 @@ class BaseService:
         - build context
         - build snapshot
         - return empty snapshot if context is unavailable
+
+    Subclasses list the IRSDK fields they read in FIELDS, so that
+    IRSDKService captures them into every TelemetryFrame, and the
+    optional parts of their snapshot in SECTIONS. Callers may ask
+    for some sections only, the others are then not built at all.
     """
+    FIELDS: tuple[str, ...] = ()
+    SECTIONS: tuple[str, ...] = ()
+
     def __init__(self, irsdk_service, builder: BaseCarBuilder | None):
         self.irsdk = irsdk_service
         self.builder = builder
+        self.irsdk.request_fields(self.FIELDS)
+        # Snapshot of the latest tick per section projection,
+        # shared by every caller until the next tick.
+        self._memo: dict[frozenset[str] | None, tuple[int, dict[str, Any]]] = {}
+        self._build_lock = threading.Lock()
 
-    def get_snapshot(self) -> dict[str, Any]:
+    def get_snapshot(self, sections: Iterable[str] | None = None) -> dict[str, Any]:
         """
         Public entry point for retrieving service data.
         """
+        return self.get_versioned_snapshot(sections)[1]
+
+    def get_versioned_snapshot(
+        self, sections: Iterable[str] | None = None
+    ) -> tuple[int, dict[str, Any]]:
+        """
+        Return the snapshot with the tick of the frame it was built
+        from, -1 when no sim data is available.
+
+        Only the given SECTIONS are built, all of them by default.
+        Raises ValueError for a section the service does not have.
+
+        Snapshots are built once per tick: every caller gets the same
+        dict until the sim ticks again, so it must not be modified.
+        Concurrent callers wait for the one build in progress instead
+        of building their own.
+        """
+        sections = self.resolve_sections(sections)
         connected, _ = self.irsdk._ensure_connected()
         if not connected:
-            return self._empty_snapshot()
-
-        ctx = self._build_context()
-        if not ctx:
-            return self._empty_snapshot()
+            return -1, self._empty_snapshot()
+
+        memo = self._memo.get(sections)
+        if memo is not None and memo[0] == self.irsdk.get_frame().tick_count:
+            return memo
+
+        with self._build_lock, self.irsdk.pinned_frame() as frame:
+            # Another caller may have built this tick while we waited.
+            memo = self._memo.get(sections)
+            if memo is not None and memo[0] == frame.tick_count:
+                return memo
+
+            # All reads below come from one tick-consistent frame.
+            ctx = self._build_context()
+            if not ctx:
+                snapshot = self._empty_snapshot()
+            else:
+                snapshot = self._build_snapshot(ctx, sections)
+                snapshot["location"] = self.irsdk.get_car_location()
+
+            if frame.tick_count >= 0:
+                self._memo[sections] = (frame.tick_count, snapshot)
+            return frame.tick_count, snapshot
+
+    def resolve_sections(
+        self, sections: Iterable[str] | None
+    ) -> frozenset[str] | None:
+        """
+        Validate requested sections, None stands for all of them.
+        """
+        if sections is None:
+            return None
+        sections = frozenset(sections)
+        unknown = sections - set(self.SECTIONS)
+        if unknown:
+            raise ValueError(f"Unknown sections: {', '.join(sorted(unknown))}")
+        return None if sections == set(self.SECTIONS) else sections
 
-        snapshot = self._build_snapshot(ctx)
-        snapshot["location"] = self.irsdk.get_car_location()
-        return snapshot
+    @staticmethod
+    def _build_sections(
+        builders: dict[str, Callable[[], Any]],
+        sections: frozenset[str] | None,
+    ) -> dict[str, Any]:
+        """
+        Call the builder of each requested section, of all if None.
+        """
+        return {
+            name: build()
+            for name, build in builders.items()
+            if sections is None or name in sections
+        }
 
     def _build_context(self):
         """
@@ -96,9 +192,10 @@ class BaseService:
         """
         raise NotImplementedError
 
-    def _build_snapshot(self, ctx) -> dict:
+    def _build_snapshot(self, ctx, sections: frozenset[str] | None = None) -> dict:
         """
-        Build the snapshot using prepared context.
+        Build the snapshot using prepared context,
+        with the given sections only (all if None).
         """
         raise NotImplementedError
 
@@ -0,0 +1,160 @@
+from typing import Any, Iterator, Mapping, NamedTuple
+
+
+class DriverRecord:
+    """
+    Static facts of the driver of one car, derived once from its
+    DriverInfo entry instead of on every snapshot.
+    """
+
+    __slots__ = (
+        "car_idx",
+        "user_id",
+        "user_name",
+        "first_name",
+        "car_number",
+        "is_pace_car",
+        "class_id",
+        "class_color",
+        "class_rgb",
+        "class_est_lap_time",
+        "irating",
+        "license",
+        "source",
+    )
+
+    def __init__(self, car_idx: int, driver: Mapping[str, Any]):
+        self.car_idx = car_idx
+        self.user_id = driver.get("UserID")
+        self.user_name = driver.get("UserName", "")
+        names = self.user_name.strip().split()
+        self.first_name = names[0] if names else ""
+        self.car_number = driver.get("CarNumber")
+        self.is_pace_car = self.user_name.upper() == "PACE CAR"
+        self.class_id = driver.get("CarClassID")
+        self.class_color = driver.get("CarClassColor")
+        # Class colour as a CSS colour, None for no or a white colour.
+        self.class_rgb = None
+        if self.class_color not in (None, 0xFFFFFF):
+            r = (self.class_color >> 16) & 0xFF
+            g = (self.class_color >> 8) & 0xFF
+            b = self.class_color & 0xFF
+            self.class_rgb = f"rgb({r},{g},{b})"
+        self.class_est_lap_time = driver.get("CarClassEstLapTime")
+        self.irating = driver.get("IRating")
+        self.license = driver.get("LicString")
+        # DriverInfo entry the record was derived from.
+        self.source = driver
+
+    def is_same_driver(self, other: "DriverRecord") -> bool:
+        """Whether both records are of the same person."""
+        if self.user_id is not None or other.user_id is not None:
+            return self.user_id == other.user_id
+        return self.user_name == other.user_name
+
+
+class DriverDiff(NamedTuple):
+    """Car indices that changed between two DriverInfo revisions."""
+
+    joined: frozenset[int] = frozenset()
+    left: frozenset[int] = frozenset()
+    # Cars taken over by another driver, as in team races.
+    swapped: frozenset[int] = frozenset()
+
+    def __bool__(self) -> bool:
+        return bool(self.joined or self.left or self.swapped)
+
+
+class DriverTable:
+    """
+    Driver records keyed by the CarIdx field of DriverInfo.Drivers.
+
+    The drivers list is not indexed by CarIdx once cars leave a
+    session, so records are looked up by that field, falling back to
+    the list position for entries without it. The table is rebuilt
+    only when DriverInfo changes: IRSDKService shares one parsed
+    DriverInfo per SessionInfoUpdate revision. Records of unchanged
+    drivers are carried over as the same objects.
+    """
+
+    def __init__(self):
+        self.records: dict[int, DriverRecord] = {}
+        self.car_indices: list[int] = []
+        self.multiclass = False
+        # Class id by car index, None for indices without a car.
+        self.class_ids: list[int | None] = []
+        # Changes of the latest rebuild.
+        self.diff = DriverDiff()
+        self._source: Any = None
+
+    @classmethod
+    def from_drivers(cls, drivers: list[Mapping[str, Any]]) -> "DriverTable":
+        table = cls()
+        table.update({"Drivers": drivers})
+        return table
+
+    def update(self, driver_info: Mapping[str, Any] | None) -> DriverDiff:
+        """
+        Rebuild the table if DriverInfo changed. Returns the changes
+        of this call, an empty DriverDiff when nothing was rebuilt.
+        """
+        if driver_info is self._source and driver_info is not None:
+            return DriverDiff()
+        self._source = driver_info
+
+        drivers = (driver_info or {}).get("Drivers") or []
+        previous = self.records
+        records: dict[int, DriverRecord] = {}
+        swapped = set()
+        for position, driver in enumerate(drivers):
+            car_idx = driver.get("CarIdx", position)
+            old = previous.get(car_idx)
+            if old is not None and old.source == driver:
+                records[car_idx] = old
+                continue
+            record = DriverRecord(car_idx, driver)
+            if old is not None and not old.is_same_driver(record):
+                swapped.add(car_idx)
+            records[car_idx] = record
+
+        self.records = records
+        self.car_indices = sorted(records)
+        self.multiclass = len(
+            {record.class_id for record in records.values() if record.class_id}
+        ) > 1
+        self.class_ids = [None] * (max(records, default=-1) + 1)
+        for car_idx, record in records.items():
+            self.class_ids[car_idx] = record.class_id
+        self.diff = DriverDiff(
+            joined=frozenset(records.keys() - previous.keys()),
+            left=frozenset(previous.keys() - records.keys()),
+            swapped=frozenset(swapped),
+        )
+        return self.diff
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def __contains__(self, car_idx) -> bool:
+        return car_idx in self.records
+
+    def __iter__(self) -> Iterator[DriverRecord]:
+        """Records in car index order."""
+        return (self.records[idx] for idx in self.car_indices)
+
+    def get(self, car_idx: int) -> DriverRecord | None:
+        return self.records.get(car_idx)
+
+    def car_rgb(self, car_idx: int, player_idx: int | None) -> str:
+        """
+        Return the car's colour as a CSS colour: the player's blue,
+        the class colour in multiclass sessions, dark blue otherwise.
+        """
+        record = self.records.get(car_idx)
+        if record is None:
+            return "#1b2a3a"
+        if car_idx == player_idx:
+            return "#1e6cff"
+        if not self.multiclass or record.class_rgb is None:
+            return "#1b2a3a"
+        return record.class_rgb
@@ -0,0 +1,131 @@
+import logging
+import time
+from enum import Enum
+from typing import Callable
+
+logger = logging.getLogger(__name__)
+
+
+class ConnectionState(str, Enum):
+    """State of the connection to the sim."""
+
+    DISCONNECTED = "disconnected"
+    PROBING = "probing"
+    CONNECTED = "connected"
+    # Connected, but the sim has not produced a new tick for a while.
+    STALE = "stale"
+
+
+ConnectionListener = Callable[[ConnectionState, ConnectionState], None]
+
+
+class ConnectionSupervisor:
+    """
+    State machine owning the IRSDK connection.
+
+    disconnected -> probing -> connected <-> stale
+          ^             |          |
+          +-------------+----------+
+
+    Failed probes are retried with exponential backoff, so sitting in
+    the sim menus costs one memory-map open attempt every few seconds
+    instead of one per request. Listeners are notified on every
+    state transition.
+    """
+
+    def __init__(
+        self,
+        *,
+        probe: Callable[[], bool],
+        release: Callable[[], None],
+        is_alive: Callable[[], bool],
+        latest_tick: Callable[[], int | None],
+        initial_backoff: float = 0.5,
+        max_backoff: float = 8.0,
+        stale_after: float = 2.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self._probe = probe
+        self._release = release
+        self._is_alive = is_alive
+        self._latest_tick = latest_tick
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.stale_after = stale_after
+        self._clock = clock
+
+        self._state = ConnectionState.DISCONNECTED
+        self._listeners: list[ConnectionListener] = []
+        self._backoff = initial_backoff
+        self._next_probe_at = 0.0
+        self._last_tick: int | None = None
+        self._last_tick_at = 0.0
+
+    @property
+    def state(self) -> ConnectionState:
+        return self._state
+
+    @property
+    def is_connected(self) -> bool:
+        """True while frames can be read (connected or stale)."""
+        return self._state in (ConnectionState.CONNECTED, ConnectionState.STALE)
+
+    def add_listener(self, listener: ConnectionListener) -> None:
+        """Register a callback called with (old_state, new_state)."""
+        self._listeners.append(listener)
+
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed."""
+        return max(0.0, self._next_probe_at - self._clock())
+
+    def poll(self) -> ConnectionState:
+        """Advance the state machine and return the current state."""
+        now = self._clock()
+
+        if self.is_connected:
+            if not self._is_alive():
+                self._release()
+                self._backoff = self.initial_backoff
+                self._next_probe_at = now
+                self._set_state(ConnectionState.DISCONNECTED)
+            else:
+                self._check_stale(now)
+            return self._state
+
+        if now < self._next_probe_at:
+            return self._state
+
+        self._set_state(ConnectionState.PROBING)
+        if self._probe():
+            self._backoff = self.initial_backoff
+            self._last_tick = self._latest_tick()
+            self._last_tick_at = now
+            self._set_state(ConnectionState.CONNECTED)
+        else:
+            self._next_probe_at = now + self._backoff
+            self._backoff = min(self._backoff * 2, self.max_backoff)
+            self._set_state(ConnectionState.DISCONNECTED)
+        return self._state
+
+    def _check_stale(self, now: float) -> None:
+        """Switch between connected and stale based on tick progress."""
+        tick = self._latest_tick()
+        if tick != self._last_tick:
+            self._last_tick = tick
+            self._last_tick_at = now
+            if self._state is ConnectionState.STALE:
+                self._set_state(ConnectionState.CONNECTED)
+        elif (
+            self._state is ConnectionState.CONNECTED
+            and now - self._last_tick_at > self.stale_after
+        ):
+            self._set_state(ConnectionState.STALE)
+
+    def _set_state(self, state: ConnectionState) -> None:
+        old = self._state
+        if old is state:
+            return
+        self._state = state
+        logger.debug("IRSDK connection: %s -> %s", old.value, state.value)
+        for listener in self._listeners:
+            listener(old, state)
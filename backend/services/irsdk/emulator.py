@@ -0,0 +1,632 @@
+"""
+iRacing sim emulator writing the real IRSDK shared-memory layout.
+
+The memory map is backed by a file that pyirsdk opens through its
+test-file path (IRSDK.startup(test_file=...)), so IRSDKService and
+every service on top of it run unchanged on Linux:
+
+    header          112 bytes, var_buf entries at 48 + i * 16
+    var headers     num_vars * 144 bytes
+    session info    fixed-size area holding the YAML document
+    var buffers     num_buf rotating buffers of buf_len bytes
+
+A Scenario script (see scenario.py) drives the cars, pit stops,
+driver swaps and session transitions tick by tick.
+"""
+import logging
+import mmap
+import random
+import struct
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from irsdk import VAR_TYPE_MAP
+
+from backend.services.irsdk.scenario import Scenario
+
+logger = logging.getLogger(__name__)
+
+HEADER_SIZE = 112
+VAR_HEADER_SIZE = 144
+VAR_BUF_OFFSET = 48
+VAR_BUF_SIZE = 16
+MAX_BUFS = 4
+
+HEADER = struct.Struct("<10i")
+VAR_BUF = struct.Struct("<3i")
+VAR_HEADER = struct.Struct("<3i?3x32s64s32s")
+
+# irsdk var types, indexes into VAR_TYPE_MAP.
+BOOL, INT, FLOAT, DOUBLE = 1, 2, 4, 5
+
+STATUS_CONNECTED = 1
+
+# Track surface values of CarIdxTrackSurface.
+NOT_IN_WORLD, IN_PIT_STALL, APPROACHING_PITS, ON_TRACK = -1, 1, 2, 3
+
+# Laps are considered started once the car crossed the line,
+# pit entry is this far before it.
+PIT_ENTRY_PCT = 0.95
+
+
+@dataclass(frozen=True)
+class VarSpec:
+    """One variable of the emulated var buffer."""
+
+    name: str
+    type: int
+    count: int = 1
+    unit: str = ""
+    desc: str = ""
+
+
+def var_specs(car_count: int = 64) -> tuple[VarSpec, ...]:
+    """Variables written by the emulator, CarIdx* arrays sized car_count."""
+    n = car_count
+    return (
+        VarSpec("SessionTime", DOUBLE, 1, "s", "Seconds since session start"),
+        VarSpec("SessionTick", INT, 1, "", "Current update number"),
+        VarSpec("SessionNum", INT, 1, "", "Session number"),
+        VarSpec("SessionState", INT, 1, "irsdk_SessionState", "Session state"),
+        VarSpec("SessionTimeRemain", DOUBLE, 1, "s", "Seconds left till session ends"),
+        VarSpec("SessionTimeTotal", DOUBLE, 1, "s", "Total number of seconds in session"),
+        VarSpec("PlayerCarIdx", INT, 1, "", "Players carIdx"),
+        VarSpec("IsOnTrack", BOOL, 1, "", "1=Car on track physics running"),
+        VarSpec("Speed", FLOAT, 1, "m/s", "GPS vehicle speed"),
+        VarSpec("Gear", INT, 1, "", "-1=reverse  0=neutral  1..n=current gear"),
+        VarSpec("RPM", FLOAT, 1, "revs/min", "Engine rpm"),
+        VarSpec("Throttle", FLOAT, 1, "%", "0=off throttle to 1=full throttle"),
+        VarSpec("Brake", FLOAT, 1, "%", "0=brake released to 1=max pedal force"),
+        VarSpec("BrakeABSactive", BOOL, 1, "", "true if abs is currently reducing brake force"),
+        VarSpec("CarLeftRight", INT, 1, "irsdk_CarLeftRight", "Notify if car is to the left or right"),
+        VarSpec("CarDistAhead", FLOAT, 1, "m", "Distance to car in front"),
+        VarSpec("CarDistBehind", FLOAT, 1, "m", "Distance to car behind"),
+        VarSpec("CarIdxLap", INT, n, "", "Laps started by car index"),
+        VarSpec("CarIdxLapCompleted", INT, n, "", "Laps completed by car index"),
+        VarSpec("CarIdxLapDistPct", FLOAT, n, "%", "Percentage distance around lap by car index"),
+        VarSpec("CarIdxTrackSurface", INT, n, "irsdk_TrkLoc", "Track surface type by car index"),
+        VarSpec("CarIdxOnPitRoad", BOOL, n, "", "On pit road between the cones by car index"),
+        VarSpec("CarIdxPosition", INT, n, "", "Cars position in race by car index"),
+        VarSpec("CarIdxClassPosition", INT, n, "", "Cars class position in race by car index"),
+        VarSpec("CarIdxClass", INT, n, "", "Cars class id by car index"),
+        VarSpec("CarIdxF2Time", FLOAT, n, "s", "Race time behind leader or fastest lap time otherwise"),
+        VarSpec("CarIdxEstTime", FLOAT, n, "s", "Estimated time to reach current location on track"),
+        VarSpec("CarIdxLastLapTime", FLOAT, n, "s", "Cars last lap time"),
+        VarSpec("CarIdxBestLapTime", FLOAT, n, "s", "Cars best lap time"),
+    )
+
+
+@dataclass
+class CarState:
+    """Mutable per-car state of the emulation."""
+
+    idx: int
+    class_id: int
+    class_short_name: str
+    class_color: int
+    class_est_lap_time: float
+    car_name: str
+    driver_name: str
+    lap_time: float
+    lap: int = 0
+    laps_completed: int = 0
+    pct: float = 0.0
+    lap_started_at: float = 0.0
+    last_lap: float = -1.0
+    best_lap: float = -1.0
+    pit_remaining: float = 0.0
+    # Lap whose pit stop was already taken.
+    pitted_lap: int = 0
+
+    @property
+    def on_pit_road(self) -> bool:
+        return self.pit_remaining > 0
+
+    @property
+    def progress(self) -> float:
+        return self.laps_completed + self.pct
+
+
+class SimEmulator:
+    """
+    Writes scenario-driven telemetry into an IRSDK memory-map file.
+
+    step() advances the simulation by one tick and publishes it into
+    the next rotating var buffer, exactly like the sim: data first,
+    then the buffer tick count. Session info is rewritten and its
+    SessionInfoUpdate counter bumped on session transitions, driver
+    swaps and result updates. pause() stops ticking (the connection
+    goes stale) without unmapping the file.
+    """
+
+    def __init__(
+        self,
+        scenario: Scenario,
+        path: str | Path,
+        *,
+        car_slots: int = 64,
+        num_buf: int = MAX_BUFS,
+        session_info_size: int = 512 * 1024,
+    ):
+        if scenario.car_count > car_slots:
+            raise ValueError(
+                f"Scenario has {scenario.car_count} cars, only {car_slots} slots"
+            )
+
+        self.scenario = scenario
+        self.path = Path(path)
+        self.car_slots = car_slots
+        self.num_buf = num_buf
+        self.session_info_size = session_info_size
+        self.specs = var_specs(car_slots)
+        self._struct = struct.Struct(
+            "<" + "".join(VAR_TYPE_MAP[s.type] * s.count for s in self.specs)
+        )
+
+        self.var_header_offset = HEADER_SIZE
+        self.session_info_offset = (
+            self.var_header_offset + VAR_HEADER_SIZE * len(self.specs)
+        )
+        buffers_offset = self.session_info_offset + session_info_size
+        # Var buffers are 16-byte aligned, as in the sim.
+        self.buf_len = -(-self._struct.size // 16) * 16
+        self.buffers_offset = -(-buffers_offset // 16) * 16
+        self.size = self.buffers_offset + self.buf_len * num_buf
+
+        self._random = random.Random(scenario.seed)
+        self._memory: mmap.mmap | None = None
+        self._file = None
+        self._thread: threading.Thread | None = None
+        self._stop_event = threading.Event()
+        self._paused = threading.Event()
+
+        self.tick = 0
+        self.session_num = 0
+        self.session_time = 0.0
+        self.session_info_update = 0
+        self._results_dirty_at: float | None = None
+        self._qualify_results: list[dict] = []
+        self._pit_laps = {(p.car_idx, p.lap): p.duration for p in scenario.pit_stops}
+        self._swaps = {(s.car_idx, s.lap): s.driver_name for s in scenario.driver_swaps}
+        self.cars = self._build_cars()
+
+    # --- Lifecycle ---
+
+    def open(self) -> None:
+        """Create the memory-map file and publish the first tick."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(self.path, "w+b")
+        self._file.truncate(self.size)
+        self._memory = mmap.mmap(self._file.fileno(), self.size)
+        self._write_var_headers()
+        self._write_header()
+        self._write_session_info()
+        self._publish()
+
+    def close(self) -> None:
+        self.stop()
+        if self._memory is not None:
+            self._memory.close()
+            self._memory = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "SimEmulator":
+        self.open()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def start(self, speed: float = 1.0) -> None:
+        """Tick in a daemon thread at tick_rate * speed."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, args=(speed,), name="sim-emulator", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(2.0)
+            self._thread = None
+
+    def pause(self) -> None:
+        """Stop publishing ticks, as a frozen or exiting sim would."""
+        self._paused.set()
+
+    def resume(self) -> None:
+        self._paused.clear()
+
+    def _run(self, speed: float) -> None:
+        interval = 1 / (self.scenario.tick_rate * speed)
+        next_at = time.perf_counter()
+        while not self._stop_event.is_set():
+            if not self._paused.is_set():
+                self.step()
+            next_at += interval
+            delay = next_at - time.perf_counter()
+            if delay > 0:
+                self._stop_event.wait(delay)
+            else:
+                # Fell behind, do not try to catch up with a burst.
+                next_at = time.perf_counter()
+
+    # --- Simulation ---
+
+    @property
+    def session(self):
+        return self.scenario.sessions[self.session_num]
+
+    def step(self, ticks: int = 1) -> None:
+        """Advance the simulation and publish ticks."""
+        for _ in range(ticks):
+            self._advance(1 / self.scenario.tick_rate)
+            self._publish()
+
+    def _build_cars(self) -> list[CarState]:
+        cars = []
+        idx = 1
+        for car_class in self.scenario.classes:
+            for _ in range(car_class.car_count):
+                cars.append(
+                    CarState(
+                        idx=idx,
+                        class_id=car_class.class_id,
+                        class_short_name=car_class.short_name,
+                        class_color=car_class.color,
+                        class_est_lap_time=car_class.est_lap_time,
+                        car_name=car_class.car_name,
+                        driver_name=f"Driver {idx}",
+                        lap_time=car_class.est_lap_time
+                        * self._random.uniform(0.985, 1.03),
+                    )
+                )
+                idx += 1
+        self._grid(cars)
+        return cars
+
+    @staticmethod
+    def _grid(cars: list[CarState]) -> None:
+        """Line cars up behind the start line in car index order."""
+        for position, car in enumerate(cars):
+            car.lap = 0
+            car.laps_completed = 0
+            car.pct = (1.0 - 0.002 * (position + 1)) % 1.0
+            car.lap_started_at = 0.0
+            car.last_lap = -1.0
+            car.best_lap = -1.0
+            car.pit_remaining = 0.0
+            car.pitted_lap = 0
+
+    def _advance(self, dt: float) -> None:
+        self.tick += 1
+        self.session_time += dt
+
+        if self.session_time >= self.session.duration or self._laps_done():
+            if self.session_num + 1 < len(self.scenario.sessions):
+                self._next_session()
+                return
+
+        for car in self.cars:
+            self._advance_car(car, dt)
+
+        if (
+            self._results_dirty_at is not None
+            and self.session_time - self._results_dirty_at >= 1.0
+        ):
+            self._results_dirty_at = None
+            self._write_session_info()
+
+    def _laps_done(self) -> bool:
+        laps = self.session.laps
+        if laps is None:
+            return False
+        return max(car.laps_completed for car in self.cars) >= laps
+
+    def _next_session(self) -> None:
+        if "Qualify" in self.session.type:
+            self._qualify_results = self._results()
+        self.session_num += 1
+        self.session_time = 0.0
+        self._grid(self.cars)
+        self._write_session_info()
+
+    def _advance_car(self, car: CarState, dt: float) -> None:
+        if car.on_pit_road:
+            car.pit_remaining = max(car.pit_remaining - dt, 0.0)
+            return
+
+        car.pct += dt / car.lap_time
+        if car.pct >= PIT_ENTRY_PCT and car.lap > 0 and self._pits_now(car):
+            return
+
+        if car.pct >= 1.0:
+            car.pct -= 1.0
+            car.lap += 1
+            if car.lap > 1:
+                car.laps_completed += 1
+                car.last_lap = self.session_time - car.lap_started_at
+                if car.best_lap < 0 or car.last_lap < car.best_lap:
+                    car.best_lap = car.last_lap
+                # Results in session info follow lap completions.
+                if self._results_dirty_at is None:
+                    self._results_dirty_at = self.session_time
+            car.lap_started_at = self.session_time
+
+    def _pits_now(self, car: CarState) -> bool:
+        """Start a pit stop if the script asks for one this lap."""
+        lap = car.laps_completed + 1
+        if car.pitted_lap == lap:
+            return False
+        duration = self._pit_laps.get((car.idx, lap))
+        pit_every = self.scenario.pit_every
+        if duration is None and pit_every and lap % pit_every == 0:
+            duration = 30.0
+        if duration is None:
+            return False
+
+        car.pitted_lap = lap
+        car.pit_remaining = duration
+
+        driver = self._swaps.get((car.idx, lap))
+        if driver is not None:
+            car.driver_name = driver
+            self._write_session_info()
+        return True
+
+    def _standings(self) -> list[CarState]:
+        if self.session.type == "Race":
+            return sorted(self.cars, key=lambda car: -car.progress)
+        return sorted(
+            self.cars,
+            key=lambda car: (car.best_lap < 0, car.best_lap, car.idx),
+        )
+
+    def _results(self) -> list[dict]:
+        results = []
+        class_positions: dict[int, int] = {}
+        for position, car in enumerate(self._standings(), start=1):
+            class_position = class_positions.get(car.class_id, 0) + 1
+            class_positions[car.class_id] = class_position
+            results.append(
+                {
+                    "Position": position,
+                    "ClassPosition": class_position - 1,
+                    "CarIdx": car.idx,
+                    "Lap": car.laps_completed,
+                    "FastestTime": round(car.best_lap, 4),
+                    "LastTime": round(car.last_lap, 4),
+                    "LapsComplete": car.laps_completed,
+                }
+            )
+        return results
+
+    # --- Memory layout ---
+
+    def _write_header(self) -> None:
+        HEADER.pack_into(
+            self._memory,
+            0,
+            2,
+            STATUS_CONNECTED,
+            self.scenario.tick_rate,
+            self.session_info_update,
+            self.session_info_size,
+            self.session_info_offset,
+            len(self.specs),
+            self.var_header_offset,
+            self.num_buf,
+            self.buf_len,
+        )
+        for i in range(self.num_buf):
+            VAR_BUF.pack_into(
+                self._memory,
+                VAR_BUF_OFFSET + i * VAR_BUF_SIZE,
+                0,
+                self.buffers_offset + i * self.buf_len,
+                0,
+            )
+
+    def _write_var_headers(self) -> None:
+        offset = 0
+        for i, spec in enumerate(self.specs):
+            VAR_HEADER.pack_into(
+                self._memory,
+                self.var_header_offset + i * VAR_HEADER_SIZE,
+                spec.type,
+                offset,
+                spec.count,
+                False,
+                spec.name.encode(),
+                spec.desc.encode(),
+                spec.unit.encode(),
+            )
+            offset += struct.calcsize("<" + VAR_TYPE_MAP[spec.type] * spec.count)
+
+    def _write_session_info(self) -> None:
+        data = self.session_info_yaml().encode("cp1252", "replace")
+        if len(data) >= self.session_info_size:
+            raise ValueError("Session info does not fit the session info area")
+        start = self.session_info_offset
+        self._memory[start: start + self.session_info_size] = data.ljust(
+            self.session_info_size, b"\x00"
+        )
+        self.session_info_update += 1
+        # SessionInfoUpdate is written last, readers re-parse on change.
+        struct.pack_into("<i", self._memory, 12, self.session_info_update)
+
+    def _publish(self) -> None:
+        index = self.tick % self.num_buf
+        entry = VAR_BUF_OFFSET + index * VAR_BUF_SIZE
+        struct.pack_into("<i", self._memory, entry + 8, self.tick)
+        self._struct.pack_into(
+            self._memory, self.buffers_offset + index * self.buf_len, *self._values()
+        )
+        struct.pack_into("<i", self._memory, entry, self.tick)
+
+    def _values(self) -> list:
+        n = self.car_slots
+        scenario = self.scenario
+        cars = self.cars
+        player = next(car for car in cars if car.idx == scenario.player_car_idx)
+        track_length = scenario.track_length_km * 1000
+
+        lap = [-1] * n
+        completed = [-1] * n
+        pct = [-1.0] * n
+        surface = [NOT_IN_WORLD] * n
+        pit_road = [False] * n
+        position = [0] * n
+        class_position = [0] * n
+        class_ids = [0] * n
+        f2 = [0.0] * n
+        est = [0.0] * n
+        last = [-1.0] * n
+        best = [-1.0] * n
+
+        standings = self._standings()
+        leader = standings[0]
+        class_counts: dict[int, int] = {}
+        for pos, car in enumerate(standings, start=1):
+            i = car.idx
+            class_counts[car.class_id] = class_counts.get(car.class_id, 0) + 1
+            lap[i] = car.lap
+            completed[i] = car.laps_completed
+            pct[i] = car.pct
+            surface[i] = IN_PIT_STALL if car.on_pit_road else ON_TRACK
+            pit_road[i] = car.on_pit_road
+            position[i] = pos
+            class_position[i] = class_counts[car.class_id]
+            class_ids[i] = car.class_id
+            f2[i] = (leader.progress - car.progress) * car.lap_time
+            est[i] = car.pct * car.class_est_lap_time
+            last[i] = car.last_lap
+            best[i] = car.best_lap
+
+        ahead, behind = self._gaps(player, track_length)
+        speed = 0.0 if player.on_pit_road else track_length / player.lap_time
+        values = [
+            self.session_time,
+            self.tick,
+            self.session_num,
+            4,
+            max(self.session.duration - self.session_time, 0.0),
+            self.session.duration,
+            scenario.player_car_idx,
+            True,
+            speed,
+            0 if player.on_pit_road else 4,
+            7000.0 if speed else 900.0,
+            1.0 if speed else 0.0,
+            0.0,
+            False,
+            1,
+            ahead,
+            behind,
+        ]
+        for array in (
+            lap, completed, pct, surface, pit_road, position,
+            class_position, class_ids, f2, est, last, best,
+        ):
+            values.extend(array)
+        return values
+
+    def _gaps(self, player: CarState, track_length: float) -> tuple[float, float]:
+        """Distance in meters to the nearest car ahead and behind."""
+        ahead = behind = track_length
+        for car in self.cars:
+            if car is player or car.on_pit_road:
+                continue
+            diff = (car.pct - player.pct) % 1.0
+            ahead = min(ahead, diff * track_length)
+            behind = min(behind, (1.0 - diff) * track_length)
+        return ahead, behind
+
+    # --- Session info ---
+
+    def session_info_yaml(self) -> str:
+        """Session info document in the sim's YAML dialect."""
+        scenario = self.scenario
+        lines = [
+            "---",
+            "WeekendInfo:",
+            f" TrackName: {scenario.track_name}",
+            f" TrackID: {scenario.track_id}",
+            f" TrackLength: {scenario.track_length_km:.2f} km",
+            f" TrackDisplayShortName: {scenario.track_display_short_name}",
+            f" SessionID: {1000 + scenario.seed}",
+            f" NumCarClasses: {len(scenario.classes)}",
+            "",
+            "SessionInfo:",
+            f" CurrentSessionNum: {self.session_num}",
+            " Sessions:",
+        ]
+        for num, session in enumerate(scenario.sessions):
+            laps = "unlimited" if session.laps is None else session.laps
+            lines += [
+                f" - SessionNum: {num}",
+                f"   SessionLaps: {laps}",
+                f"   SessionTime: {session.duration:.4f} sec",
+                f"   SessionType: {session.type}",
+                f"   SessionName: {session.type.upper()}",
+            ]
+            if num < self.session_num and "Qualify" in session.type:
+                results = self._qualify_results
+            elif num == self.session_num and self.tick > 0:
+                results = self._results()
+            else:
+                results = []
+            lines += self._results_yaml(results)
+
+        lines += [
+            "",
+            "DriverInfo:",
+            f" DriverCarIdx: {scenario.player_car_idx}",
+            " Drivers:",
+            " - CarIdx: 0",
+            "   UserName: Pace Car",
+            "   CarNumber: \"0\"",
+            "   CarClassID: 11",
+            "   CarClassShortName: ",
+            "   CarClassColor: 0xffffff",
+            "   CarClassEstLapTime: 0.0000",
+            "   CarIsPaceCar: 1",
+            "   IRating: 0",
+            "   LicString: R 0.00",
+        ]
+        for car in self.cars:
+            lines += [
+                f" - CarIdx: {car.idx}",
+                f"   UserName: {car.driver_name}",
+                f"   TeamName: Team {car.idx}",
+                f"   CarNumber: \"{car.idx}\"",
+                f"   CarScreenNameShort: {car.car_name}",
+                f"   CarClassID: {car.class_id}",
+                f"   CarClassShortName: {car.class_short_name}",
+                f"   CarClassColor: 0x{car.class_color:06x}",
+                f"   CarClassEstLapTime: {car.class_est_lap_time:.4f}",
+                "   CarIsPaceCar: 0",
+                f"   IRating: {1500 + (car.idx * 37) % 3000}",
+                "   LicString: A 4.99",
+            ]
+        lines += ["", "...", ""]
+        return "\n".join(lines)
+
+    @staticmethod
+    def _results_yaml(results: list[dict]) -> list[str]:
+        if not results:
+            return ["   ResultsPositions: "]
+        lines = ["   ResultsPositions:"]
+        for result in results:
+            items = list(result.items())
+            key, value = items[0]
+            lines.append(f"   - {key}: {value}")
+            lines += [f"     {key}: {value}" for key, value in items[1:]]
+        return lines
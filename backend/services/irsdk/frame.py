@@ -0,0 +1,97 @@
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Any, Mapping
+
+from backend.services.irsdk.reader import VarLayout
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, array views are unavailable without it.
+    np = None
+
+# NumPy dtypes matching irsdk.VAR_TYPE_MAP.
+NUMPY_DTYPES = ("S1", "?", "<i4", "<u4", "<f4", "<f8")
+
+
+@dataclass(frozen=True)
+class TelemetryFrame:
+    """
+    Immutable snapshot of the IRSDK fields captured at one sim tick.
+
+    Attributes:
+        tick_count (int):
+            Tick counter of the var buffer the frame was frozen from.
+            -1 for the empty frame published before the first capture.
+        session_time (float | None):
+            SessionTime value at that tick, in seconds.
+        session_info_update (int | None):
+            SessionInfoUpdate revision of the session info sections.
+        values (Mapping[str, Any]):
+            Read-only mapping of IRSDK field name to its value.
+            Array fields are stored as tuples.
+        buffer (bytes | None):
+            Frozen var buffer the values were unpacked from, if any.
+        layouts (Mapping[str, VarLayout]):
+            Position of each var-buffer field inside buffer.
+
+    Captured by IRSDKService once per tick and shared by every
+    BaseService implementation, so values read while building
+    a snapshot always come from the same tick.
+    """
+
+    tick_count: int
+    session_time: float | None
+    session_info_update: int | None = None
+    values: Mapping[str, Any] = field(
+        default_factory=lambda: MappingProxyType({})
+    )
+    buffer: bytes | None = field(default=None, repr=False, compare=False)
+    layouts: Mapping[str, VarLayout] = field(
+        default_factory=lambda: MappingProxyType({}),
+        repr=False,
+        compare=False,
+    )
+
+    def __post_init__(self):
+        if not isinstance(self.values, MappingProxyType):
+            object.__setattr__(
+                self, "values", MappingProxyType(dict(self.values))
+            )
+
+    def __contains__(self, name: str) -> bool:
+        return name in self.values
+
+    def get(self, name: str, default: Any = None) -> Any:
+        """Return a captured field value or default if missing."""
+        return self.values.get(name, default)
+
+    def array(self, name: str):
+        """
+        Return a field as a read-only NumPy array.
+
+        For fields unpacked from the frozen var buffer, the array is
+        a zero-copy view over that buffer. Other fields are converted
+        from their stored value. Returns None if NumPy is not
+        installed or the field is missing.
+        """
+        if np is None:
+            return None
+
+        layout = self.layouts.get(name)
+        if layout is not None and self.buffer is not None:
+            return np.frombuffer(
+                self.buffer,
+                dtype=NUMPY_DTYPES[layout.type],
+                count=layout.count,
+                offset=layout.offset,
+            )
+
+        value = self.values.get(name)
+        if value is None:
+            return None
+        array = np.array(value)
+        array.flags.writeable = False
+        return array
+
+
+EMPTY_FRAME = TelemetryFrame(tick_count=-1, session_time=None)
@@ -0,0 +1,72 @@
+import asyncio
+import threading
+
+from starlette.concurrency import run_in_threadpool
+
+
+def _wake(waiter: asyncio.Future) -> None:
+    if not waiter.done():
+        waiter.set_result(None)
+
+
+class FrameNotifier:
+    """
+    Lets coroutines wait for the next sim tick without holding a thread.
+
+    IRSDKService calls its frame listeners from the thread that
+    published the frame (the sampler, or a request capturing on
+    demand). The notifier hands each publication over to the waiting
+    event loops with call_soon_threadsafe, so a long poll is an
+    asyncio future instead of a blocked threadpool worker.
+    """
+
+    def __init__(self, irsdk_service):
+        self.irsdk = irsdk_service
+        self._waiters: set[asyncio.Future] = set()
+        self._lock = threading.Lock()
+        irsdk_service.add_frame_listener(self._on_frame)
+
+    def close(self) -> None:
+        self.irsdk.remove_frame_listener(self._on_frame)
+
+    async def wait_for_frame(
+        self, after_tick: int, timeout: float, poll_interval: float = 1 / 60
+    ) -> int:
+        """
+        Wait until the current tick differs from after_tick or the
+        timeout expires, and return the current tick.
+
+        Without the sampler nothing publishes frames in background,
+        so the sim is polled every poll_interval instead.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            waiter = loop.create_future()
+            with self._lock:
+                self._waiters.add(waiter)
+            try:
+                # Checked after registering, so a frame published in
+                # between still wakes the waiter.
+                tick = await run_in_threadpool(self.irsdk.current_tick)
+                remaining = deadline - loop.time()
+                if tick != after_tick or remaining <= 0:
+                    return tick
+                if not self.irsdk.sampling:
+                    remaining = min(remaining, poll_interval)
+                try:
+                    await asyncio.wait_for(waiter, remaining)
+                except asyncio.TimeoutError:
+                    pass
+            finally:
+                with self._lock:
+                    self._waiters.discard(waiter)
+
+    def _on_frame(self, _frame) -> None:
+        with self._lock:
+            waiters, self._waiters = self._waiters, set()
+        for waiter in waiters:
+            try:
+                waiter.get_loop().call_soon_threadsafe(_wake, waiter)
+            except RuntimeError:  # Event loop closed.
+                pass
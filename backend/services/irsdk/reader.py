@@ -0,0 +1,118 @@
+import struct
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping
+
+from irsdk import VAR_TYPE_MAP
+
+
+@dataclass(frozen=True)
+class VarLayout:
+    """
+    Position of one IRSDK variable inside a var buffer.
+
+    Attributes:
+        name (str):
+            IRSDK field name.
+        type (int):
+            IRSDK var type, index into irsdk.VAR_TYPE_MAP.
+        offset (int):
+            Byte offset of the variable from the start of the buffer.
+        count (int):
+            Number of elements, greater than 1 for CarIdx* arrays.
+    """
+
+    name: str
+    type: int
+    offset: int
+    count: int
+
+    @property
+    def fmt(self) -> str:
+        return VAR_TYPE_MAP[self.type] * self.count
+
+    @property
+    def size(self) -> int:
+        return struct.calcsize("<" + self.fmt)
+
+
+class FrameReader:
+    """
+    Compiled reader for a fixed subset of IRSDK fields.
+
+    Var header offsets and types are resolved once, then combined
+    into a single struct.Struct covering all fields (gaps between
+    them are skipped with pad bytes), so the whole subset is
+    unpacked from a var buffer in one call.
+    """
+
+    def __init__(self, layouts: Iterable[VarLayout]):
+        self.layouts: tuple[VarLayout, ...] = tuple(
+            sorted(layouts, key=lambda layout: layout.offset)
+        )
+        self.fields: frozenset[str] = frozenset(
+            layout.name for layout in self.layouts
+        )
+        self.layout_map: Mapping[str, VarLayout] = MappingProxyType(
+            {layout.name: layout for layout in self.layouts}
+        )
+
+        fmt = ["<"]
+        position = self.layouts[0].offset if self.layouts else 0
+        self._start = position
+        # (name, first item index, last item index, is_array)
+        self._items: list[tuple[str, int, int, bool]] = []
+        index = 0
+
+        for layout in self.layouts:
+            if layout.offset < position:
+                raise ValueError(f"Overlapping IRSDK variable: {layout.name}")
+            if layout.offset > position:
+                fmt.append(f"{layout.offset - position}x")
+            fmt.append(layout.fmt)
+            self._items.append(
+                (layout.name, index, index + layout.count, layout.count > 1)
+            )
+            index += layout.count
+            position = layout.offset + layout.size
+
+        self._struct = struct.Struct("".join(fmt))
+
+    @classmethod
+    def compile(
+        cls, var_headers: Mapping[str, Any], fields: Iterable[str]
+    ) -> "FrameReader":
+        """
+        Build a reader for fields present in var headers.
+        Fields missing from the headers (session info, unknown
+        names) are ignored and must be read separately.
+        """
+        return cls(
+            VarLayout(
+                name=name,
+                type=var_headers[name].type,
+                offset=var_headers[name].offset,
+                count=var_headers[name].count,
+            )
+            for name in fields
+            if name in var_headers
+        )
+
+    @property
+    def size(self) -> int:
+        """Number of bytes covered by the compiled struct."""
+        return self._struct.size
+
+    def unpack(self, buffer, buf_offset: int = 0) -> dict[str, Any]:
+        """
+        Unpack all compiled fields from a var buffer.
+        Array fields are returned as tuples.
+        """
+        if not self._items:
+            return {}
+
+        raw = self._struct.unpack_from(buffer, buf_offset + self._start)
+        return {
+            name: raw[start:stop] if is_array else raw[start]
+            for name, start, stop, is_array in self._items
+        }
@@ -0,0 +1,502 @@
+"""
+Compact recording of published telemetry frames.
+
+File layout (append-only, little endian):
+
+    magic           8 bytes, RECORDING_MAGIC
+    record*         4-byte kind, uint32 payload length, payload
+
+Record kinds:
+
+    INFO    int32 SessionInfoUpdate revision,
+            zlib-compressed session info YAML.
+    CHNK    uint32 header length, uint32 frame count,
+            int32 first tick, float64 first timeline time,
+            JSON header (channels, ticks, times, session times,
+            revisions), zlib-compressed columns.
+
+The timeline is SessionTime made monotonic: it equals SessionTime
+until the sim starts a new session, then keeps counting from where
+the previous session stopped. Seeking and paced replay use it.
+
+A chunk stores every channel (var-buffer field) as one column holding
+its raw bytes for each frame of the chunk. Each frame is XOR-delta
+encoded against the previous frame of the same column, so values that
+did not change compress to runs of zeros. The first frame of a chunk is
+stored as is, which makes every chunk a keyframe: it decodes without
+reading anything before it. The fixed-size chunk prefix lets
+RecordingFile build its seek index from record headers alone.
+"""
+import bisect
+import json
+import logging
+import mmap
+import queue
+import struct
+import threading
+import zlib
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, BinaryIO, Mapping
+
+from backend.services.irsdk.frame import TelemetryFrame
+from backend.services.irsdk.reader import VarLayout
+from backend.services.irsdk.replay import ReplayService
+
+logger = logging.getLogger(__name__)
+
+RECORDING_MAGIC = b"RWREC\x00\x01\x00"
+
+RECORD_HEADER = struct.Struct("<4sI")
+INFO_PREFIX = struct.Struct("<i")
+CHUNK_PREFIX = struct.Struct("<IIid")
+
+KIND_INFO = b"INFO"
+KIND_CHUNK = b"CHNK"
+
+
+def xor_bytes(a: bytes, b: bytes) -> bytes:
+    """XOR two byte strings of equal length."""
+    return (
+        int.from_bytes(a, "little") ^ int.from_bytes(b, "little")
+    ).to_bytes(len(a), "little")
+
+
+def encode_chunk(frames: list[TelemetryFrame], times: list[float]) -> bytes:
+    """
+    Encode frames sharing the same layouts into a CHNK payload.
+    times holds the timeline time of each frame.
+    """
+    layouts = sorted(frames[0].layouts.values(), key=lambda layout: layout.offset)
+    columns = []
+    for layout in layouts:
+        start, stop = layout.offset, layout.offset + layout.size
+        column = b"".join(frame.buffer[start:stop] for frame in frames)
+        # Each frame XOR the previous one, the first one against zeros.
+        previous = bytes(layout.size) + column[: -layout.size]
+        columns.append(xor_bytes(column, previous))
+
+    header = json.dumps(
+        {
+            "channels": [
+                [layout.name, layout.type, layout.count] for layout in layouts
+            ],
+            "ticks": [frame.tick_count for frame in frames],
+            "times": times,
+            "session_times": [frame.session_time for frame in frames],
+            "session_info_updates": [
+                frame.session_info_update for frame in frames
+            ],
+        },
+        separators=(",", ":"),
+    ).encode()
+
+    prefix = CHUNK_PREFIX.pack(
+        len(header), len(frames), frames[0].tick_count, times[0]
+    )
+    return prefix + header + zlib.compress(b"".join(columns), 6)
+
+
+@dataclass(frozen=True)
+class DecodedChunk:
+    """
+    Frames of one chunk, decoded into compact record buffers.
+
+    Attributes:
+        layouts (Mapping[str, VarLayout]):
+            Channel positions inside each record buffer.
+        records (tuple[bytes, ...]):
+            One buffer per frame with all channels packed back to back.
+        ticks (tuple[int, ...]):
+            Sim tick of each frame.
+        times (tuple[float, ...]):
+            Timeline time of each frame.
+        session_times (tuple[float | None, ...]):
+            SessionTime of each frame.
+        session_info_updates (tuple[int | None, ...]):
+            SessionInfoUpdate revision of each frame.
+    """
+
+    layouts: Mapping[str, VarLayout]
+    records: tuple[bytes, ...]
+    ticks: tuple[int, ...]
+    times: tuple[float, ...]
+    session_times: tuple[float | None, ...]
+    session_info_updates: tuple[int | None, ...]
+
+
+def decode_chunk(payload: bytes) -> DecodedChunk:
+    """Decode a CHNK payload written by encode_chunk()."""
+    header_len, count, _, _ = CHUNK_PREFIX.unpack_from(payload)
+    start = CHUNK_PREFIX.size
+    header = json.loads(payload[start: start + header_len])
+    body = zlib.decompress(payload[start + header_len:])
+
+    layouts = {}
+    columns = []
+    offset = 0
+    position = 0
+    for name, var_type, var_count in header["channels"]:
+        layout = VarLayout(name=name, type=var_type, offset=offset, count=var_count)
+        layouts[name] = layout
+        offset += layout.size
+
+        size = layout.size
+        column = []
+        previous = bytes(size)
+        for i in range(count):
+            delta = body[position + i * size: position + (i + 1) * size]
+            previous = xor_bytes(delta, previous)
+            column.append(previous)
+        columns.append(column)
+        position += size * count
+
+    records = tuple(
+        b"".join(column[i] for column in columns) for i in range(count)
+    )
+    return DecodedChunk(
+        layouts=layouts,
+        records=records,
+        ticks=tuple(header["ticks"]),
+        times=tuple(header["times"]),
+        session_times=tuple(header["session_times"]),
+        session_info_updates=tuple(header["session_info_updates"]),
+    )
+
+
+class SessionRecorder:
+    """
+    Appends every frame published by an IRSDKService to a recording.
+
+    Frames are buffered and handed over as one chunk every
+    chunk_frames frames (one second at 60 Hz), when the captured
+    field set changes, and on stop(). Session info is recorded once per
+    SessionInfoUpdate revision. The frame listener only buffers:
+    chunks are encoded, compressed and written by a writer thread, so
+    the sampler never waits for the disk. Records are only ever
+    appended, so a crash loses at most the chunks not written yet.
+    """
+
+    def __init__(self, irsdk_service, path: str | Path, chunk_frames: int = 60):
+        self.irsdk = irsdk_service
+        self.path = Path(path)
+        self.chunk_frames = chunk_frames
+        self._file: BinaryIO | None = None
+        self._pending: list[TelemetryFrame] = []
+        self._times: list[float] = []
+        self._revision: int | None = None
+        self._last_time = 0.0
+        self._time_offset = 0.0
+        # Records to write, None stops the writer.
+        self._queue: queue.SimpleQueue[tuple[bytes, Any] | None] = (
+            queue.SimpleQueue()
+        )
+        self._writer: threading.Thread | None = None
+        # on_frame() runs on the sampler thread, start/stop on another.
+        self._lock = threading.Lock()
+
+    @property
+    def is_recording(self) -> bool:
+        return self._file is not None
+
+    def start(self) -> None:
+        """Create the recording and subscribe to published frames."""
+        with self._lock:
+            if self._file is not None:
+                return
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            self._file = open(self.path, "wb")
+            self._file.write(RECORDING_MAGIC)
+            self._revision = None
+            self._last_time = 0.0
+            self._time_offset = 0.0
+            self._writer = threading.Thread(
+                target=self._write_loop,
+                args=(self._file,),
+                name="session-recorder",
+                daemon=True,
+            )
+            self._writer.start()
+        self.irsdk.add_frame_listener(self.on_frame)
+
+    def stop(self) -> None:
+        """Write buffered frames and close the recording."""
+        self.irsdk.remove_frame_listener(self.on_frame)
+        with self._lock:
+            if self._file is None:
+                return
+            self._flush()
+            self._queue.put(None)
+            writer, self._writer = self._writer, None
+            file, self._file = self._file, None
+        writer.join()
+        file.close()
+
+    def on_frame(self, frame: TelemetryFrame) -> None:
+        """Buffer one published frame."""
+        if frame.buffer is None or not frame.layouts:
+            return
+
+        with self._lock:
+            if self._file is None:
+                return
+            if frame.session_info_update != self._revision:
+                self._flush()
+                self._record_info(frame.session_info_update)
+            elif self._pending and self._pending[0].layouts != frame.layouts:
+                self._flush()
+
+            self._pending.append(frame)
+            self._times.append(self._timeline(frame))
+            if len(self._pending) >= self.chunk_frames:
+                self._flush()
+
+    def flush(self) -> None:
+        """Hand buffered frames to the writer as one chunk."""
+        with self._lock:
+            self._flush()
+
+    def _flush(self) -> None:
+        if not self._pending or self._file is None:
+            return
+        self._queue.put((KIND_CHUNK, (self._pending, self._times)))
+        self._pending = []
+        self._times = []
+
+    def _timeline(self, frame: TelemetryFrame) -> float:
+        """Timeline time of a frame, see the module docstring."""
+        if frame.session_time is None:
+            return self._last_time
+        time = frame.session_time + self._time_offset
+        if time < self._last_time:
+            # SessionTime restarted with a new session.
+            self._time_offset += self._last_time - time
+            time = self._last_time
+        self._last_time = time
+        return time
+
+    def _record_info(self, revision: int | None) -> None:
+        """
+        Queue the session info of the frame's revision. The document is
+        read now, while it is still the one of that revision: when the
+        sim moved on meanwhile, nothing is recorded under the old
+        revision, the next frame records the new one.
+        """
+        self._revision = revision
+        current, yaml_text = self.irsdk.get_session_info()
+        if current != revision:
+            logger.debug(
+                "Session info %s replaced by %s before recording", revision, current
+            )
+            return
+        self._queue.put((KIND_INFO, (revision, yaml_text)))
+
+    def _write_loop(self, file: BinaryIO) -> None:
+        """Encode and write queued records, on the writer thread."""
+        while (item := self._queue.get()) is not None:
+            kind, data = item
+            try:
+                if kind == KIND_CHUNK:
+                    payload = encode_chunk(*data)
+                else:
+                    revision, yaml_text = data
+                    payload = INFO_PREFIX.pack(
+                        revision if revision is not None else -1
+                    ) + zlib.compress(yaml_text.encode(), 6)
+                file.write(RECORD_HEADER.pack(kind, len(payload)) + payload)
+                file.flush()
+            except (OSError, ValueError) as e:
+                logger.error("Recording write failed: %s", e)
+
+
+@dataclass(frozen=True)
+class ChunkRef:
+    """Position of one chunk inside a recording file."""
+
+    offset: int
+    length: int
+    first_frame: int
+    count: int
+    first_tick: int
+    first_time: float
+
+
+class RecordingFile:
+    """
+    Read-only view over a recording written by SessionRecorder.
+
+    The file is memory-mapped. Opening it walks the record headers
+    (never the compressed payloads) to build the chunk index, after
+    which any frame index or session time is located with a binary
+    search and only the chunk holding it is decompressed.
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self._file = open(self.path, "rb")
+        try:
+            self._memory = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:  # Empty file.
+            self._file.close()
+            raise ValueError(f"Not a recording: {self.path}")
+
+        if self._memory[: len(RECORDING_MAGIC)] != RECORDING_MAGIC:
+            self.close()
+            raise ValueError(f"Not a recording: {self.path}")
+
+        self.chunks: list[ChunkRef] = []
+        self._info_offsets: dict[int, tuple[int, int]] = {}
+        self._scan()
+        self._chunk_starts = [chunk.first_frame for chunk in self.chunks]
+        self._chunk_times = [chunk.first_time for chunk in self.chunks]
+        self._cached: tuple[int, DecodedChunk] | None = None
+
+    @property
+    def frame_count(self) -> int:
+        if not self.chunks:
+            return 0
+        last = self.chunks[-1]
+        return last.first_frame + last.count
+
+    def close(self) -> None:
+        self._memory.close()
+        self._file.close()
+
+    def _scan(self) -> None:
+        position = len(RECORDING_MAGIC)
+        end = len(self._memory)
+        frames = 0
+
+        while position + RECORD_HEADER.size <= end:
+            kind, length = RECORD_HEADER.unpack_from(self._memory, position)
+            start = position + RECORD_HEADER.size
+            if start + length > end:
+                # Truncated last record of an interrupted recording.
+                logger.warning("Truncated record in %s", self.path)
+                break
+
+            if kind == KIND_CHUNK:
+                _, count, first_tick, first_time = CHUNK_PREFIX.unpack_from(
+                    self._memory, start
+                )
+                self.chunks.append(
+                    ChunkRef(start, length, frames, count, first_tick, first_time)
+                )
+                frames += count
+            elif kind == KIND_INFO:
+                (revision,) = INFO_PREFIX.unpack_from(self._memory, start)
+                self._info_offsets[revision] = (start, length)
+            position = start + length
+
+    def chunk(self, chunk_index: int) -> DecodedChunk:
+        """Decode one chunk, the last decoded chunk is kept."""
+        if self._cached is None or self._cached[0] != chunk_index:
+            ref = self.chunks[chunk_index]
+            payload = self._memory[ref.offset: ref.offset + ref.length]
+            self._cached = (chunk_index, decode_chunk(payload))
+        return self._cached[1]
+
+    def locate(self, index: int) -> tuple[DecodedChunk, int]:
+        """Return the chunk holding frame index and the frame position in it."""
+        chunk_index = bisect.bisect_right(self._chunk_starts, index) - 1
+        chunk = self.chunk(max(chunk_index, 0))
+        return chunk, index - self.chunks[max(chunk_index, 0)].first_frame
+
+    def index_at_time(self, time: float) -> int:
+        """Index of the last frame recorded at or before timeline time."""
+        if not self.chunks:
+            return 0
+        chunk_index = max(bisect.bisect_right(self._chunk_times, time) - 1, 0)
+        chunk = self.chunk(chunk_index)
+        position = max(bisect.bisect_right(chunk.times, time) - 1, 0)
+        return self.chunks[chunk_index].first_frame + position
+
+    def session_info_yaml(self, revision: int | None) -> str:
+        """Session info YAML recorded for a SessionInfoUpdate revision."""
+        key = revision if revision is not None else -1
+        if key not in self._info_offsets:
+            return ""
+        start, length = self._info_offsets[key]
+        data = self._memory[start + INFO_PREFIX.size: start + length]
+        return zlib.decompress(data).decode()
+
+
+class RecordingReplayService(ReplayService):
+    """
+    ReplayService reading a recording written by SessionRecorder.
+
+    Real-time and N times replays follow the recorded timeline, so
+    gaps in the recording (dropped frames, sampler stalls) are kept.
+    seek() jumps to any time of the timeline, which within the first
+    recorded session is the SessionTime itself.
+    """
+
+    def __init__(self, path: str | Path, **kwargs) -> None:
+        super().__init__(path, **kwargs)
+        self.recording: RecordingFile | None = None
+        self._layouts: Mapping[str, VarLayout] = {}
+
+    @property
+    def record_count(self) -> int:
+        return self.recording.frame_count if self.recording else 0
+
+    def _open(self) -> None:
+        self.recording = RecordingFile(self.path)
+
+    def _close(self) -> None:
+        if self.recording is not None:
+            self.recording.close()
+            self.recording = None
+        self._layouts = {}
+
+    def _is_open(self) -> bool:
+        return self.recording is not None
+
+    def seek(self, time: float) -> None:
+        """Move the replay to the frame recorded at timeline time."""
+        with self._lock:
+            if not self.is_connected():
+                return
+            self._seek(self.recording.index_at_time(time))
+            if self.speed is not None:
+                # Paced replays continue from the new position.
+                start = self.recording.chunks[0].first_time
+                self._started_at = self._clock() - (time - start) / self.speed
+
+    def _index_at(self, elapsed: float) -> int:
+        start = self.recording.chunks[0].first_time
+        return self.recording.index_at_time(start + elapsed)
+
+    def _seek(self, index: int) -> None:
+        super()._seek(index)
+        if self._is_open():
+            self._current()
+
+    def _current(self) -> tuple[DecodedChunk, int]:
+        chunk, position = self.recording.locate(self._index)
+        if chunk.layouts != self._layouts:
+            # Field set changed between chunks, recompile readers.
+            self._layouts = chunk.layouts
+            self._readers.clear()
+        return chunk, position
+
+    def _var_headers(self) -> Mapping[str, Any]:
+        return self._current()[0].layouts
+
+    def _record_memory(self) -> tuple[Any, int]:
+        chunk, position = self._current()
+        return chunk.records[position], 0
+
+    def _record_bytes(self) -> bytes:
+        chunk, position = self._current()
+        return chunk.records[position]
+
+    def _session_info_update(self) -> int | None:
+        chunk, position = self._current()
+        return chunk.session_info_updates[position]
+
+    def get_session_info_yaml(self) -> str:
+        with self._lock:
+            if not self.is_connected():
+                return ""
+            return self.recording.session_info_yaml(self._session_info_update())
@@ -0,0 +1,266 @@
+import logging
+import time
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+import irsdk
+
+from backend.services.irsdk.frame import TelemetryFrame
+from backend.services.irsdk.reader import FrameReader
+from backend.services.irsdk.service import IRSDKService
+from backend.services.irsdk.session_info import (
+    SESSION_INFO_SECTIONS,
+    decode_session_info,
+    parse_section,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class ReplayService(IRSDKService):
+    """
+    Base IRSDKService serving frames from recorded telemetry.
+
+    Records are replayed at real time (speed=1.0), at N times real
+    time (speed=N) or, with speed=None, as fast as the caller asks for
+    them: each step() (or wait_for_data() once the current record was
+    published) moves to the next record.
+
+    Subclasses implement the source hooks (_open, _close, _is_open,
+    record_count, _index_at, _record_memory, _record_bytes,
+    _session_info_update, get_session_info_yaml). Services built on
+    top (RadarService, Leaderboard, ...) use them exactly like the
+    live IRSDKService.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        *,
+        speed: float | None = 1.0,
+        loop: bool = False,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if speed is not None and speed <= 0:
+            raise ValueError("speed must be positive or None")
+
+        super().__init__()
+        self.path = Path(path)
+        self.speed = speed
+        self.loop = loop
+        self._clock = clock
+        # Index of the record served by the current frame.
+        self._index = -1
+        self._started_at = 0.0
+
+    # --- Source hooks ---
+
+    @property
+    def record_count(self) -> int:
+        """Number of records in the source."""
+        raise NotImplementedError
+
+    def _open(self) -> None:
+        raise NotImplementedError
+
+    def _close(self) -> None:
+        raise NotImplementedError
+
+    def _is_open(self) -> bool:
+        raise NotImplementedError
+
+    def _index_at(self, elapsed: float) -> int:
+        """Index of the record due elapsed seconds into the replay."""
+        raise NotImplementedError
+
+    def _record_memory(self) -> tuple[Any, int]:
+        """Buffer holding the current record and its offset in it."""
+        raise NotImplementedError
+
+    def _record_bytes(self) -> bytes:
+        """Immutable copy of the current record."""
+        raise NotImplementedError
+
+    def _session_info_update(self) -> int | None:
+        """SessionInfoUpdate revision of the current record."""
+        raise NotImplementedError
+
+    # --- Replay ---
+
+    @property
+    def position(self) -> int:
+        """Index of the record served by the current frame."""
+        return self._index
+
+    @property
+    def finished(self) -> bool:
+        """True once the last record was served (never when looping)."""
+        return not self.loop and self._index >= self.record_count - 1
+
+    def is_connected(self) -> bool:
+        return self._is_open() and self.record_count > 0
+
+    def _probe(self) -> bool:
+        """Open the source and rewind the replay."""
+        self._close()
+        try:
+            self._open()
+        except (OSError, ValueError) as e:
+            logger.warning("Cannot open replay source %s: %s", self.path, e)
+            self._close()
+            return False
+
+        self.started = True
+        self._reset_connection_cache()
+        self._index = 0
+        self._started_at = self._clock()
+        return self.is_connected()
+
+    def _release(self) -> None:
+        self._close()
+        self._reset_connection_cache()
+
+    def refresh_frame(self) -> bool:
+        """Publish the frame of the record due at the replay clock."""
+        if self.speed is not None:
+            with self._lock:
+                if self.is_connected():
+                    elapsed = self._clock() - self._started_at
+                    self._seek(self._index_at(elapsed * self.speed))
+        return super().refresh_frame()
+
+    def step(self) -> None:
+        """Move to the next record (as-fast-as-possible replay)."""
+        with self._lock:
+            if self.is_connected():
+                self._seek(self._index + 1)
+
+    def wait_for_data(self) -> bool:
+        """
+        Sleep until the next record is due.
+        Without pacing, steps to the next record once the current one
+        has been published.
+        """
+        if not self.is_connected():
+            return True
+        if self.speed is None:
+            if self._frame.tick_count == self._index:
+                self.step()
+            return True
+
+        # Wake up at least once per sim tick, the next record is due
+        # no earlier than that.
+        time.sleep(1 / (60 * self.speed))
+        return True
+
+    def _seek(self, index: int) -> None:
+        count = self.record_count
+        if index >= count:
+            index = index % count if self.loop else count - 1
+        self._index = max(index, 0)
+
+    def _latest_tick(self) -> int | None:
+        return self._index if self._is_open() else None
+
+    def _read_fields(
+        self, fields: Iterable[str], reader: FrameReader | None = None
+    ) -> dict[str, Any]:
+        reader = reader or self._get_reader(fields)
+        memory, offset = self._record_memory()
+        values = reader.unpack(memory, offset)
+
+        for field in fields:
+            if field not in reader.fields:
+                values[field] = self._read_field(field)
+        return values
+
+    def _capture_frame(self) -> TelemetryFrame:
+        """Copy the current record out of the source."""
+        reader = self._get_reader(self._fields)
+        buffer = self._record_bytes()
+        values = reader.unpack(buffer)
+        for field in self._fields - reader.fields:
+            values[field] = self._read_field(field)
+
+        return TelemetryFrame(
+            tick_count=self._index,
+            session_time=values.get("SessionTime"),
+            session_info_update=self._session_info_update(),
+            values=values,
+            buffer=buffer,
+            layouts=reader.layout_map,
+        )
+
+    def _read_field(self, field: str) -> Any | None:
+        if field in SESSION_INFO_SECTIONS:
+            return self._session_info.get(
+                field, self._session_info_update(), self._load_session_info
+            )
+
+        reader = self._get_reader((field,))
+        if field not in reader.fields:
+            return None
+        memory, offset = self._record_memory()
+        return reader.unpack(memory, offset)[field]
+
+    def _load_session_info(self, section: str) -> Any | None:
+        return parse_section(self.get_session_info_yaml(), section)
+
+
+class IBTReplayService(ReplayService):
+    """
+    ReplayService reading an iRacing .ibt telemetry file.
+
+    The file is memory-mapped by irsdk.IBT and records are only read
+    when a frame is captured, so long sessions are not loaded into
+    memory.
+    """
+
+    def __init__(self, path: str | Path, **kwargs) -> None:
+        super().__init__(path, **kwargs)
+        self.ir = irsdk.IBT()
+        self._session_info_yaml = ""
+
+    @property
+    def record_count(self) -> int:
+        disk_header = self.ir._disk_header
+        return disk_header.session_record_count if disk_header else 0
+
+    @property
+    def tick_rate(self) -> int:
+        """Records per second of sim time."""
+        header = self.ir._header
+        return header.tick_rate if header and header.tick_rate else 60
+
+    def _open(self) -> None:
+        self.ir.open(self.path)
+        header = self.ir._header
+        start = header.session_info_offset
+        raw = self.ir._shared_mem[start: start + header.session_info_len]
+        self._session_info_yaml = decode_session_info(raw)
+
+    def _close(self) -> None:
+        self.ir.close()
+        self._session_info_yaml = ""
+
+    def _is_open(self) -> bool:
+        return self.ir._header is not None
+
+    def _index_at(self, elapsed: float) -> int:
+        # Epsilon keeps exact multiples from rounding down.
+        return int(elapsed * self.tick_rate + 1e-9)
+
+    def _record_memory(self) -> tuple[Any, int]:
+        header = self.ir._header
+        offset = header.var_buf[0].buf_offset + self._index * header.buf_len
+        return self.ir._shared_mem, offset
+
+    def _record_bytes(self) -> bytes:
+        memory, offset = self._record_memory()
+        return memory[offset: offset + self.ir._header.buf_len]
+
+    def _session_info_update(self) -> int | None:
+        return self.ir._header.session_info_update
+
+    def get_session_info_yaml(self) -> str:
+        return self._session_info_yaml
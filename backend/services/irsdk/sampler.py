@@ -0,0 +1,90 @@
+import logging
+import threading
+
+logger = logging.getLogger(__name__)
+
+
+class TelemetrySampler:
+    """
+    Background thread publishing a new TelemetryFrame on every sim tick.
+
+    While the sampler runs, IRSDKService stops reading IRSDK on the
+    request path: API handlers only read the frame that was already
+    published, so request latency no longer depends on IRSDK read cost
+    and the sampling rate does not depend on how many overlays poll.
+    """
+
+    def __init__(
+        self,
+        irsdk_service,
+        poll_interval: float = 1 / 60,
+        idle_interval: float = 1.0,
+    ):
+        self.irsdk = irsdk_service
+        # Wait between tick checks when no new data was published.
+        self.poll_interval = poll_interval
+        # Wait between connection attempts while the sim is not running.
+        self.idle_interval = idle_interval
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start sampling in a daemon thread."""
+        if self.is_running:
+            return
+        self._stop_event.clear()
+        self.irsdk.sampling = True
+        self._thread = threading.Thread(
+            target=self._run, name="telemetry-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        """Stop the sampling thread and return to on-demand reads."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self.irsdk.sampling = False
+
+    def run_once(self) -> tuple[bool, bool]:
+        """
+        Run one sampling step.
+        Returns (connected, published).
+        """
+        connected, _ = self.irsdk.connect()
+        if not connected:
+            self.irsdk.refresh_frame()
+            return False, False
+
+        # Blocks until the sim signals new data on Windows,
+        # returns immediately for test files.
+        self.irsdk.wait_for_data()
+        return True, self.irsdk.refresh_frame()
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            try:
+                connected, published = self.run_once()
+            except Exception as e:
+                logger.error("Telemetry sampler failed: %s", e)
+                connected, published = False, False
+
+            if published:
+                continue
+            self._stop_event.wait(self._next_wait(connected))
+
+    def _next_wait(self, connected: bool) -> float:
+        """
+        Seconds to wait before the next step.
+        While disconnected, sleeps until the supervisor allows the
+        next probe, bounded by poll_interval and idle_interval.
+        """
+        if connected:
+            return self.poll_interval
+        retry_in = self.irsdk.connection.retry_in()
+        return min(max(retry_in, self.poll_interval), self.idle_interval)
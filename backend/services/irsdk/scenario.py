@@ -0,0 +1,180 @@
+import json
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+
+@dataclass(frozen=True)
+class CarClass:
+    """
+    Car class taking part in a scenario.
+
+    Attributes:
+        class_id (int):
+            iRacing CarClassID.
+        short_name (str):
+            CarClassShortName shown in the overlays.
+        color (int):
+            CarClassColor as 0xRRGGBB.
+        est_lap_time (float):
+            CarClassEstLapTime in seconds.
+        car_count (int):
+            Number of cars of this class on the grid.
+        car_name (str):
+            CarScreenNameShort of the cars.
+    """
+
+    class_id: int
+    short_name: str
+    color: int
+    est_lap_time: float
+    car_count: int
+    car_name: str = "car"
+
+
+@dataclass(frozen=True)
+class SessionSpec:
+    """
+    One session of the event, run in order.
+
+    Attributes:
+        type (str):
+            SessionType ("Practice", "Open Qualify", "Race").
+        duration (float):
+            Session length in seconds of sim time.
+        laps (int | None):
+            SessionLaps, None for "unlimited".
+    """
+
+    type: str
+    duration: float
+    laps: int | None = None
+
+
+@dataclass(frozen=True)
+class PitStop:
+    """A car entering pit road at the end of a lap."""
+
+    car_idx: int
+    lap: int
+    duration: float = 30.0
+
+
+@dataclass(frozen=True)
+class DriverSwap:
+    """A team car changing driver during a pit stop on a lap."""
+
+    car_idx: int
+    lap: int
+    driver_name: str
+
+
+@dataclass(frozen=True)
+class Scenario:
+    """
+    Script driving the sim emulator.
+
+    Car index 0 is the pace car, race cars follow class by class.
+    pit_every adds a pit stop for every car each pit_every laps on
+    top of the explicit pit_stops.
+    """
+
+    name: str
+    classes: tuple[CarClass, ...]
+    sessions: tuple[SessionSpec, ...]
+    track_name: str = "spa 2024 up"
+    track_display_short_name: str = "Spa"
+    track_id: int = 525
+    track_length_km: float = 7.0
+    player_car_idx: int = 1
+    tick_rate: int = 60
+    pit_every: int | None = None
+    pit_stops: tuple[PitStop, ...] = ()
+    driver_swaps: tuple[DriverSwap, ...] = ()
+    seed: int = 0
+
+    @property
+    def car_count(self) -> int:
+        """Number of cars including the pace car."""
+        return 1 + sum(car_class.car_count for car_class in self.classes)
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "Scenario":
+        data = dict(data)
+        data["classes"] = tuple(CarClass(**c) for c in data["classes"])
+        data["sessions"] = tuple(SessionSpec(**s) for s in data["sessions"])
+        data["pit_stops"] = tuple(PitStop(**p) for p in data.get("pit_stops", ()))
+        data["driver_swaps"] = tuple(
+            DriverSwap(**d) for d in data.get("driver_swaps", ())
+        )
+        return cls(**data)
+
+    def to_dict(self) -> dict[str, Any]:
+        return asdict(self)
+
+
+def load_scenario(path: str | Path) -> Scenario:
+    """Load a scenario script from a JSON file."""
+    with open(path, encoding="utf-8") as f:
+        return Scenario.from_dict(json.load(f))
+
+
+def multiclass_race(sessions: tuple[SessionSpec, ...] | None = None) -> Scenario:
+    """
+    64-car multiclass endurance race at full grid size.
+
+    Three classes, pit cycles every 8 laps, driver swaps in the
+    leading cars and a practice -> qualify -> race weekend.
+    """
+    return Scenario(
+        name="multiclass-race",
+        classes=(
+            CarClass(4029, "GTP", 0xFFDA59, 111.0, 15, "Porsche 963"),
+            CarClass(2523, "LMP2", 0x33CEFF, 118.0, 16, "Dallara P217"),
+            CarClass(4083, "GT3", 0xFF5888, 137.5, 32, "BMW M4 GT3"),
+        ),
+        sessions=sessions or (
+            SessionSpec("Practice", 300.0),
+            SessionSpec("Open Qualify", 300.0),
+            SessionSpec("Race", 6 * 3600.0, laps=None),
+        ),
+        pit_every=8,
+        driver_swaps=tuple(
+            DriverSwap(car_idx, 8, f"Second Driver {car_idx}")
+            for car_idx in range(1, 9)
+        ),
+    )
+
+
+def pit_cycle(car_count: int = 20) -> Scenario:
+    """Single-class sprint where the whole field pits on laps 2 and 4."""
+    return Scenario(
+        name="pit-cycle",
+        classes=(CarClass(74, "F4", 0xFFFFFF, 90.0, car_count, "Formula 4"),),
+        sessions=(SessionSpec("Race", 900.0, laps=8),),
+        pit_stops=tuple(
+            PitStop(car_idx, lap, 20.0)
+            for car_idx in range(1, car_count + 1)
+            for lap in (2, 4)
+        ),
+    )
+
+
+def session_transitions() -> Scenario:
+    """Short practice, qualify and race to exercise session changes."""
+    return Scenario(
+        name="session-transitions",
+        classes=(CarClass(74, "F4", 0xFFFFFF, 90.0, 10, "Formula 4"),),
+        sessions=(
+            SessionSpec("Practice", 60.0),
+            SessionSpec("Open Qualify", 60.0),
+            SessionSpec("Race", 600.0, laps=5),
+        ),
+    )
+
+
+SCENARIOS = {
+    "multiclass-race": multiclass_race,
+    "pit-cycle": pit_cycle,
+    "session-transitions": session_transitions,
+}
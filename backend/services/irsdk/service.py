@@ -1,66 +1,372 @@
+import logging
+import threading
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator, Mapping
+
 import irsdk
-from typing import Any
+
+from backend.services.irsdk.connection import ConnectionSupervisor
+from backend.services.irsdk.frame import EMPTY_FRAME, TelemetryFrame
+from backend.services.irsdk.reader import FrameReader
+from backend.services.irsdk.session_info import (
+    SESSION_INFO_SECTIONS,
+    SessionInfoCache,
+    decode_session_info,
+)
+
+logger = logging.getLogger(__name__)
+
+FrameListener = Callable[[TelemetryFrame], None]
+
+# Fields captured into every frame regardless of registered services.
+BASE_FIELDS: tuple[str, ...] = (
+    "SessionTime",
+    "IsOnTrack",
+)
 
 
 class IRSDKService():
-    """Low level service to interact with iRacing SDK."""
+    """
+    Low level service to interact with iRacing SDK.
+
+    Safe to share between request threads. Published frames are
+    immutable and swapped in with a single reference assignment, so
+    reading them needs no locking. Everything that touches pyirsdk
+    (reconnects, frame capture, live reads) is serialized by one
+    lock, so no thread can read the memory map while another one is
+    shutting it down.
+    """
 
-    def __init__(self) -> None:
+    def __init__(self, test_file: str | None = None) -> None:
         self.ir = irsdk.IRSDK()
+        # Memory-map file to read instead of the sim (e.g. SimEmulator).
+        self.test_file = test_file
         self.started = False
+        self._fields: set[str] = set(BASE_FIELDS)
+        self._frame: TelemetryFrame = EMPTY_FRAME
+        self._local = threading.local()
+        # Guards self.ir and the per-connection caches below.
+        self._lock = threading.RLock()
+        # Set by TelemetrySampler while it publishes frames in background.
+        self.sampling = False
+        self._status: tuple[bool, str] = (False, "not connected")
+        # Compiled readers keyed by field set, valid for one connection.
+        self._readers: dict[frozenset[str], FrameReader] = {}
+        self._session_info = SessionInfoCache()
+        self._frame_listeners: list[FrameListener] = []
+        self.connection = ConnectionSupervisor(
+            probe=self._probe,
+            release=self._release,
+            is_alive=self.is_connected,
+            latest_tick=self._latest_tick,
+        )
 
     def _ensure_connected(self) -> tuple[bool, str]:
-        """Ensure IRSDK connection is active."""
-        if not self.started:
-            self.ir.startup()
-            self.started = True
-        elif not self.ir.is_connected:
+        """
+        Ensure IRSDK connection is active.
+        While sampling, returns the status observed by the sampler.
+        """
+        if self.sampling:
+            return self._status
+        return self.connect()
+
+    def connect(self) -> tuple[bool, str]:
+        """
+        Advance the connection supervisor and return connection status.
+        Reconnect attempts are rate limited by the supervisor backoff.
+        """
+        with self._lock:
+            self.connection.poll()
+            if self.connection.is_connected:
+                self._status = (True, "")
+            else:
+                self._status = (False, "not connected")
+            return self._status
+
+    def _probe(self) -> bool:
+        """Open (or reopen) the IRSDK memory map."""
+        if self.started:
             self.ir.shutdown()
-            self.ir.startup()
+        self.ir.startup(test_file=self.test_file)
+        self.started = True
+        self._reset_connection_cache()
+        return self.is_connected()
+
+    def _release(self) -> None:
+        """Close the IRSDK memory map after the sim went away."""
+        self.ir.shutdown()
+        self._reset_connection_cache()
 
-        if not getattr(self.ir, "is_connected", False):
-            return False, "not connected"
-        if not getattr(self.ir, "is_initialized", True):
-            return False, "not initialized"
-        return True, ""
+    def _reset_connection_cache(self) -> None:
+        """Drop data that is only valid for the previous connection."""
+        self._readers.clear()
+        self._session_info.clear()
 
     def is_connected(self) -> bool:
         """Check if IRSDK is connected."""
-        return self.ir.is_initialized and self.ir.is_connected
+        return bool(self.ir.is_initialized and self.ir.is_connected)
+
+    def request_fields(self, fields: Iterable[str]) -> None:
+        """Register fields that must be captured into every frame."""
+        with self._lock:
+            new_fields = set(fields) - self._fields
+            if new_fields:
+                # Replaced rather than mutated, a capture in progress
+                # keeps iterating the previous set.
+                self._fields = self._fields | new_fields
+                # Force the next get_frame() to capture the new fields.
+                self._frame = EMPTY_FRAME
+
+    def add_frame_listener(self, listener: FrameListener) -> None:
+        """Register a callback called with every newly published frame."""
+        self._frame_listeners.append(listener)
+
+    def remove_frame_listener(self, listener: FrameListener) -> None:
+        if listener in self._frame_listeners:
+            self._frame_listeners.remove(listener)
+
+    def get_frame(self) -> TelemetryFrame:
+        """
+        Return the frame for the latest sim tick.
+
+        Returns the pinned frame when called inside pinned_frame().
+        While sampling, returns the frame last published by the
+        sampler, otherwise captures a new frame on demand if the
+        sim has ticked since the last capture.
+        """
+        pinned = getattr(self._local, "frame", None)
+        if pinned is not None:
+            return pinned
+        if not self.sampling:
+            self.refresh_frame()
+        return self._frame
+
+    def refresh_frame(self) -> bool:
+        """
+        Capture and publish a new frame if the sim has ticked.
+        Returns True if a new frame was published.
+        """
+        with self._lock:
+            if not self.is_connected():
+                self._frame = EMPTY_FRAME
+                return False
+
+            # Checked under the lock, so concurrent callers that saw
+            # the same new tick capture it only once.
+            tick = self._latest_tick()
+            if tick is not None and tick == self._frame.tick_count:
+                return False
+            self._frame = frame = self._capture_frame()
+
+        for listener in tuple(self._frame_listeners):
+            try:
+                listener(frame)
+            except Exception as e:
+                logger.error("Frame listener failed: %s", e)
+        return True
+
+    def current_tick(self) -> int:
+        """Tick of the current frame, -1 when no sim data is available."""
+        connected, _ = self._ensure_connected()
+        return self.get_frame().tick_count if connected else -1
+
+    def wait_for_data(self) -> bool:
+        """Wait for the sim's data-ready signal (no-op for test files)."""
+        return self.ir._wait_valid_data_event()
+
+    @contextmanager
+    def pinned_frame(self) -> Iterator[TelemetryFrame]:
+        """
+        Pin the current frame for the calling thread.
+
+        Every get_value() call made inside the block reads from the
+        same frame, which keeps a whole snapshot tick-consistent.
+        """
+        previous = getattr(self._local, "frame", None)
+        frame = self.get_frame()
+        self._local.frame = frame
+        try:
+            yield frame
+        finally:
+            self._local.frame = previous
 
     def get_value(self, field: str) -> Any | None:
-        """Get any IRSDK field value."""
-        if not self.is_connected():
+        """
+        Get any IRSDK field value.
+        Fields captured into the current frame are served from it,
+        other fields are read live unless the sampler is running.
+        """
+        frame = self.get_frame()
+        if field in frame:
+            return frame.get(field)
+        if self.sampling:
             return None
+        with self._lock:
+            if not self.is_connected():
+                return None
+            return self._read_field(field)
+
+    def _latest_tick(self) -> int | None:
+        """Return tick count of the most recently written var buffer."""
+        header = getattr(self.ir, "_header", None)
+        if header is None:
+            return None
+        # Header offset 40 (cur_buf_tick_count in pyirsdk) is padding
+        # in the sim, the var buffer tick counts are authoritative.
+        return max((buf.tick_count for buf in header.var_buf), default=None)
+
+    def get_values(self, fields: Iterable[str]) -> dict[str, Any]:
+        """
+        Get several IRSDK field values at once.
+        Fields missing from the current frame are unpacked together
+        from the latest var buffer with a compiled reader.
+        """
+        fields = tuple(fields)
+        frame = self.get_frame()
+        values = {field: frame.get(field) for field in fields if field in frame}
+
+        missing = [field for field in fields if field not in values]
+        if missing and not self.sampling:
+            with self._lock:
+                if self.is_connected():
+                    values.update(self._read_fields(missing))
+        return {field: values.get(field) for field in fields}
+
+    def _get_reader(self, fields: Iterable[str]) -> FrameReader:
+        """Return a reader compiled once per connection for fields."""
+        key = frozenset(fields)
+        reader = self._readers.get(key)
+        if reader is None:
+            reader = FrameReader.compile(self._var_headers(), key)
+            self._readers[key] = reader
+        return reader
+
+    def _var_headers(self) -> Mapping[str, Any]:
+        """Var headers of the current connection, keyed by field name."""
+        return self.ir._var_headers_dict
+
+    def get_session_info_yaml(self) -> str:
+        """
+        Return the session info YAML document of the sim, decoded as
+        pyirsdk does, see decode_session_info().
+        """
+        with self._lock:
+            if not self.is_connected():
+                return ""
+            header = self.ir._header
+            start = header.session_info_offset
+            raw = self.ir._shared_mem[start: start + header.session_info_len]
+        return decode_session_info(raw)
+
+    def get_session_info(self) -> tuple[int | None, str]:
+        """
+        Return the session info YAML document with the SessionInfoUpdate
+        revision it belongs to. The sim may rewrite the document at any
+        time, so it is read again when the revision moved meanwhile.
+        """
+        with self._lock:
+            for _ in range(3):
+                revision = self._session_info_update()
+                yaml_text = self.get_session_info_yaml()
+                if self._session_info_update() == revision:
+                    break
+        return revision, yaml_text
+
+    def _session_info_update(self) -> int | None:
+        """SessionInfoUpdate revision of the sim, None when not connected."""
+        if getattr(self.ir, "_header", None) is None:
+            return None
+        return self.ir.session_info_update
+
+    def get_array(self, field: str):
+        """
+        Get an array field (e.g. CarIdxLapDistPct) of the current frame
+        as a read-only NumPy view over the frozen var buffer.
+        Returns None if NumPy is not installed or the field is missing.
+        """
+        return self.get_frame().array(field)
+
+    def _read_fields(
+        self, fields: Iterable[str], reader: FrameReader | None = None
+    ) -> dict[str, Any]:
+        """
+        Read fields from the latest var buffer in a single unpack.
+        Fields without a var header (session info) are read one by one.
+        """
+        reader = reader or self._get_reader(fields)
+        var_buf = self.ir._var_buffer_latest
+        values = reader.unpack(var_buf.get_memory(), var_buf.buf_offset)
+
+        for field in fields:
+            if field not in reader.fields:
+                values[field] = self._read_field(field)
+        return values
+
+    def _capture_frame(self) -> TelemetryFrame:
+        """Freeze the latest var buffer and read all requested fields."""
+        self._freeze_latest()
+        try:
+            reader = self._get_reader(self._fields)
+            values = self._read_fields(self._fields, reader)
+            var_buf = self.ir._var_buffer_latest
+            memory = var_buf.get_memory()
+            tick = var_buf.tick_count
+        finally:
+            self.ir.unfreeze_var_buffer_latest()
+
+        return TelemetryFrame(
+            tick_count=tick,
+            session_time=values.get("SessionTime"),
+            session_info_update=self._session_info_update(),
+            values=values,
+            # The frozen buffer is an immutable copy, safe to share.
+            buffer=memory if isinstance(memory, bytes) else None,
+            layouts=reader.layout_map,
+        )
+
+    def _freeze_latest(self) -> None:
+        """
+        Freeze the var buffer of the newest tick, as
+        IRSDK.freeze_var_buffer_latest() does but without waiting for
+        the data-ready event again: the sampler already waited for
+        this tick, a second wait would skip the next one.
+        """
+        self.ir.unfreeze_var_buffer_latest()
+        latest = max(
+            self.ir._header.var_buf,
+            key=lambda buf: buf.tick_count,
+            default=None,
+        )
+        if latest is None:
+            return
+        latest.freeze()
+        # pyirsdk keeps the frozen buffer in a name-mangled attribute,
+        # as of the version pinned in requirements.txt; test_emulator
+        # checks that pyirsdk reads it back.
+        self.ir._IRSDK__var_buffer_latest = latest
+
+    def _read_field(self, field: str) -> Any | None:
+        """
+        Read a single field directly from IRSDK.
+        Session info sections are parsed once per SessionInfoUpdate
+        and shared as read-only structures.
+        """
+        if field in SESSION_INFO_SECTIONS:
+            return self._session_info.get(
+                field, self._session_info_update(), self._load_session_info
+            )
         try:
-            return self.ir[field]
+            value = self.ir[field]
         except KeyError:
             return None
+        return tuple(value) if isinstance(value, list) else value
 
-    @staticmethod
-    def get_car_rgb(
-        *,
-        idx: int,
-        drivers: list[dict],
-        player_idx: int | None,
-        multiclass: bool,
-    ) -> str:
-        """Return the car's color as RGB string."""
-        if idx >= len(drivers):
-            return "#1b2a3a"
-
-        if idx == player_idx:
-            return "#1e6cff"
-
-        rgb = drivers[idx].get("CarClassColor")
-
-        if not multiclass or rgb in (None, 0xFFFFFF):
-            return "#1b2a3a"
-
-        r = (rgb >> 16) & 0xFF
-        g = (rgb >> 8) & 0xFF
-        b = rgb & 0xFF
-        return f"rgb({r},{g},{b})"
+    def _load_session_info(self, section: str) -> Any | None:
+        """Parse one session info section (pyirsdk parses per section)."""
+        try:
+            return self.ir[section]
+        except KeyError:
+            return None
 
     def get_car_location(self) -> str:
         """Return 'track' if player is on track, 'garage' otherwise."""
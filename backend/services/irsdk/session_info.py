@@ -0,0 +1,131 @@
+import re
+from types import MappingProxyType
+from typing import Any, Callable
+
+import irsdk
+import yaml
+
+# Top-level sections of the session info YAML document.
+SESSION_INFO_SECTIONS = frozenset(
+    {
+        "WeekendInfo",
+        "SessionInfo",
+        "QualifyResultsInfo",
+        "CameraInfo",
+        "RadioInfo",
+        "DriverInfo",
+        "SplitTimeInfo",
+        "CarSetup",
+    }
+)
+
+# Start of documents the sim wrote in UTF-8 rather than cp1252.
+UTF8_SIGNATURE = "---\nWeekendInfo:\n Encoding: UTF8"
+
+# DriverInfo values pyirsdk quotes, free text such as driver names.
+DRIVER_TEXT_KEYS = "DriverSetupName|UserName|TeamName|AbbrevName|Initials"
+
+
+def freeze(value: Any) -> Any:
+    """
+    Recursively convert parsed YAML into read-only structures.
+    Dicts become MappingProxyType and lists become tuples.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({k: freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(v) for v in value)
+    return value
+
+
+def decode_session_info(raw: bytes) -> str:
+    """
+    Decode the session info memory as pyirsdk does: UTF-8 when the
+    document says so, cp1252 otherwise, without the characters YAML
+    does not allow.
+    """
+    # The document is NUL-terminated inside a much larger buffer,
+    # finding the terminator is far cheaper than rstrip().
+    end = raw.find(b"\x00")
+    if end >= 0:
+        raw = raw[:end]
+    is_utf8 = raw.startswith(UTF8_SIGNATURE.encode())
+    if not is_utf8:
+        raw = raw.translate(irsdk.YAML_TRANSLATER)
+    text = raw.decode("utf-8" if is_utf8 else "cp1252", errors="replace")
+    return irsdk.YamlReader.NON_PRINTABLE.sub("", text)
+
+
+def _quote_value(match: re.Match) -> str:
+    value = re.sub(r'(["\\])', r"\\\1", match.group("value"))
+    return f'{match.group("key")}"{value}"'
+
+
+def sanitize_section(text: str, section: str, is_utf8: bool) -> str:
+    """
+    Quote the values the sim writes unescaped, as pyirsdk does before
+    loading a section: driver and team names may contain ':', '#' or
+    quotes, and values may start with a comma.
+    """
+    if is_utf8:
+        text = re.sub(
+            r'(?P<key>^\s*\w+: )"(?P<value>.*)"$', _quote_value, text, flags=re.M
+        )
+    if section == "DriverInfo":
+        keys = "DriverSetupName" if is_utf8 else DRIVER_TEXT_KEYS
+        text = re.sub(rf"(?P<key>(?:{keys}): )(?P<value>.+)", _quote_value, text)
+    return re.sub(r"(?P<key>\w+: )(?P<value>,.*)", _quote_value, text)
+
+
+def parse_section(yaml_text: str, section: str) -> Any | None:
+    """
+    Parse a single top-level section of a session info YAML document.
+
+    Only the text of the requested section is handed to the YAML
+    loader, so large unrelated sections (DriverInfo, CarSetup) are
+    not parsed when they are not needed. The text is sanitized and
+    loaded the way pyirsdk does; None when it is still not valid YAML.
+    """
+    match = re.search(rf"^{section}:[ \t]*$", yaml_text, re.M)
+    if not match:
+        return None
+
+    # The section ends at the next top-level key or document end.
+    end = re.compile(r"^(?:[^\s#]|\.\.\.)", re.M).search(yaml_text, match.end() + 1)
+    text = yaml_text[match.start(): end.start() if end else len(yaml_text)]
+
+    text = sanitize_section(text, section, yaml_text.startswith(UTF8_SIGNATURE))
+    try:
+        data = yaml.load(text, Loader=irsdk.CustomYamlSafeLoader)
+    except yaml.YAMLError:
+        return None
+    return data.get(section) if isinstance(data, dict) else None
+
+
+class SessionInfoCache:
+    """
+    Parsed session info sections for one SessionInfoUpdate revision.
+
+    Sections are parsed on first request and shared as read-only
+    structures until the sim bumps its SessionInfoUpdate counter.
+    """
+
+    def __init__(self):
+        self.revision: int | None = None
+        self._sections: dict[str, Any] = {}
+
+    def get(
+        self, section: str, revision: int, load: Callable[[str], Any]
+    ) -> Any:
+        """Return a frozen section, loading it once per revision."""
+        if revision != self.revision:
+            self.clear()
+            self.revision = revision
+
+        if section not in self._sections:
+            self._sections[section] = freeze(load(section))
+        return self._sections[section]
+
+    def clear(self) -> None:
+        self.revision = None
+        self._sections = {}
@@ -4,6 +4,7 @@ from typing import Any
 from backend.services.leaderboard.car_sorter import CarSorter
 from backend.services.base import BaseCarBuilder
 from backend.services.leaderboard.context import LeaderboardContext
+from backend.services.leaderboard.grid import GridIndex
 from backend.services.leaderboard.lap_times.formatter import TimeFormatter
 from backend.services.leaderboard.lap_times.service import LapTimeService
 
@@ -16,12 +17,21 @@ class CarDataBuilder(BaseCarBuilder):
         self.lap_times = lap_times
         self._last_pit_laps: dict[int, int] = {}
         self._pit_exit_times: dict[int, float] = {}
+        # Grid of the SessionInfo it was built from, see grid_index().
+        self._grid = GridIndex()
+        self._grid_source: Any = None
 
     def reset_pit_data(self):
         """Reset pit tracking when session changes."""
         self._last_pit_laps.clear()
         self._pit_exit_times.clear()
 
+    def forget_pit_data(self, car_indices) -> None:
+        """Drop the pit tracking of cars that joined or left."""
+        for idx in car_indices:
+            self._last_pit_laps.pop(idx, None)
+            self._pit_exit_times.pop(idx, None)
+
     def build(
         self, idx: int, ctx: LeaderboardContext
     ) -> dict[str, Any] | None:
@@ -30,17 +40,16 @@ class CarDataBuilder(BaseCarBuilder):
         if not base_car:
             return None
 
-        driver: dict[str, Any] = ctx.drivers[idx]
-        class_id: int = driver.get("CarClassID")
+        driver = ctx.driver_table.get(idx)
         last_lap_seconds: float = ctx.last_lap_times[idx]
 
         return {
             **base_car,
             "pos": self._resolve_position(idx, ctx),
-            "name": self._get_first_name(driver),
-            "irating": driver.get("IRating"),
-            "license": driver.get("LicString"),
-            "car_class_color": driver.get("CarClassColor"),
+            "name": driver.first_name,
+            "irating": driver.irating,
+            "license": driver.license,
+            "car_class_color": driver.class_color,
             "lap_dist_pct": self._format_lap_dist(idx, ctx),
             "last_pit_lap": self._get_last_pit_lap(idx, ctx.laps_started, ctx.is_pitroad),
             "laps_started": ctx.laps_started[idx],
@@ -48,24 +57,39 @@ class CarDataBuilder(BaseCarBuilder):
             "last_lap_seconds": last_lap_seconds,
             "best_lap_seconds": ctx.best_lap_times[idx],
             "session_fastest_lap_seconds": ctx.session_fastest_lap,
-            "class_fastest_lap_seconds": ctx.class_fastest_laps.get(class_id),
+            "class_fastest_lap_seconds": ctx.class_fastest_laps.get(
+                driver.class_id
+            ),
+        }
+
+    def build_table(self, ctx: LeaderboardContext) -> dict[int, dict[str, Any]]:
+        """
+        Build every car once, keyed by car index. Pace cars are left out.
+        Advances the pit state of every car, so build one table per tick.
+        """
+        return {
+            idx: car
+            for idx in ctx.driver_table.car_indices
+            if (car := self.build(idx, ctx))
         }
 
     def build_all(
-        self, ctx: LeaderboardContext, exclude_idx: int | None = None
+        self,
+        ctx: LeaderboardContext,
+        exclude_idx: int | None = None,
+        table: dict[int, dict[str, Any]] | None = None,
     ) -> list[dict[str, Any]]:
-        """Return all cars for snapshot, optionally excluding a player."""
+        """
+        Return all cars for snapshot, optionally excluding a player,
+        taken from a table of build_table() when given.
+        """
+        if table is None:
+            table = self.build_table(ctx)
         cars: list[dict[str, Any]] = [
-            car
-            for idx in range(len(ctx.drivers))
-            if idx != exclude_idx and (car := self.build(idx, ctx))
+            car for idx, car in table.items() if idx != exclude_idx
         ]
         return CarSorter.sort(cars)
 
-    def _get_first_name(self, driver: dict) -> str:
-        names = driver.get("UserName", "").strip().split()
-        return names[0] if names else ""
-
     def _format_lap_dist(self, idx: int, ctx: LeaderboardContext) -> float:
         dist: float = ctx.lap_dist_pct[idx]
         return round(dist, 3) if isinstance(dist, float) and dist >= 0 else None
@@ -82,34 +106,20 @@ class CarDataBuilder(BaseCarBuilder):
         if pos == -1:
             return None
         if pos == 0:
-            return self._get_starting_position(
-                idx,
-                "ClassPosition" if ctx.multiclass else "Position",
-                1 if ctx.multiclass else 0,
-            )
+            return self.grid_index().starting_position(idx, ctx.multiclass)
         return pos
 
-    def _get_starting_position(
-        self, car_idx: int, field: str, offset: int
-    ) -> int:
+    def grid_index(self) -> GridIndex:
         """
-        Get the car's starting position from
-        session results, adding an offset.
-        Returns 0 if not found.
+        Return the starting grid of the current SessionInfo. Session
+        info sections are shared per SessionInfoUpdate revision, so
+        the index is rebuilt only when the revision changes.
         """
         session_info: dict[str, Any] = self.irsdk.get_value("SessionInfo") or {}
-        sessions: list[dict[str, Any]] = session_info.get("Sessions", [])
-
-        for sess in sessions:
-            if sess.get("SessionType") in (
-                "Warmup",
-                "Lone Qualify",
-                "Open Qualify",
-            ):
-                for res in sess.get("ResultsPositions") or []:
-                    if res.get("CarIdx") == car_idx:
-                        return int(res.get(field, 0)) + offset
-        return 0
+        if session_info is not self._grid_source:
+            self._grid = GridIndex.from_session_info(session_info)
+            self._grid_source = session_info
+        return self._grid
 
     def _get_last_pit_lap(
         self, idx: int, laps_started: list[int], is_pitroad: list[bool]
@@ -0,0 +1,126 @@
+from typing import Any
+
+from backend.services.leaderboard.car_data_builder import CarDataBuilder
+from backend.services.leaderboard.car_sorter import CarSorter
+from backend.services.leaderboard.context import LeaderboardContext
+
+
+class CarTable:
+    """
+    Leaderboard car rows kept from one tick to the next.
+
+    Between two ticks most fields of a car do not change: only
+    lap_dist_pct moves, the rest changes once per lap or per session.
+    update() compares the raw inputs of each car with those of its
+    row (position, laps, pit road, lap times, fastest laps and the
+    DriverRecord object of the context's DriverTable) and builds the
+    row with CarDataBuilder.build() only when one of them changed. A
+    car that only moved gets a copy of its row with the new
+    lap_dist_pct, and a car that did not move keeps the very same row
+    dict, so unchanged rows are cheap to diff (see
+    backend.services.push.delta). Rows are never modified in place,
+    a snapshot holding a row stays valid. Cars are re-sorted with
+    CarSorter only when a position changed.
+
+    After update(), dirty holds the indices of the cars whose row
+    changed or appeared and removed those of cars that left.
+    """
+
+    def __init__(self, builder: CarDataBuilder):
+        self.builder = builder
+        self.rows: dict[int, dict[str, Any]] = {}
+        # Car indices in leaderboard order.
+        self.order: list[int] = []
+        self.dirty: frozenset[int] = frozenset()
+        self.removed: frozenset[int] = frozenset()
+        # Raw inputs each row was built from, by car index.
+        self._inputs: dict[int, tuple] = {}
+        # Starting grid the rows were built with, see update().
+        self._grid: Any = None
+
+    def reset(self) -> None:
+        """Forget every row, the next update() rebuilds all of them."""
+        self.rows = {}
+        self.order = []
+        self.dirty = frozenset()
+        self.removed = frozenset()
+        self._inputs = {}
+        self._grid = None
+
+    def update(self, ctx: LeaderboardContext) -> dict[int, dict[str, Any]]:
+        """
+        Bring the rows to the context's tick and return them by car index.
+        Advances the pit state of the cars it builds, so update once per
+        tick.
+        """
+        # Zero positions fall back to the grid of the current
+        # SessionInfo, a new grid may move any of those cars.
+        grid = self.builder.grid_index()
+        if grid is not self._grid:
+            self._inputs = {}
+            self._grid = grid
+
+        pos_list = ctx.class_positions if ctx.multiclass else ctx.positions
+        rows: dict[int, dict[str, Any]] = {}
+        inputs: dict[int, tuple] = {}
+        dirty = set()
+        resort = False
+        for driver in ctx.driver_table:
+            idx = driver.car_idx
+            if driver.is_pace_car:
+                continue
+            previous = self.rows.get(idx)
+            car_inputs = (
+                driver,
+                pos_list[idx],
+                ctx.laps_started[idx],
+                ctx.is_pitroad[idx],
+                ctx.last_lap_times[idx],
+                ctx.best_lap_times[idx],
+                ctx.session_fastest_lap,
+                ctx.class_fastest_laps.get(driver.class_id),
+            )
+            if car_inputs == self._inputs.get(idx) and not self._pit_pending(
+                previous
+            ):
+                row = previous
+                lap_dist = self.builder._format_lap_dist(idx, ctx)
+                if lap_dist != previous["lap_dist_pct"]:
+                    row = {**previous, "lap_dist_pct": lap_dist}
+            else:
+                row = self.builder.build(idx, ctx)
+                if row is None:
+                    continue
+                if row == previous:
+                    row = previous
+                elif previous is None or row["pos"] != previous["pos"]:
+                    resort = True
+            if row is not previous:
+                dirty.add(idx)
+            rows[idx] = row
+            inputs[idx] = car_inputs
+
+        removed = self.rows.keys() - rows.keys()
+        if resort or removed:
+            self.order = [
+                row["car_idx"] for row in CarSorter.sort(list(rows.values()))
+            ]
+        self.rows = rows
+        self._inputs = inputs
+        self.dirty = frozenset(dirty)
+        self.removed = frozenset(removed)
+        return rows
+
+    def sorted_rows(
+        self, exclude_idx: int | None = None
+    ) -> list[dict[str, Any]]:
+        """Rows in leaderboard order, optionally without one car."""
+        return [self.rows[idx] for idx in self.order if idx != exclude_idx]
+
+    @staticmethod
+    def _pit_pending(row: dict[str, Any] | None) -> bool:
+        """
+        Whether the row shows a pit exit, which turns into the plain
+        pit lap a few seconds later without any input changing.
+        """
+        return row is not None and (row["last_pit_lap"] or "").startswith("OUT")
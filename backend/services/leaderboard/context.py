@@ -1,4 +1,5 @@
 from dataclasses import dataclass, field
+from typing import ClassVar
 
 from backend.services.base import SessionStateContext
 
@@ -19,11 +20,17 @@ class LeaderboardContext(SessionStateContext):
             Cached fastest valid best lap across the whole session.
         class_fastest_laps (dict[int | None, float | None]):
             Cached fastest valid best lap by car class ID.
-            
+
     Used by NeighborsService, CarDataBuilder and Leaderboard to construct
     and sort leaderboard telemetry data.
     """
 
+    CAR_ARRAYS: ClassVar[tuple[str, ...]] = SessionStateContext.CAR_ARRAYS + (
+        "last_lap_times",
+        "best_lap_times",
+        "laps_started",
+    )
+
     last_lap_times: list[float]
     best_lap_times: list[float]
     laps_started: list[int]
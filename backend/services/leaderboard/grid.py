@@ -0,0 +1,49 @@
+from typing import Any, Mapping
+
+# Sessions whose results set the starting grid, in session order.
+GRID_SESSION_TYPES = ("Warmup", "Lone Qualify", "Open Qualify")
+
+
+class GridIndex:
+    """
+    Starting grid by car index, from the results of the qualifying
+    sessions in SessionInfo.
+
+    A car takes its position from the first grid session listing it.
+    Built once per SessionInfo revision, a lookup is then a single
+    dict access instead of a walk over every session result.
+    """
+
+    def __init__(
+        self,
+        positions: dict[int, int] | None = None,
+        class_positions: dict[int, int] | None = None,
+    ):
+        self.positions = positions or {}
+        self.class_positions = class_positions or {}
+
+    @classmethod
+    def from_session_info(cls, session_info: Mapping[str, Any]) -> "GridIndex":
+        positions: dict[int, int] = {}
+        class_positions: dict[int, int] = {}
+        for session in session_info.get("Sessions") or []:
+            if session.get("SessionType") not in GRID_SESSION_TYPES:
+                continue
+            for result in session.get("ResultsPositions") or []:
+                car_idx = result.get("CarIdx")
+                if car_idx in positions:
+                    continue
+                positions[car_idx] = int(result.get("Position", 0))
+                class_positions[car_idx] = int(result.get("ClassPosition", 0))
+        return cls(positions, class_positions)
+
+    def starting_position(self, car_idx: int, multiclass: bool) -> int:
+        """
+        Grid position of a car, within its class when multiclass.
+        Class positions are zero-based in the results, so they are
+        shifted by one. Returns 0 for a car not on the grid.
+        """
+        if multiclass:
+            position = self.class_positions.get(car_idx)
+            return 0 if position is None else position + 1
+        return self.positions.get(car_idx, 0)
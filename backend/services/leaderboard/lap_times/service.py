@@ -31,9 +31,10 @@ class LapTimeService:
     ) -> float | None:
         """Return the fastest valid best lap for a specific car class."""
         class_laps = (
-            ctx.best_lap_times[idx]
-            for idx, driver in enumerate(ctx.drivers)
-            if idx < len(ctx.best_lap_times) and driver.get("CarClassID") == class_id
+            ctx.best_lap_times[driver.car_idx]
+            for driver in ctx.driver_table
+            if driver.car_idx < len(ctx.best_lap_times)
+            and driver.class_id == class_id
         )
         return self.fastest_lap(class_laps)
 
@@ -55,10 +56,11 @@ class LapTimeService:
         ctx: LeaderboardContext,
     ) -> float | None:
         """Return a driver's valid car-class estimated lap time."""
-        if player_idx >= len(ctx.drivers):
+        driver = ctx.driver_table.get(player_idx)
+        if driver is None:
             return None
 
-        estimated_lap = ctx.drivers[player_idx].get("CarClassEstLapTime")
+        estimated_lap = driver.class_est_lap_time
         return estimated_lap if self.is_valid_lap_time(estimated_lap) else None
 
     def car_lap_time(
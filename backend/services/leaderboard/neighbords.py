@@ -10,11 +10,12 @@ class NeighborsService:
     def __init__(self, builder):
         self.builder = builder
 
-    def get_neighbors(self, player_idx, ctx) -> dict:
+    def get_neighbors(self, player_idx, ctx, table=None) -> dict:
         """
-        Return neighboring cars ahead and behind the player.
+        Return neighboring cars ahead and behind the player,
+        taken from a CarDataBuilder.build_table() table when given.
         """
-        ahead, behind = self._collect_candidates(player_idx, ctx)
+        ahead, behind = self._collect_candidates(player_idx, ctx, table)
         ahead, behind = self._sort_candidates(ahead, behind)
         return self._format_neighbors(ahead, behind)
 
@@ -32,13 +33,16 @@ class NeighborsService:
         return {"gap_pct": gap_pct, "gap_sec": gap_sec}
 
     def _collect_candidates(
-        self, player_idx: int, ctx: LeaderboardContext
+        self,
+        player_idx: int,
+        ctx: LeaderboardContext,
+        table: dict[int, dict] | None = None,
     ) -> tuple[list[dict], list[dict]]:
         """Collect all potential neighboring cars around the player."""
         my_dist: float = ctx.lap_dist_pct[player_idx]
-        my_est_lap_time: float = (
-            ctx.drivers[player_idx]
-            .get("CarClassEstLapTime")
+        player = ctx.driver_table.get(player_idx)
+        my_est_lap_time: float | None = (
+            player.class_est_lap_time if player else None
         )
 
         ahead, behind = [], []
@@ -46,11 +50,16 @@ class NeighborsService:
         for idx, dist in enumerate(ctx.lap_dist_pct):
             if idx == player_idx:
                 continue
-            if idx >= len(ctx.drivers):
+            if idx not in ctx.driver_table:
                 continue
-            car_data = self.builder.build(idx, ctx)
+            if table is not None:
+                car_data = table.get(idx)
+            else:
+                car_data = self.builder.build(idx, ctx)
             if not car_data:
                 continue
+            # Table cars are shared with other sections.
+            car_data = dict(car_data)
 
             gap = self._calc_gap(my_dist, dist, my_est_lap_time)
             if not gap:
@@ -1,35 +1,90 @@
 from typing import Any, Literal
 
 from backend.services.base import BaseService
+from backend.services.drivers import DriverTable
 from backend.services.leaderboard.car_data_builder import CarDataBuilder
+from backend.services.leaderboard.car_table import CarTable
 from backend.services.leaderboard.context import LeaderboardContext
 from backend.services.leaderboard.lap_times.formatter import TimeFormatter
 from backend.services.leaderboard.lap_times.service import LapTimeService
 from backend.services.leaderboard.neighbords import NeighborsService
+from backend.services.leaderboard.standings import compute_standings
 
 
 class Leaderboard(BaseService):
     """Main service for building leaderboard telemetry data."""
 
+    SECTIONS = ("cars", "player", "neighbors", "leaderboard_data")
+
+    FIELDS = (
+        "DriverInfo",
+        "SessionInfo",
+        "PlayerCarIdx",
+        "SessionTime",
+        "SessionTimeTotal",
+        "CarIdxPosition",
+        "CarIdxClassPosition",
+        "CarIdxLastLapTime",
+        "CarIdxBestLapTime",
+        "CarIdxLap",
+        "CarIdxLapDistPct",
+        "CarIdxOnPitRoad",
+    )
+
     def __init__(self, irsdk_service):
         self.lap_times = LapTimeService()
         builder = CarDataBuilder(irsdk_service, self.lap_times)
         super().__init__(irsdk_service, builder)
         self.neighbors = NeighborsService(builder)
+        self.driver_table = DriverTable()
         self._last_session_num: int | None = None
+        # Car rows updated once per tick, shared by all sections and
+        # section projections of that tick.
+        self.car_table = CarTable(builder)
+        self._table_tick: int | None = None
 
-    def _build_snapshot(self, ctx: LeaderboardContext) -> dict[str, Any]:
+    def _build_snapshot(
+        self, ctx: LeaderboardContext, sections: frozenset[str] | None = None
+    ) -> dict[str, Any]:
         player_idx: int = self.irsdk.get_value("PlayerCarIdx")
+        self._reset_pit_status(self.irsdk.get_value("SessionInfo") or {})
+
+        def table() -> dict[int, dict[str, Any]]:
+            return self._car_table(ctx)
 
         return {
             "status": "ok",
-            "cars": self.builder.build_all(ctx, exclude_idx=player_idx),
-            "player": self.builder.build(player_idx, ctx),
-            "neighbors": self.neighbors.get_neighbors(player_idx, ctx),
-            "leaderboard_data": self.get_session_info(player_idx, ctx),
+            **self._build_sections(
+                {
+                    "cars": lambda: self._sorted_cars(ctx, player_idx),
+                    "player": lambda: table().get(player_idx),
+                    "neighbors": lambda: self.neighbors.get_neighbors(
+                        player_idx, ctx, table()
+                    ),
+                    "leaderboard_data": lambda: self.get_session_info(player_idx, ctx),
+                },
+                sections,
+            ),
             "multiclass": ctx.multiclass,
         }
 
+    def _car_table(self, ctx: LeaderboardContext) -> dict[int, dict[str, Any]]:
+        """
+        Return the car rows of the current tick, updated on first use.
+        Updating advances the pit state, which must happen once per tick.
+        """
+        tick = self.irsdk.get_frame().tick_count
+        if tick != self._table_tick:
+            self.car_table.update(ctx)
+            self._table_tick = tick
+        return self.car_table.rows
+
+    def _sorted_cars(
+        self, ctx: LeaderboardContext, player_idx: int
+    ) -> list[dict[str, Any]]:
+        self._car_table(ctx)
+        return self.car_table.sorted_rows(exclude_idx=player_idx)
+
     def _build_context(self) -> LeaderboardContext | None:
         driver_info: dict[str, Any] = self.irsdk.get_value("DriverInfo") or {}
         drivers: list[dict[str, Any]] = driver_info.get("Drivers", []) or []
@@ -37,6 +92,10 @@ class Leaderboard(BaseService):
         if not drivers:
             return None
 
+        diff = self.driver_table.update(driver_info)
+        # A car index taken by a new car starts without pit history.
+        self.builder.forget_pit_data(diff.joined | diff.left)
+
         ctx = LeaderboardContext(
             drivers=drivers,
             positions=self.irsdk.get_value("CarIdxPosition") or [],
@@ -48,14 +107,19 @@ class Leaderboard(BaseService):
             ),
             lap_dist_pct=self.irsdk.get_value("CarIdxLapDistPct") or [],
             is_pitroad=self.irsdk.get_value("CarIdxOnPitRoad") or [],
-            multiclass=self._is_multiclass(drivers),
+            multiclass=self.driver_table.multiclass,
+            driver_table=self.driver_table,
         )
+        if not ctx.covers_drivers():
+            return None
 
-        ctx.session_fastest_lap = self.lap_times.session_fastest_lap(ctx)
-        ctx.class_fastest_laps = {
-            class_id: self.lap_times.class_fastest_lap(ctx, class_id)
-            for class_id in {driver.get("CarClassID") for driver in drivers}
-        }
+        # The NumPy path reads the frame's view, without boxed floats.
+        best_laps = self.irsdk.get_array("CarIdxBestLapTime")
+        if best_laps is None:
+            best_laps = ctx.best_lap_times
+        standings = compute_standings(best_laps, self.driver_table.class_ids)
+        ctx.session_fastest_lap = standings.session_fastest_lap
+        ctx.class_fastest_laps = standings.class_fastest_laps
 
         return ctx
 
@@ -85,8 +149,6 @@ class Leaderboard(BaseService):
         session_info: dict[str, Any] = self.irsdk.get_value("SessionInfo") or {}
         current_session = self._get_current_session(session_info)
 
-        self._reset_pit_status(session_info)
-
         session_laps: int | Literal["unlimited"] = current_session.get("SessionLaps")
         session_time_current: float = self.irsdk.get_value("SessionTime")
 
@@ -110,12 +172,6 @@ class Leaderboard(BaseService):
             "session_time_formatted": f"~{session_time_formatted}" if is_approximate else session_time_formatted,
         }
 
-    def _is_multiclass(self, drivers: list) -> bool:
-        """Check if race contains multiple car classes."""
-        return len(
-            {d.get("CarClassID") for d in drivers if d.get("CarClassID")}
-        ) > 1
-
     def _normalize_laps_started(self, raw_laps: list[Any]) -> list[int]:
         """
         Replace invalid lap counts with 0.
@@ -132,6 +188,7 @@ class Leaderboard(BaseService):
 
         if self._last_session_num != current_num:
             self.builder.reset_pit_data()
+            self.car_table.reset()
             self._last_session_num = current_num
 
     def _get_current_session(self, session_info: dict) -> dict:
@@ -0,0 +1,102 @@
+"""
+Fastest laps over the CarIdx arrays.
+
+compute_standings() takes the best lap of each car and the class id of
+each driver and returns the session and per-class fastest laps, the
+only standings the leaderboard rows read. Positions and the order of
+the rows stay with CarDataBuilder and CarTable, as a zero position
+falls back to the starting grid of SessionInfo.
+
+With NumPy installed this is a couple of vectorized passes over the
+arrays. Without it the same results come from a single Python pass, so
+neither path scans the drivers once per class. At 20 cars the Python
+pass is the faster one, the NumPy path only catches up from about 40
+cars (python -m benchmarks.standings).
+"""
+from typing import Any, NamedTuple, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # NumPy is optional, the Python path is used without it.
+    np = None
+
+
+class Standings(NamedTuple):
+    """Fastest laps of one tick."""
+
+    # Fastest valid best lap of the session, None without valid laps.
+    session_fastest_lap: float | None
+    # Fastest valid best lap by CarClassID, None for classes without one.
+    class_fastest_laps: dict[int | None, float | None]
+
+
+def _is_valid(lap_time: Any) -> bool:
+    """Same rule as LapTimeService.is_valid_lap_time()."""
+    return isinstance(lap_time, (int, float)) and lap_time > 0
+
+
+def compute_standings(
+    best_laps: Sequence[Any],
+    class_ids: Sequence[int | None],
+) -> Standings:
+    """
+    Compute the fastest laps of the drivers in class_ids, one per car
+    index. best_laps may be longer than the driver list, as the sim
+    sizes the CarIdx arrays for the maximum number of cars.
+    """
+    if np is None:
+        return _python_standings(best_laps, class_ids)
+    return _numpy_standings(best_laps, class_ids)
+
+
+def _lap_array(values: Sequence[Any]):
+    """Lap times as float64, invalid times as NaN."""
+    array = np.array(values, dtype=np.float64)
+    array[~(array > 0)] = np.nan
+    return array
+
+
+def _numpy_standings(best_laps, class_ids) -> Standings:
+    count = min(len(class_ids), len(best_laps))
+    all_best = _lap_array(best_laps)
+    session_fastest = np.fmin.reduce(all_best, initial=np.inf)
+    session_fastest = (
+        float(session_fastest) if np.isfinite(session_fastest) else None
+    )
+
+    # Class ids as dense codes, each class minimum is then one fmin.at.
+    codes_by_class = {
+        class_id: code
+        for code, class_id in enumerate(dict.fromkeys(class_ids))
+    }
+    codes = np.fromiter(
+        (codes_by_class[class_id] for class_id in class_ids[:count]),
+        dtype=np.intp,
+        count=count,
+    )
+    fastest = np.full(len(codes_by_class), np.inf)
+    np.fmin.at(fastest, codes, all_best[:count])
+    return Standings(
+        session_fastest_lap=session_fastest,
+        class_fastest_laps={
+            class_id: float(fastest[code]) if np.isfinite(fastest[code]) else None
+            for class_id, code in codes_by_class.items()
+        },
+    )
+
+
+def _python_standings(best_laps, class_ids) -> Standings:
+    valid = [lap for lap in best_laps if _is_valid(lap)]
+    session_fastest = min(valid) if valid else None
+
+    class_fastest: dict[int | None, float | None] = dict.fromkeys(class_ids)
+    for lap, class_id in zip(best_laps, class_ids):
+        if _is_valid(lap):
+            fastest = class_fastest[class_id]
+            if fastest is None or lap < fastest:
+                class_fastest[class_id] = lap
+
+    return Standings(
+        session_fastest_lap=session_fastest,
+        class_fastest_laps=class_fastest,
+    )
@@ -0,0 +1,176 @@
+"""
+Delta encoding of overlay snapshots.
+
+A delta turns a base snapshot into a newer one. Dicts are diffed key
+by key and lists of car dicts (every item has a "car_idx") are diffed
+car by car, so a tick that only moves the cars sends only
+lap_dist_pct values instead of every name, iRating and lap time:
+
+    dict delta:      {"set": {key: value}, "del": [key],
+                      "sub": {key: delta}}
+    car list delta:  {"order": [car_idx], "set": {car_idx: car},
+                      "sub": {car_idx: dict delta}}
+
+Empty parts are left out. "order" is only sent when cars were added,
+removed or reordered. Car indices are string keys, as in JSON.
+
+Updates sent to clients are either a keyframe with the whole snapshot
+or a delta against a tick the client already has:
+
+    {"tick": 120, "keyframe": true, "data": snapshot}
+    {"tick": 126, "base": 120, "delta": delta}
+"""
+import threading
+from collections import OrderedDict
+from typing import Any
+
+# A keyframe is forced whenever the tick enters a new window of this
+# many ticks (10 s at 60 Hz), so clients never drift for long.
+KEYFRAME_TICKS = 600
+
+
+def _is_car_list(value: Any) -> bool:
+    return isinstance(value, list) and all(
+        isinstance(item, dict) and "car_idx" in item for item in value
+    )
+
+
+def diff_snapshot(base: dict, snapshot: dict) -> dict:
+    """Return the delta turning base into snapshot."""
+    delta: dict[str, Any] = {}
+    changed = {}
+    nested = {}
+    for key, value in snapshot.items():
+        if key not in base:
+            changed[key] = value
+            continue
+        old = base[key]
+        if isinstance(old, dict) and isinstance(value, dict):
+            sub = diff_snapshot(old, value)
+        elif old and _is_car_list(old) and _is_car_list(value):
+            sub = _diff_cars(old, value)
+        elif old != value:
+            changed[key] = value
+            continue
+        else:
+            continue
+        if sub:
+            nested[key] = sub
+
+    removed = [key for key in base if key not in snapshot]
+    if changed:
+        delta["set"] = changed
+    if removed:
+        delta["del"] = removed
+    if nested:
+        delta["sub"] = nested
+    return delta
+
+
+def _diff_cars(base: list[dict], cars: list[dict]) -> dict:
+    base_by_idx = {car["car_idx"]: car for car in base}
+    delta: dict[str, Any] = {}
+    replaced = {}
+    nested = {}
+    for car in cars:
+        idx = car["car_idx"]
+        old = base_by_idx.get(idx)
+        if old is None:
+            replaced[str(idx)] = car
+        elif old is not car and old != car:
+            nested[str(idx)] = diff_snapshot(old, car)
+
+    order = [car["car_idx"] for car in cars]
+    if order != [car["car_idx"] for car in base]:
+        delta["order"] = order
+    if replaced:
+        delta["set"] = replaced
+    if nested:
+        delta["sub"] = nested
+    return delta
+
+
+def apply_delta(base: dict, delta: dict) -> dict:
+    """Return base with the delta applied, base itself is not changed."""
+    result = {
+        key: value for key, value in base.items()
+        if key not in delta.get("del", ())
+    }
+    result.update(delta.get("set", {}))
+    for key, sub in delta.get("sub", {}).items():
+        old = result[key]
+        if isinstance(old, list):
+            result[key] = _apply_cars(old, sub)
+        else:
+            result[key] = apply_delta(old, sub)
+    return result
+
+
+def _apply_cars(base: list[dict], delta: dict) -> list[dict]:
+    cars = {str(car["car_idx"]): car for car in base}
+    cars.update(delta.get("set", {}))
+    for idx, sub in delta.get("sub", {}).items():
+        cars[idx] = apply_delta(cars[idx], sub)
+    order = delta.get("order")
+    if order is None:
+        return [cars[str(car["car_idx"])] for car in base]
+    return [cars[str(idx)] for idx in order]
+
+
+def encode_update(
+    tick: int,
+    snapshot: dict,
+    base_tick: int | None = None,
+    base: dict | None = None,
+) -> dict[str, Any]:
+    """
+    Return the update bringing a client from base_tick to tick.
+
+    Falls back to a keyframe when the client has no base, when the
+    tick went backwards (sim restart) or entered a new keyframe window.
+    """
+    if (
+        base is None
+        or base_tick is None
+        or base_tick > tick
+        or base_tick // KEYFRAME_TICKS != tick // KEYFRAME_TICKS
+    ):
+        return {"tick": tick, "keyframe": True, "data": snapshot}
+    return {"tick": tick, "base": base_tick, "delta": diff_snapshot(base, snapshot)}
+
+
+class SnapshotHistory:
+    """
+    Recent snapshots of one overlay by tick, the bases that
+    ?since=<tick> HTTP polls are diffed against.
+
+    Snapshots of negative ticks (no sim data) are not kept.
+    A tick going backwards means the sim restarted, which
+    drops every older snapshot.
+    """
+
+    def __init__(self, size: int = 64):
+        self.size = size
+        self._snapshots: OrderedDict[int, dict] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(self, tick: int, snapshot: dict) -> None:
+        if tick < 0:
+            return
+        with self._lock:
+            if self._snapshots and tick < next(reversed(self._snapshots)):
+                self._snapshots.clear()
+            self._snapshots[tick] = snapshot
+            self._snapshots.move_to_end(tick)
+            while len(self._snapshots) > self.size:
+                self._snapshots.popitem(last=False)
+
+    def get(self, tick: int) -> dict | None:
+        with self._lock:
+            return self._snapshots.get(tick)
+
+    def update_since(self, since: int, tick: int, snapshot: dict) -> dict[str, Any]:
+        """Record the snapshot and return the update from since to it."""
+        base = self.get(since)
+        self.add(tick, snapshot)
+        return encode_update(tick, snapshot, since, base)
@@ -0,0 +1,259 @@
+import asyncio
+import logging
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from types import MappingProxyType
+from typing import Any, Iterable, Mapping, NamedTuple
+
+from backend.services.push.delta import encode_update
+from backend.utils.serialization import dumps_json
+
+logger = logging.getLogger(__name__)
+
+
+def encode_message(topic: str, update: dict[str, Any]) -> str:
+    """Serialize one pushed message."""
+    return dumps_json({"topic": topic, **update}).decode("utf-8")
+
+
+# Topic and the sections of its snapshot, None for all of them.
+SnapshotKey = tuple[str, frozenset[str] | None]
+
+
+class Update(NamedTuple):
+    """Snapshot of one topic built by the hub, with its message."""
+
+    tick: int
+    snapshot: dict[str, Any]
+    message: str
+
+
+class Subscription:
+    """
+    Outgoing queue of one WebSocket client.
+
+    Holds at most one pending update per topic: an update that was
+    not sent before the next one arrived is replaced (latest wins),
+    so a slow client skips frames instead of falling behind.
+    In delta mode each message is diffed against the snapshot last
+    sent to this client, which is why updates are only encoded
+    when they are actually sent.
+
+    The hub thread reads the subscribed topics while the event loop
+    changes them, so they are never modified in place: add() and
+    discard() replace the read-only routes mapping with a new one.
+    Everything else is only touched from the event loop the client
+    runs on.
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        self.loop = loop
+        # Sections requested per subscribed topic, None for all.
+        self.routes: Mapping[str, frozenset[str] | None] = MappingProxyType({})
+        self.dropped = 0
+        self._delta = False
+        self._pending: dict[str, Update] = {}
+        self._sent: dict[str, tuple[int, dict[str, Any]]] = {}
+        self._ready = asyncio.Event()
+
+    @property
+    def delta(self) -> bool:
+        return self._delta
+
+    @delta.setter
+    def delta(self, enabled: bool) -> None:
+        self._delta = enabled
+        self._sent.clear()
+
+    @property
+    def topics(self) -> frozenset[str]:
+        return frozenset(self.routes)
+
+    def add(self, topic: str, sections: frozenset[str] | None = None) -> None:
+        """Start sending a topic, with some sections only if given."""
+        self.routes = MappingProxyType({**self.routes, topic: sections})
+
+    def offer(self, topic: str, update: Update) -> None:
+        """Queue an update, replacing the unsent one of the same topic."""
+        if topic not in self.routes:
+            return
+        if topic in self._pending:
+            self.dropped += 1
+        self._pending[topic] = update
+        self._ready.set()
+
+    def request_keyframe(self, topic: str) -> None:
+        """Send the next update of a topic as a keyframe."""
+        self._sent.pop(topic, None)
+
+    def discard(self, topic: str) -> None:
+        """Stop sending a topic."""
+        self.routes = MappingProxyType(
+            {key: value for key, value in self.routes.items() if key != topic}
+        )
+        self._pending.pop(topic, None)
+        self._sent.pop(topic, None)
+
+    async def next_messages(self) -> list[str]:
+        """Wait for and return all pending messages."""
+        await self._ready.wait()
+        self._ready.clear()
+        pending, self._pending = self._pending, {}
+        return [self._encode(topic, update) for topic, update in pending.items()]
+
+    def _encode(self, topic: str, update: Update) -> str:
+        if not self._delta:
+            return update.message
+        base_tick, base = self._sent.get(topic, (None, None))
+        self._sent[topic] = (update.tick, update.snapshot)
+        return encode_message(
+            topic, encode_update(update.tick, update.snapshot, base_tick, base)
+        )
+
+
+class SnapshotHub:
+    """
+    Builds overlay snapshots once per sim tick and pushes them to
+    every subscribed WebSocket client.
+
+    The hub thread wakes up when IRSDKService publishes a frame
+    and starts building the snapshot of each topic that has at least
+    one subscriber. Topics are built independently on a small pool,
+    each message is handed to its subscribers as soon as it is
+    serialized, so a slow topic does not hold back the others. A
+    topic still building when the next tick arrives skips that tick.
+    Without new frames (sim not running) snapshots are still pushed
+    every idle_interval, so clients notice the sim went away.
+    """
+
+    def __init__(
+        self,
+        irsdk_service,
+        services: Mapping[str, Any],
+        idle_interval: float = 1.0,
+    ):
+        self.irsdk = irsdk_service
+        self.services = dict(services)
+        self.idle_interval = idle_interval
+        self._subscriptions: set[Subscription] = set()
+        # Snapshot keys being built, guarded by _lock.
+        self._building: set[SnapshotKey] = set()
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
+        self._tick_event = threading.Event()
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @property
+    def topics(self) -> frozenset[str]:
+        return frozenset(self.services)
+
+    def start(self) -> None:
+        """Start pushing in a daemon thread."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self.irsdk.add_frame_listener(self._on_frame)
+        self._thread = threading.Thread(
+            target=self._run, name="snapshot-hub", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 2.0) -> None:
+        self.irsdk.remove_frame_listener(self._on_frame)
+        self._stop_event.set()
+        self._tick_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def subscribe(self, loop: asyncio.AbstractEventLoop) -> Subscription:
+        subscription = Subscription(loop)
+        with self._lock:
+            self._subscriptions.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            self._subscriptions.discard(subscription)
+
+    def build(self, keys: Iterable[SnapshotKey]) -> dict[SnapshotKey, Update]:
+        """Build and serialize the current snapshot of each topic."""
+        updates = {}
+        for topic, sections in keys:
+            try:
+                tick, snapshot = self.services[topic].get_versioned_snapshot(sections)
+            except Exception as e:
+                logger.error("Snapshot %s failed: %s", topic, e)
+                continue
+            message = encode_message(topic, {"tick": tick, "data": snapshot})
+            updates[(topic, sections)] = Update(tick, snapshot, message)
+        return updates
+
+    def publish(self) -> list[Future]:
+        """
+        Start one round of snapshots for the current subscribers.
+        Returns the builds started, each offers its update when done.
+        """
+        with self._lock:
+            subscriptions = tuple(self._subscriptions)
+        keys = {
+            (topic, sections)
+            for subscription in subscriptions
+            for topic, sections in subscription.routes.items()
+        }
+
+        futures = []
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=max(len(self.services), 1),
+                    thread_name_prefix="snapshot-build",
+                )
+            for key in keys - self._building:
+                self._building.add(key)
+                futures.append(self._executor.submit(self._build_and_offer, key))
+        return futures
+
+    def _build_and_offer(self, key: SnapshotKey) -> None:
+        try:
+            update = self.build([key]).get(key)
+        finally:
+            with self._lock:
+                self._building.discard(key)
+        if update is not None:
+            self._offer(key, update)
+
+    def _offer(self, key: SnapshotKey, update: Update) -> None:
+        """Hand an update to every subscriber of its topic and sections."""
+        topic, sections = key
+        with self._lock:
+            subscriptions = tuple(self._subscriptions)
+        for subscription in subscriptions:
+            routes = subscription.routes
+            if topic not in routes or routes[topic] != sections:
+                continue
+            try:
+                subscription.loop.call_soon_threadsafe(
+                    subscription.offer, topic, update
+                )
+            except RuntimeError:  # Client event loop closed.
+                self.unsubscribe(subscription)
+
+    def _on_frame(self, _frame) -> None:
+        self._tick_event.set()
+
+    def _run(self) -> None:
+        while not self._stop_event.is_set():
+            self._tick_event.wait(self.idle_interval)
+            self._tick_event.clear()
+            if self._stop_event.is_set():
+                break
+            try:
+                self.publish()
+            except Exception as e:
+                logger.error("Snapshot hub failed: %s", e)
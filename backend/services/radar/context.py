@@ -1,4 +1,5 @@
 from dataclasses import dataclass
+from typing import Any
 
 
 @dataclass
@@ -22,7 +23,10 @@ class RadarContext:
         player_idx (int | None):
             Index of the player's car in the lap_dist_pct list.
             None if not available.
-            
+        lap_dist_array (numpy.ndarray | None):
+            lap_dist_pct as a read-only NumPy view of the frame,
+            None without NumPy.
+
     Used by RadarService to pass pre-fetched, consistent telemetry data
     into snapshot builders.
     """
@@ -31,3 +35,4 @@ class RadarContext:
     car_left_right: int
     lap_dist_pct: list[float]
     player_idx: int | None
+    lap_dist_array: Any = None
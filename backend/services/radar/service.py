@@ -46,6 +46,14 @@ class DistanceSeverity:
 class RadarService(BaseService):
     """Business logic service working with radar data."""
 
+    FIELDS = (
+        "CarLeftRight",
+        "CarDistAhead",
+        "CarDistBehind",
+        "CarIdxLapDistPct",
+        "PlayerCarIdx",
+    )
+
     def __init__(self, irsdk_service):
         super().__init__(irsdk_service, builder=None)
 
@@ -64,9 +72,12 @@ class RadarService(BaseService):
             car_left_right=car_left_right,
             lap_dist_pct=self.irsdk.get_value("CarIdxLapDistPct") or [],
             player_idx=self.irsdk.get_value("PlayerCarIdx"),
+            lap_dist_array=self.irsdk.get_array("CarIdxLapDistPct"),
         )
 
-    def _build_snapshot(self, ctx: RadarContext) -> dict[str, Any]:
+    def _build_snapshot(
+        self, ctx: RadarContext, sections: frozenset[str] | None = None
+    ) -> dict[str, Any]:
         """
         Generates the snapshot for the API.
         Overridden method from BaseService.
@@ -139,6 +150,9 @@ class RadarService(BaseService):
         if my_idx is None:
             return None
 
+        if ctx.lap_dist_array is not None:
+            return self._find_closest_in_array(ctx.lap_dist_array, my_idx)
+
         my_pct = ctx.lap_dist_pct[my_idx]
 
         best_idx = None
@@ -162,6 +176,25 @@ class RadarService(BaseService):
 
         return best_idx
 
+    @staticmethod
+    def _find_closest_in_array(lap_dist_pct, my_idx: int) -> int | None:
+        """
+        Same as _find_closest_side_car() over a NumPy array, with
+        _lap_delta() applied to all cars at once.
+        """
+        if my_idx >= len(lap_dist_pct):
+            return None
+
+        delta = lap_dist_pct.astype("f8") - float(lap_dist_pct[my_idx])
+        delta[delta > 0.5] -= 1.0
+        delta[delta < -0.5] += 1.0
+        distance = abs(delta)
+        distance[my_idx] = float("inf")
+
+        # argmin() keeps the first of equal cars, as the loop does.
+        best_idx = int(distance.argmin())
+        return best_idx if distance[best_idx] != float("inf") else None
+
     def _compute_side_offset(self, ctx: RadarContext) -> dict | None:
         """
         Computes the longitudinal offset of the closest side car.
@@ -184,7 +217,7 @@ class RadarService(BaseService):
 
                 {"offset": 0.02}
         """
-        if ctx.player_idx is None:
+        if ctx.player_idx is None or ctx.player_idx >= len(ctx.lap_dist_pct):
             return None
 
         my_pct = ctx.lap_dist_pct[ctx.player_idx]
@@ -20,6 +20,14 @@ class TelemetryContext:
 class TelemetryService(BaseService):
     """Business logic service working with telemetry data."""
 
+    FIELDS = (
+        "Throttle",
+        "Brake",
+        "Speed",
+        "Gear",
+        "BrakeABSactive",
+    )
+
     def __init__(self, irsdk_service):
         super().__init__(irsdk_service, builder=None)
 
@@ -42,7 +50,9 @@ class TelemetryService(BaseService):
             is_brake_abs=is_brake_abs,
         )
 
-    def _build_snapshot(self, ctx: TelemetryContext) -> dict[str, Any]:
+    def _build_snapshot(
+        self, ctx: TelemetryContext, sections: frozenset[str] | None = None
+    ) -> dict[str, Any]:
         """
         Generates the snapshot for the API.
         Overridden method from BaseService.
@@ -0,0 +1,51 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+SVG_MEDIA_TYPE = "image/svg+xml"
+JSON_MEDIA_TYPE = "application/json"
+
+
+def asset_hash(content: bytes) -> str:
+    """Return the content hash naming an asset."""
+    return hashlib.sha256(content).hexdigest()[:16]
+
+
+class TrackAssets:
+    """
+    Track SVGs and racing line tables by content hash.
+
+    Snapshots carry only the hash of the track assets, clients fetch
+    the asset itself once from /api/track-map/assets/{hash}.svg, or
+    {hash}.json for racing lines. An asset never changes under its
+    hash, so it is served with immutable cache headers. Only the
+    latest few assets are kept.
+    """
+
+    def __init__(self, size: int = 8):
+        self.size = size
+        self._assets: OrderedDict[str, tuple[bytes, str]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def add(
+        self, text: str | None, media_type: str = SVG_MEDIA_TYPE
+    ) -> str | None:
+        """Store an asset and return its hash, None for no asset."""
+        if text is None:
+            return None
+        content = text.encode("utf-8")
+        key = asset_hash(content)
+        with self._lock:
+            self._assets[key] = (content, media_type)
+            self._assets.move_to_end(key)
+            while len(self._assets) > self.size:
+                self._assets.popitem(last=False)
+        return key
+
+    def get(self, key: str, media_type: str = SVG_MEDIA_TYPE) -> bytes | None:
+        """Return an asset of the given media type by hash."""
+        with self._lock:
+            asset = self._assets.get(key)
+        if asset is None or asset[1] != media_type:
+            return None
+        return asset[0]
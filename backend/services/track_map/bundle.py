@@ -0,0 +1,142 @@
+"""
+Offline bundle of pre-processed track assets.
+
+Built ahead of time by tools/build_track_bundle.py so that a track map
+shows up instantly and without network access. One file holds every
+track, indexed by track id:
+
+    header:  magic b"RWTB", version u16, reserved u16, track count u32
+    index:   per track, sorted by id: track id u32, offset u64, length u32
+    data:    per track, a UTF-8 JSON object with the fields of
+             BundledTrack
+
+All integers are little-endian. The file is memory-mapped: opening it
+reads only the index, a track is decoded when it is looked up.
+"""
+import json
+import logging
+import mmap
+import os
+import struct
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+from backend.utils.paths import get_base_path
+
+logger = logging.getLogger(__name__)
+
+MAGIC = b"RWTB"
+VERSION = 1
+HEADER = struct.Struct("<4sHHI")
+INDEX_ENTRY = struct.Struct("<IQI")
+
+
+class BundledTrack(NamedTuple):
+    """Pre-processed assets of one track."""
+
+    track_id: int
+    # Track SVG reduced to its first subpath, see extract_first_subpath.
+    track_svg: str
+    start_finish_svg: str | None
+    # Path data of the racing line, from M to Z.
+    racing_line: str | None
+
+
+def default_bundle_path() -> Path:
+    """Bundle shipped with the app, REDWAVE_TRACK_BUNDLE overrides it."""
+    override = os.environ.get("REDWAVE_TRACK_BUNDLE")
+    if override:
+        return Path(override)
+    return get_base_path() / "backend" / "database" / "track_assets.bin"
+
+
+def write_bundle(path: Path, tracks: Iterable[BundledTrack]) -> int:
+    """Write a bundle of tracks and return the number of tracks written."""
+    blobs = {
+        track.track_id: json.dumps(
+            track._asdict(), ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        for track in tracks
+    }
+    offset = HEADER.size + INDEX_ENTRY.size * len(blobs)
+    index = []
+    for track_id in sorted(blobs):
+        index.append(INDEX_ENTRY.pack(track_id, offset, len(blobs[track_id])))
+        offset += len(blobs[track_id])
+
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, len(blobs)))
+        f.writelines(index)
+        f.writelines(blobs[track_id] for track_id in sorted(blobs))
+    return len(blobs)
+
+
+class TrackAssetBundle:
+    """Read-only, memory-mapped view of a bundle written by write_bundle()."""
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        with open(self.path, "rb") as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._index = self._read_index()
+        except ValueError:
+            self._mmap.close()
+            raise
+
+    def _read_index(self) -> dict[int, tuple[int, int]]:
+        if len(self._mmap) < HEADER.size:
+            raise ValueError(f"{self.path} is not a track bundle")
+        magic, version, _, count = HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC:
+            raise ValueError(f"{self.path} is not a track bundle")
+        if version != VERSION:
+            raise ValueError(f"Unsupported track bundle version {version}")
+        if len(self._mmap) < HEADER.size + INDEX_ENTRY.size * count:
+            raise ValueError(f"{self.path} is truncated")
+
+        index = {}
+        for i in range(count):
+            track_id, offset, length = INDEX_ENTRY.unpack_from(
+                self._mmap, HEADER.size + INDEX_ENTRY.size * i
+            )
+            if offset + length > len(self._mmap):
+                raise ValueError(f"{self.path} is truncated")
+            index[track_id] = (offset, length)
+        return index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, track_id) -> bool:
+        return track_id in self._index
+
+    @property
+    def track_ids(self) -> list[int]:
+        return sorted(self._index)
+
+    def get(self, track_id: int) -> BundledTrack | None:
+        entry = self._index.get(track_id)
+        if entry is None:
+            return None
+        offset, length = entry
+        data = json.loads(self._mmap[offset:offset + length])
+        # Bundles may carry fields of other app versions.
+        return BundledTrack(
+            **{name: data.get(name) for name in BundledTrack._fields}
+        )
+
+    def close(self) -> None:
+        self._mmap.close()
+
+
+def load_bundle(path: Path | None = None) -> TrackAssetBundle | None:
+    """Open the bundle at path (the default one), None when unavailable."""
+    path = path or default_bundle_path()
+    if not path.is_file():
+        return None
+    try:
+        return TrackAssetBundle(path)
+    except (OSError, ValueError) as e:
+        logger.warning("Cannot open track bundle %s: %s", path, e)
+        return None
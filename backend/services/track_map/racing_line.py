@@ -0,0 +1,215 @@
+"""
+Racing line lookup table.
+
+The racing line of a track SVG (its first subpath, see
+extract_racing_line) is sampled once into a fixed number of points at
+equal distances along the path. A lap fraction then maps to x/y and
+heading with one index lookup instead of measuring the SVG path:
+
+    index = fraction * resolution, point i at i / resolution of the path
+
+Fractions are along the path from its first point. Mapping a car's
+lap_dist_pct onto them needs the start/finish offset and direction.
+"""
+import math
+import re
+from typing import Any, Iterable
+
+_TOKEN = re.compile(
+    r"[MmLlHhVvCcSsQqTtAaZz]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?"
+)
+# Number of arguments of each path command.
+_ARGS = {
+    "M": 2, "L": 2, "H": 1, "V": 1, "C": 6, "S": 4, "Q": 4, "T": 2, "A": 7,
+}
+# Straight pieces each curve is flattened into.
+CURVE_STEPS = 16
+
+Point = tuple[float, float]
+
+
+def _cubic(p0: Point, p1: Point, p2: Point, p3: Point) -> list[Point]:
+    points = []
+    for step in range(1, CURVE_STEPS + 1):
+        t = step / CURVE_STEPS
+        u = 1 - t
+        a, b, c, e = u**3, 3 * u**2 * t, 3 * u * t**2, t**3
+        points.append((
+            a * p0[0] + b * p1[0] + c * p2[0] + e * p3[0],
+            a * p0[1] + b * p1[1] + c * p2[1] + e * p3[1],
+        ))
+    return points
+
+
+def _quadratic(p0: Point, p1: Point, p2: Point) -> list[Point]:
+    points = []
+    for step in range(1, CURVE_STEPS + 1):
+        t = step / CURVE_STEPS
+        u = 1 - t
+        points.append((
+            u**2 * p0[0] + 2 * u * t * p1[0] + t**2 * p2[0],
+            u**2 * p0[1] + 2 * u * t * p1[1] + t**2 * p2[1],
+        ))
+    return points
+
+
+def flatten_path(d: str) -> list[Point]:
+    """
+    Return the first subpath of SVG path data as a polyline.
+
+    Supports every path command, absolute and relative. Arcs are
+    taken as straight lines to their end point, track SVGs draw
+    with lines and Bezier curves.
+    """
+    tokens = _TOKEN.findall(d)
+    points: list[Point] = []
+    current = start = (0.0, 0.0)
+    # Reflected control point for S and T.
+    control: Point | None = None
+    command = None
+    i = 0
+    while i < len(tokens):
+        if tokens[i].isalpha():
+            command = tokens[i]
+            i += 1
+            if command in "Zz":
+                if points:
+                    points.append(start)
+                break
+        if command is None:
+            raise ValueError("Path data does not start with a command")
+        upper = command.upper()
+        count = _ARGS[upper]
+        args = [float(token) for token in tokens[i:i + count]]
+        if len(args) < count:
+            break
+        i += count
+        relative = command.islower()
+        ox, oy = current if relative else (0.0, 0.0)
+
+        if upper == "M":
+            if points:  # A second subpath, keep only the first.
+                break
+            current = start = (args[0] + ox, args[1] + oy)
+            points.append(current)
+            # Further pairs are implicit line-tos.
+            command = "l" if relative else "L"
+            control = None
+            continue
+        if upper == "L":
+            end = (args[0] + ox, args[1] + oy)
+            new_points = [end]
+        elif upper == "H":
+            end = (args[0] + ox, current[1])
+            new_points = [end]
+        elif upper == "V":
+            end = (current[0], args[0] + oy)
+            new_points = [end]
+        elif upper == "A":
+            end = (args[5] + ox, args[6] + oy)
+            new_points = [end]
+        elif upper in "CS":
+            if upper == "C":
+                c1 = (args[0] + ox, args[1] + oy)
+                rest = args[2:]
+            else:
+                c1 = control or current
+                c1 = (2 * current[0] - c1[0], 2 * current[1] - c1[1])
+                rest = args
+            c2 = (rest[0] + ox, rest[1] + oy)
+            end = (rest[2] + ox, rest[3] + oy)
+            points.extend(_cubic(current, c1, c2, end))
+            current, control = end, c2
+            continue
+        else:  # Q and T
+            if upper == "Q":
+                c1 = (args[0] + ox, args[1] + oy)
+                end = (args[2] + ox, args[3] + oy)
+            else:
+                c1 = control or current
+                c1 = (2 * current[0] - c1[0], 2 * current[1] - c1[1])
+                end = (args[0] + ox, args[1] + oy)
+            points.extend(_quadratic(current, c1, end))
+            current, control = end, c1
+            continue
+
+        points.extend(new_points)
+        current, control = end, None
+    return points
+
+
+class RacingLine:
+    """Points at equal distances along a racing line."""
+
+    def __init__(
+        self, points: list[tuple[float, float, float]], length: float
+    ):
+        # x, y and heading in degrees: 0 along +x, clockwise in SVG space.
+        self.points = points
+        self.length = length
+
+    @property
+    def resolution(self) -> int:
+        return len(self.points)
+
+    @classmethod
+    def from_path(cls, d: str, resolution: int = 1024) -> "RacingLine | None":
+        """Sample path data, None when it is invalid or has no length."""
+        try:
+            flattened = flatten_path(d)
+        except ValueError:
+            return None
+        # Zero-length pieces have no heading.
+        polyline = flattened[:1]
+        for point in flattened[1:]:
+            if point != polyline[-1]:
+                polyline.append(point)
+        cumulative = [0.0]
+        for (x0, y0), (x1, y1) in zip(polyline, polyline[1:]):
+            cumulative.append(cumulative[-1] + math.hypot(x1 - x0, y1 - y0))
+        length = cumulative[-1]
+        if length <= 0:
+            return None
+
+        points = []
+        segment = 0
+        for i in range(resolution):
+            distance = i / resolution * length
+            while (
+                segment + 2 < len(cumulative)
+                and cumulative[segment + 1] < distance
+            ):
+                segment += 1
+            (x0, y0), (x1, y1) = polyline[segment], polyline[segment + 1]
+            span = cumulative[segment + 1] - cumulative[segment]
+            t = (distance - cumulative[segment]) / span
+            points.append((
+                x0 + (x1 - x0) * t,
+                y0 + (y1 - y0) * t,
+                math.degrees(math.atan2(y1 - y0, x1 - x0)),
+            ))
+        return cls(points, length)
+
+    def point_at(self, fraction: float) -> tuple[float, float, float]:
+        """Return x, y and heading at a fraction of the path."""
+        position = (fraction % 1.0) * len(self.points)
+        index = int(position)
+        t = position - index
+        x0, y0, heading = self.points[index % len(self.points)]
+        x1, y1, _ = self.points[(index + 1) % len(self.points)]
+        return x0 + (x1 - x0) * t, y0 + (y1 - y0) * t, heading
+
+    def project(
+        self, fractions: Iterable[float]
+    ) -> list[tuple[float, float, float]]:
+        return [self.point_at(fraction) for fraction in fractions]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Compact form for overlays, points flattened to x, y, heading."""
+        return {
+            "length": round(self.length, 2),
+            "resolution": len(self.points),
+            "points": [
+                round(value, 2) for point in self.points for value in point
+            ],
+        }
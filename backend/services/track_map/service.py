@@ -1,17 +1,21 @@
 from typing import Any
 from dataclasses import dataclass
 
+from backend.services.drivers import DriverTable
 from backend.services.session_tracker import SessionKey, SessionTracker
 from backend.services.base import (
     BaseService,
     BaseCarBuilder,
     SessionStateContext,
 )
+from backend.services.track_map.assets import JSON_MEDIA_TYPE, TrackAssets
+from backend.services.track_map.bundle import load_bundle
+from backend.services.track_map.racing_line import RacingLine
+from backend.services.track_map.svg_fetcher import TrackSvgFetcher, TrackSvgs
 from backend.utils.track_url_generation import (
     DIRECTION_OVERRIDES,
-    make_track_svg_url,
-    fetch_svg,
 )
+from backend.utils.serialization import dumps_json
 
 
 @dataclass
@@ -36,33 +40,87 @@ class TrackMapCarBuilder(BaseCarBuilder):
         if not car:
             return None
         # Specific fields
-        car["car_class_color"] = ctx.drivers[idx].get("CarClassColor")
+        car["car_class_color"] = ctx.driver_table.get(idx).class_color
         return car
 
 
 class TrackMapService(BaseService):
     """Business logic service working with track-map data."""
 
-    def __init__(self, irsdk_service):
+    SECTIONS = (
+        "cars",
+        "track_svg_hash",
+        "start_finish_svg_hash",
+        "racing_line_hash",
+    )
+    SVG_SECTIONS = frozenset(
+        {"track_svg_hash", "start_finish_svg_hash", "racing_line_hash"}
+    )
+
+    FIELDS = (
+        "DriverInfo",
+        "WeekendInfo",
+        "SessionNum",
+        "PlayerCarIdx",
+        "CarIdxLapDistPct",
+        "CarIdxOnPitRoad",
+        "CarIdxPosition",
+        "CarIdxClassPosition",
+    )
+
+    def __init__(self, irsdk_service, svg_fetcher: TrackSvgFetcher | None = None):
         self.session_tracker = SessionTracker()
-        self._cached_track_svg: str | None = None
-        self._cached_start_finish_svg: str | None = None
+        self.driver_table = DriverTable()
+        self.svg_fetcher = svg_fetcher or TrackSvgFetcher(bundle=load_bundle())
+        # SVGs are served by hash from /api/track-map/assets.
+        self.assets = TrackAssets()
+        self._track_svgs: TrackSvgs | None = None
+        self._track_svg_hash: str | None = None
+        self._start_finish_svg_hash: str | None = None
+        # Racing line of the current track, sampled once per track.
+        self.racing_line: RacingLine | None = None
+        self._racing_line_hash: str | None = None
         self._cached_track_id: int | None = None
+        # Session the cached SVGs were fetched in.
+        self._cached_session_key: SessionKey | None = None
+        # Session change state of the latest tick, shared by every
+        # section projection built in that tick.
+        self._session_tick: int | None = None
+        self._session_changed = False
         super().__init__(irsdk_service, TrackMapCarBuilder())
 
     def _update_track_svgs(
         self, track_id: str, track_name: str, track_short_name: str
     ):
-        track_url = make_track_svg_url(
-            track_id, track_name, track_short_name, svg_type="active"
-        )
-        start_finish_url = make_track_svg_url(
-            track_id, track_name, track_short_name, svg_type="start-finish"
-        )
-
-        self._cached_track_svg = fetch_svg(track_url, extract_first=True)
-        self._cached_start_finish_svg = fetch_svg(start_finish_url)
+        """
+        Start fetching the SVGs of the track in the background.
+        The previous map is kept until then, unless it is of another track.
+        """
+        if track_id != self._cached_track_id:
+            self._track_svg_hash = None
+            self._start_finish_svg_hash = None
+            self._racing_line_hash = None
+            self.racing_line = None
+            self._track_svgs = None
         self._cached_track_id = track_id
+        if track_id is not None:
+            self.svg_fetcher.request(track_id, track_name, track_short_name)
+
+    def _collect_track_svgs(self) -> None:
+        """Publish the SVGs of the current track once they were fetched."""
+        svgs = self.svg_fetcher.result(self._cached_track_id)
+        if svgs is None or svgs is self._track_svgs:
+            return
+        self._track_svgs = svgs
+        self._track_svg_hash = self.assets.add(svgs.track)
+        self._start_finish_svg_hash = self.assets.add(svgs.start_finish)
+        self.racing_line = svgs.racing_line
+        self._racing_line_hash = None
+        if self.racing_line is not None:
+            self._racing_line_hash = self.assets.add(
+                dumps_json(self.racing_line.to_dict()).decode("utf-8"),
+                JSON_MEDIA_TYPE,
+            )
 
     def _build_context(self) -> TrackMapContext | None:
         """
@@ -73,13 +131,7 @@ class TrackMapService(BaseService):
         drivers = driver_info.get("Drivers", [])
         if not drivers:
             return None
-
-        class_ids: set = {
-            driver.get("CarClassID")
-            for driver in drivers
-            if driver.get("CarClassID")
-        }
-        multiclass: bool = len(class_ids) > 1
+        self.driver_table.update(driver_info)
 
         return TrackMapContext(
             drivers=drivers,
@@ -87,10 +139,13 @@ class TrackMapService(BaseService):
             is_pitroad=self.irsdk.get_value("CarIdxOnPitRoad") or [],
             positions=self.irsdk.get_value("CarIdxPosition") or [],
             class_positions=self.irsdk.get_value("CarIdxClassPosition") or [],
-            multiclass=multiclass,
+            multiclass=self.driver_table.multiclass,
+            driver_table=self.driver_table,
         )
 
-    def _build_snapshot(self, ctx: TrackMapContext) -> dict[str, Any]:
+    def _build_snapshot(
+        self, ctx: TrackMapContext, sections: frozenset[str] | None = None
+    ) -> dict[str, Any]:
         """
         Generates the snapshot for the API.
         Overridden method from BaseService.
@@ -103,10 +158,55 @@ class TrackMapService(BaseService):
             session_id=weekend_info.get("SessionID"),
             session_num=self.irsdk.get_value("SessionNum"),
         )
-        is_session_changed = self.session_tracker.is_changed(session_key)
+        is_session_changed = self._is_session_changed(session_key)
 
+        track_id = weekend_info.get("TrackID")
+        if sections is None or not sections.isdisjoint(self.SVG_SECTIONS):
+            if (
+                session_key != self._cached_session_key
+                or track_id != self._cached_track_id
+            ):
+                self._update_track_svgs(
+                    track_id,
+                    weekend_info.get("TrackName"),
+                    weekend_info.get("TrackDisplayShortName"),
+                )
+                self._cached_session_key = session_key
+            self._collect_track_svgs()
+
+        return {
+            "status": "ok",
+            "player_id": player_idx,
+            "is_session_changed": is_session_changed,
+            # The track SVGs are being fetched, the map follows.
+            "track_svg_loading": self.svg_fetcher.is_pending(track_id),
+            **self._build_sections(
+                {
+                    "cars": lambda: self._build_cars(ctx, player_idx),
+                    "track_svg_hash": lambda: self._track_svg_hash,
+                    "start_finish_svg_hash": lambda: self._start_finish_svg_hash,
+                    "racing_line_hash": lambda: self._racing_line_hash,
+                },
+                sections,
+            ),
+            "direction_override": DIRECTION_OVERRIDES.get(track_id),
+        }
+
+    def _is_session_changed(self, session_key: SessionKey) -> bool:
+        """
+        Whether the session changed at the current tick. Evaluated
+        once per tick, so that every projection built in the same
+        tick reports the same change.
+        """
+        tick = self.irsdk.get_frame().tick_count
+        if tick != self._session_tick:
+            self._session_tick = tick
+            self._session_changed = self.session_tracker.is_changed(session_key)
+        return self._session_changed
+
+    def _build_cars(self, ctx: TrackMapContext, player_idx: int) -> list[dict]:
         cars = []
-        for idx in range(len(ctx.drivers)):
+        for idx in ctx.driver_table.car_indices:
             car = self.builder.build(idx, ctx)
             if not car:
                 continue
@@ -115,28 +215,7 @@ class TrackMapService(BaseService):
                     "player_id": idx,
                     "car_number": car["car_number"],
                     "lap_dist_pct": car["lap_dist_pct"],
-                    "color": self.irsdk.get_car_rgb(
-                        idx=idx,
-                        drivers=ctx.drivers,
-                        player_idx=player_idx,
-                        multiclass=ctx.multiclass,
-                    ),
+                    "color": ctx.driver_table.car_rgb(idx, player_idx),
                 }
             )
-
-        track_id = weekend_info.get("TrackID")
-        track_name = weekend_info.get("TrackName")
-        track_short_name = weekend_info.get("TrackDisplayShortName")
-
-        if is_session_changed or track_id != self._cached_track_id:
-            self._update_track_svgs(track_id, track_name, track_short_name)
-
-        return {
-            "status": "ok",
-            "player_id": player_idx,
-            "is_session_changed": is_session_changed,
-            "cars": cars,
-            "track_svg": self._cached_track_svg,
-            "start_finish_svg": self._cached_start_finish_svg,
-            "direction_override": DIRECTION_OVERRIDES.get(track_id),
-        }
+        return cars
@@ -0,0 +1,177 @@
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import NamedTuple
+
+import httpx
+
+from backend.services.track_map.bundle import BundledTrack, TrackAssetBundle
+from backend.services.track_map.racing_line import RacingLine
+from backend.utils import track_url_generation
+from backend.utils.paths import get_cache_path
+from backend.utils.track_url_generation import (
+    extract_first_subpath,
+    extract_racing_line,
+    fetch_svg,
+    make_track_svg_url,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class TrackSvgs(NamedTuple):
+    """Fetched SVGs of one track with its sampled racing line."""
+
+    track: str | None
+    start_finish: str | None
+    racing_line: RacingLine | None = None
+
+
+class TrackSvgFetcher:
+    """
+    Fetches track SVGs in a background thread.
+
+    Snapshots never wait for the asset host: request() starts a fetch
+    and returns at once, result() returns the SVGs once they arrived.
+    Downloads share one pooled httpx client and are kept on disk,
+    keyed by track id and URL, so a restart does not fetch them again.
+    A failed fetch is not cached and is retried on the next request().
+    Tracks of the offline bundle are available at once, without
+    touching the network; their racing line is sampled in the
+    background thread like a download.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path | None = None,
+        base_url: str | None = None,
+        size: int = 4,
+        bundle: TrackAssetBundle | None = None,
+    ):
+        self.bundle = bundle
+        self.cache_dir = cache_dir or get_cache_path() / "track-maps"
+        self.base_url = base_url or track_url_generation.TRACK_MAPS_URL
+        # Fetched tracks kept in memory.
+        self.size = size
+        self._results: OrderedDict[int, TrackSvgs] = OrderedDict()
+        self._pending: dict[int, Future] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="track-svg"
+        )
+        # Only used from the executor thread.
+        self._client: httpx.Client | None = None
+
+    def request(self, track_id: int, track_name: str, shortname: str) -> None:
+        """Start fetching the SVGs of a track unless already fetched."""
+        with self._lock:
+            if track_id in self._results or track_id in self._pending:
+                return
+            bundled = None
+            if self.bundle is not None:
+                bundled = self.bundle.get(track_id)
+            if bundled is not None:
+                # The map shows up at once, the racing line follows
+                # once sampled on the fetcher thread.
+                self._store(
+                    track_id,
+                    TrackSvgs(bundled.track_svg, bundled.start_finish_svg),
+                )
+                if not bundled.racing_line:
+                    return
+                future = self._executor.submit(self._with_racing_line, bundled)
+            else:
+                future = self._executor.submit(
+                    self.fetch, track_id, track_name, shortname
+                )
+            self._pending[track_id] = future
+        future.add_done_callback(lambda done: self._done(track_id, done))
+
+    def result(self, track_id: int) -> TrackSvgs | None:
+        """Return the fetched SVGs of a track, None until they arrived."""
+        with self._lock:
+            return self._results.get(track_id)
+
+    def is_pending(self, track_id: int) -> bool:
+        with self._lock:
+            return track_id in self._pending
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        if self._client is not None:
+            self._client.close()
+
+    def fetch(
+        self, track_id: int, track_name: str, shortname: str
+    ) -> TrackSvgs | None:
+        """
+        Fetch the SVGs of a track in the calling thread, from the disk
+        cache when possible. None when the track SVG is unavailable.
+        """
+        urls = [
+            make_track_svg_url(
+                track_id, track_name, shortname, svg_type, base_url=self.base_url
+            )
+            for svg_type in ("active", "start-finish")
+        ]
+        track, start_finish = (self._load(track_id, url) for url in urls)
+        if track is None:
+            return None
+        track = extract_first_subpath(track)
+        path = extract_racing_line(track)
+        racing_line = RacingLine.from_path(path) if path else None
+        return TrackSvgs(track, start_finish, racing_line)
+
+    @staticmethod
+    def _with_racing_line(bundled: BundledTrack) -> TrackSvgs:
+        """SVGs of a bundled track with its sampled racing line."""
+        return TrackSvgs(
+            bundled.track_svg,
+            bundled.start_finish_svg,
+            RacingLine.from_path(bundled.racing_line),
+        )
+
+    def _done(self, track_id: int, future: Future) -> None:
+        svgs = None
+        if not future.cancelled():
+            if future.exception() is not None:
+                logger.error("Track SVG fetch failed: %s", future.exception())
+            else:
+                svgs = future.result()
+        with self._lock:
+            self._pending.pop(track_id, None)
+            if svgs is not None:
+                self._store(track_id, svgs)
+
+    def _store(self, track_id: int, svgs: TrackSvgs) -> None:
+        """Keep fetched SVGs, the caller holds the lock."""
+        self._results[track_id] = svgs
+        while len(self._results) > self.size:
+            self._results.popitem(last=False)
+
+    def _load(self, track_id: int, url: str) -> str | None:
+        """Return the SVG at url from the disk cache, downloading it once."""
+        url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        path = self.cache_dir / f"{track_id}-{url_hash}.svg"
+        try:
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            pass
+
+        if self._client is None:
+            self._client = httpx.Client()
+        svg = fetch_svg(url, client=self._client)
+        if svg is None:
+            return None
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_path = path.with_suffix(".tmp")
+            tmp_path.write_text(svg, encoding="utf-8")
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not cache track SVG %s: %s", url, e)
+        return svg
@@ -1,3 +1,4 @@
+import os
 import sys
 from pathlib import Path
 
@@ -12,3 +13,17 @@ def get_base_path() -> Path:
     if getattr(sys, "frozen", False):
         return Path(sys._MEIPASS)
     return Path(__file__).resolve().parents[2]
+
+
+def get_cache_path() -> Path:
+    """
+    Directory for data cached between runs, such as track SVGs.
+    REDWAVE_CACHE_DIR overrides the per-user default.
+    """
+    override = os.environ.get("REDWAVE_CACHE_DIR")
+    if override:
+        return Path(override)
+    local_app_data = os.environ.get("LOCALAPPDATA")
+    if local_app_data:
+        return Path(local_app_data) / "redwave-overlays" / "cache"
+    return Path.home() / ".cache" / "redwave-overlays"
@@ -0,0 +1,129 @@
+"""
+Serialization of snapshot responses.
+
+Snapshots are plain dicts of JSON types, so they are encoded directly
+instead of going through FastAPI's generic jsonable_encoder first.
+orjson is used when installed, the stdlib json module otherwise.
+MessagePack is offered to clients that ask for it in the Accept
+header, when the msgpack package is installed.
+"""
+import json
+from typing import Any, Hashable, Mapping
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import Response
+
+try:
+    import orjson
+except ImportError:  # orjson is optional, stdlib json is used without it.
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # msgpack is optional, clients get JSON without it.
+    msgpack = None
+
+JSON_MEDIA_TYPE = "application/json"
+MSGPACK_MEDIA_TYPES = ("application/msgpack", "application/x-msgpack")
+
+
+def dumps_json(content: Any) -> bytes:
+    """Encode content as compact UTF-8 JSON."""
+    if orjson is not None:
+        return orjson.dumps(
+            content, default=jsonable_encoder, option=orjson.OPT_SERIALIZE_NUMPY
+        )
+    return json.dumps(
+        content,
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+        default=jsonable_encoder,
+    ).encode("utf-8")
+
+
+def dumps_msgpack(content: Any) -> bytes:
+    """Encode content as MessagePack, requires the msgpack package."""
+    if msgpack is None:
+        raise RuntimeError("msgpack is not installed")
+    return msgpack.packb(content, default=jsonable_encoder, use_bin_type=True)
+
+
+def negotiate(accept: str | None) -> str:
+    """
+    Return the media type to encode a response with, MessagePack
+    when the Accept header lists it (with a non-zero quality) and
+    msgpack is installed, JSON otherwise.
+    """
+    if msgpack is None or not accept:
+        return JSON_MEDIA_TYPE
+    for item in accept.split(","):
+        media_type, _, params = item.partition(";")
+        if media_type.strip().lower() not in MSGPACK_MEDIA_TYPES:
+            continue
+        quality = params.strip().removeprefix("q=")
+        if quality in ("", "1") or _positive(quality):
+            return MSGPACK_MEDIA_TYPES[0]
+    return JSON_MEDIA_TYPE
+
+
+def _positive(quality: str) -> bool:
+    try:
+        return float(quality) > 0
+    except ValueError:
+        return False
+
+
+def encode(content: Any, media_type: str) -> bytes:
+    """Encode content in a media type returned by negotiate()."""
+    if media_type == JSON_MEDIA_TYPE:
+        return dumps_json(content)
+    return dumps_msgpack(content)
+
+
+class BodyCache:
+    """
+    Encoded body of the latest snapshot per key and media type.
+
+    Services return the same snapshot dict until the sim ticks again
+    (see BaseService.get_versioned_snapshot), so a body is reused for
+    as long as it was encoded from that very dict and every client
+    polling within one tick shares a single encoding. Racing threads
+    may both encode a new snapshot, which only costs the extra work.
+    """
+
+    def __init__(self):
+        self._bodies: dict[tuple[Hashable, str], tuple[Any, bytes]] = {}
+
+    def encode(self, key: Hashable, content: Any, media_type: str) -> bytes:
+        cached = self._bodies.get((key, media_type))
+        if cached is not None and cached[0] is content:
+            return cached[1]
+        body = encode(content, media_type)
+        self._bodies[(key, media_type)] = (content, body)
+        return body
+
+
+def snapshot_response(
+    content: Any,
+    accept: str | None = None,
+    status_code: int = 200,
+    headers: Mapping[str, str] | None = None,
+    cache: BodyCache | None = None,
+    cache_key: Hashable = None,
+) -> Response:
+    """
+    Encode content in the negotiated media type, reusing the body
+    cached under cache_key when a cache is given.
+    """
+    media_type = negotiate(accept)
+    if cache is not None:
+        body = cache.encode(cache_key, content, media_type)
+    else:
+        body = encode(content, media_type)
+    return Response(
+        body,
+        status_code=status_code,
+        headers={**(headers or {}), "Vary": "Accept"},
+        media_type=media_type,
+    )
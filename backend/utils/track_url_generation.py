@@ -2,6 +2,8 @@ import re
 import httpx
 from lxml import etree
 
+TRACK_MAPS_URL = "https://members-assets.iracing.com/public/track-maps/"
+
 # For some tracks, their shortname from the irsdk api does not match
 # the shortname from members-assets.iracing.com/, so a rewrite is required.
 OVERRIDES = {
@@ -83,7 +85,11 @@ DIRECTION_OVERRIDES = {
 }
 
 def make_track_svg_url(
-    track_id: int, track_name: str, shortname: str, svg_type: str = "active",
+    track_id: int,
+    track_name: str,
+    shortname: str,
+    svg_type: str = "active",
+    base_url: str = TRACK_MAPS_URL,
 ) -> str:
     """
     Build the URL for fetching track-related SVG assets.
@@ -99,6 +105,7 @@ def make_track_svg_url(
     :param track_name: Human-readable track name
     :param shortname: Default track shortname
     :param svg_type: SVG type ("active" or "start-finish")
+    :param base_url: Track maps root, members-assets.iracing.com by default
     :return: URL string pointing to the requested SVG
     """
     track_name_formatted = str(track_name).lower().replace(" ", "-")
@@ -109,8 +116,7 @@ def make_track_svg_url(
     shortname = str(shortname).lower()
 
     return (
-        "https://members-assets.iracing.com/public/track-maps/"
-        f"tracks_{shortname}/{track_id}-{track_name_formatted}/{svg_type}.svg"
+        f"{base_url}tracks_{shortname}/{track_id}-{track_name_formatted}/{svg_type}.svg"
     )
 
 
@@ -157,7 +163,28 @@ def extract_first_subpath(svg_text: str) -> str | None:
         return svg_text
 
 
-def fetch_svg(url: str, extract_first: bool = False) -> str | None:
+def extract_racing_line(svg_text: str) -> str | None:
+    """
+    Return the path data of the first subpath of the first <path>,
+    the racing line, or None when the SVG has no path.
+
+    :param svg_text: Raw SVG string
+    :return: Path data from M to Z, or None
+    """
+    try:
+        root = etree.fromstring(svg_text.encode())
+    except Exception:
+        return None
+    for el in root.iter():
+        if isinstance(el.tag, str) and etree.QName(el).localname == "path":
+            match = re.search(r'(M[\s\S]*?Z)', el.get('d', ''), re.IGNORECASE)
+            return match.group(1) if match else None
+    return None
+
+
+def fetch_svg(
+    url: str, extract_first: bool = False, client: httpx.Client | None = None
+) -> str | None:
     """
     Fetch an SVG file from a remote URL.
 
@@ -166,10 +193,11 @@ def fetch_svg(url: str, extract_first: bool = False) -> str | None:
 
     :param url: SVG file URL
     :param extract_first: Whether to extract only the first subpath
+    :param client: Pooled client to fetch with, a one-off request otherwise
     :return: SVG content as string, or None if request fails
     """
     try:
-        resp = httpx.get(url, timeout=5.0)
+        resp = (client or httpx).get(url, timeout=5.0)
         if resp.status_code == 200:
             text = resp.text
             if extract_first:
@@ -0,0 +1,59 @@
+"""
+Benchmark the overlay services end to end on a recorded session.
+
+Replays an iRacing .ibt telemetry file through IBTReplayService and
+builds the radar, leaderboard, track map and telemetry snapshots for
+every record, as the API handlers do for each overlay poll.
+
+Usage:
+    python -m benchmarks.ibt_replay path/to/session.ibt [--records N]
+"""
+import argparse
+import time
+
+from backend.services.irsdk.replay import IBTReplayService
+from backend.services.leaderboard.service import Leaderboard
+from backend.services.radar.service import RadarService
+from backend.services.telemetry.service import TelemetryService
+from backend.services.track_map.service import TrackMapService
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("path", help=".ibt telemetry file")
+    parser.add_argument(
+        "--records", type=int, default=None, help="replay at most N records"
+    )
+    args = parser.parse_args()
+
+    irsdk_service = IBTReplayService(args.path, speed=None)
+    services = {
+        "radar": RadarService(irsdk_service),
+        "leaderboard": Leaderboard(irsdk_service),
+        "track-map": TrackMapService(irsdk_service),
+        "telemetry": TelemetryService(irsdk_service),
+    }
+    connected, _ = irsdk_service.connect()
+    if not connected:
+        raise SystemExit(f"Cannot open {args.path}")
+
+    total = irsdk_service.record_count
+    if args.records is not None:
+        total = min(total, args.records)
+    timings = {name: 0.0 for name in services}
+
+    for _ in range(total):
+        for name, service in services.items():
+            start = time.perf_counter()
+            service.get_snapshot()
+            timings[name] += time.perf_counter() - start
+        irsdk_service.step()
+
+    print(f"{total} records of {args.path}")
+    for name, elapsed in timings.items():
+        print(f"{name:12} {elapsed / total * 1e6:10.1f} us/snapshot")
+    print(f"{'all':12} {sum(timings.values()) / total * 1e6:10.1f} us/record")
+
+
+if __name__ == "__main__":
+    main()
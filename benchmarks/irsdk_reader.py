@@ -0,0 +1,99 @@
+"""
+Benchmark reading the IRSDK fields used by Leaderboard and RadarService.
+
+Runs against a SimEmulator memory file through pyirsdk, and compares
+reading every field with IRSDK.__getitem__ (var header lookup and one
+struct.unpack_from per field) with FrameReader, which unpacks the
+whole subset from the frozen var buffer in a single call.
+
+Usage:
+    python -m benchmarks.irsdk_reader [--scenario multiclass-race]
+        [--number 20000]
+"""
+import argparse
+import tempfile
+import timeit
+from pathlib import Path
+
+from backend.services.irsdk.emulator import SimEmulator
+from backend.services.irsdk.reader import FrameReader
+from backend.services.irsdk.scenario import SCENARIOS, load_scenario
+from backend.services.irsdk.service import IRSDKService
+
+FIELDS = (
+    "SessionTime",
+    "SessionTimeTotal",
+    "SessionNum",
+    "PlayerCarIdx",
+    "IsOnTrack",
+    "CarLeftRight",
+    "CarDistAhead",
+    "CarDistBehind",
+    "CarIdxLap",
+    "CarIdxLapDistPct",
+    "CarIdxPosition",
+    "CarIdxClassPosition",
+    "CarIdxOnPitRoad",
+    "CarIdxLastLapTime",
+    "CarIdxBestLapTime",
+)
+
+
+def read_per_field(ir) -> dict:
+    """Read every field the way the services did, one ir[field] each."""
+    return {name: ir[name] for name in FIELDS}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--scenario",
+        default="multiclass-race",
+        help=f"built-in scenario ({', '.join(SCENARIOS)}) or a JSON script",
+    )
+    parser.add_argument("--number", type=int, default=20000)
+    args = parser.parse_args()
+
+    if args.scenario in SCENARIOS:
+        scenario = SCENARIOS[args.scenario]()
+    else:
+        scenario = load_scenario(args.scenario)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "irsdk.bin"
+        with SimEmulator(scenario, path) as emulator:
+            irsdk_service = IRSDKService(test_file=str(path))
+            emulator.step(scenario.tick_rate)
+            irsdk_service.connect()
+            ir = irsdk_service.ir
+            reader = FrameReader.compile(ir._var_headers_dict, FIELDS)
+
+            ir.freeze_var_buffer_latest()
+            try:
+                var_buf = ir._var_buffer_latest
+                buffer, offset = var_buf.get_memory(), var_buf.buf_offset
+                assert reader.unpack(buffer, offset) == {
+                    name: tuple(value) if isinstance(value, list) else value
+                    for name, value in read_per_field(ir).items()
+                }
+                per_field = timeit.timeit(
+                    lambda: read_per_field(ir), number=args.number
+                )
+                compiled = timeit.timeit(
+                    lambda: reader.unpack(buffer, offset), number=args.number
+                )
+            finally:
+                ir.unfreeze_var_buffer_latest()
+                ir.shutdown()
+
+    print(
+        f"{scenario.name}: {len(FIELDS)} fields, {scenario.car_count} cars, "
+        f"{args.number} reads"
+    )
+    print(f"ir[field] per field: {per_field / args.number * 1e6:8.2f} us/read")
+    print(f"compiled reader:     {compiled / args.number * 1e6:8.2f} us/read")
+    print(f"speedup:             {per_field / compiled:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,114 @@
+"""
+Benchmark snapshot serialization.
+
+Builds the radar, leaderboard, track map and telemetry snapshots of a
+SimEmulator scenario and times encoding each of them with the generic
+FastAPI path (jsonable_encoder + stdlib json), the snapshot JSON path
+(orjson when installed) and MessagePack (when msgpack is installed).
+The track map reads its SVGs from a local directory only, so the
+benchmark makes no requests to the asset host.
+
+Usage:
+    python -m benchmarks.serialization [--scenario multiclass-race]
+        [--repeat 200]
+"""
+import argparse
+import hashlib
+import json
+import tempfile
+import time
+from pathlib import Path
+
+from fastapi.encoders import jsonable_encoder
+
+from backend.services.irsdk.emulator import SimEmulator
+from backend.services.irsdk.scenario import SCENARIOS, load_scenario
+from backend.services.irsdk.service import IRSDKService
+from backend.services.leaderboard.service import Leaderboard
+from backend.services.radar.service import RadarService
+from backend.services.telemetry.service import TelemetryService
+from backend.services.track_map.service import TrackMapService
+from backend.services.track_map.svg_fetcher import TrackSvgFetcher
+from backend.utils import serialization
+
+
+class OfflineSvgFetcher(TrackSvgFetcher):
+    """Serves track SVGs from cache_dir only, never from the asset host."""
+
+    def _load(self, track_id: int, url: str) -> str | None:
+        url_hash = hashlib.sha256(url.encode("utf-8")).hexdigest()[:16]
+        path = self.cache_dir / f"{track_id}-{url_hash}.svg"
+        try:
+            return path.read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+
+def fastapi_json(content) -> bytes:
+    """Encode the way FastAPI does for a handler returning a dict."""
+    return json.dumps(
+        jsonable_encoder(content),
+        ensure_ascii=False,
+        allow_nan=False,
+        separators=(",", ":"),
+    ).encode("utf-8")
+
+
+def time_encoder(encode, content, repeat: int) -> tuple[float, int]:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        body = encode(content)
+    return (time.perf_counter() - start) / repeat, len(body)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--scenario",
+        default="multiclass-race",
+        help=f"built-in scenario ({', '.join(SCENARIOS)}) or a JSON script",
+    )
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    if args.scenario in SCENARIOS:
+        scenario = SCENARIOS[args.scenario]()
+    else:
+        scenario = load_scenario(args.scenario)
+
+    encoders = {"fastapi": fastapi_json}
+    json_name = "orjson" if serialization.orjson is not None else "json"
+    encoders[json_name] = serialization.dumps_json
+    if serialization.msgpack is not None:
+        encoders["msgpack"] = serialization.dumps_msgpack
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "irsdk.bin"
+        with SimEmulator(scenario, path) as emulator:
+            irsdk_service = IRSDKService(test_file=str(path))
+            services = {
+                "radar": RadarService(irsdk_service),
+                "leaderboard": Leaderboard(irsdk_service),
+                "track-map": TrackMapService(
+                    irsdk_service, OfflineSvgFetcher(cache_dir=Path(tmp))
+                ),
+                "telemetry": TelemetryService(irsdk_service),
+            }
+            emulator.step(scenario.tick_rate * 10)
+            snapshots = {
+                name: service.get_snapshot() for name, service in services.items()
+            }
+            services["track-map"].svg_fetcher.close()
+            irsdk_service.ir.shutdown()
+
+    print(f"{scenario.name}: {scenario.car_count} cars, {args.repeat} encodes each")
+    for name, snapshot in snapshots.items():
+        for encoder, encode in encoders.items():
+            seconds, size = time_encoder(encode, snapshot, args.repeat)
+            print(
+                f"{name:12} {encoder:8} {seconds * 1e6:9.1f} us {size:8d} bytes"
+            )
+
+
+if __name__ == "__main__":
+    main()
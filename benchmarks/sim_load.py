@@ -0,0 +1,112 @@
+"""
+Load test the overlay services against the sim emulator.
+
+Runs a SimEmulator scenario at sim tick rate, the TelemetrySampler and
+a number of pollers per overlay endpoint (as the overlays poll every
+100 ms), then prints snapshot latency percentiles and the rate at
+which the sampler published frames.
+
+Usage:
+    python -m benchmarks.sim_load [--scenario multiclass-race]
+        [--seconds 10] [--pollers 2] [--speed 1.0]
+"""
+import argparse
+import statistics
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+from backend.services.irsdk.emulator import SimEmulator
+from backend.services.irsdk.sampler import TelemetrySampler
+from backend.services.irsdk.scenario import SCENARIOS, load_scenario
+from backend.services.irsdk.service import IRSDKService
+from backend.services.leaderboard.service import Leaderboard
+from backend.services.radar.service import RadarService
+from backend.services.telemetry.service import TelemetryService
+from backend.services.track_map.service import TrackMapService
+
+POLL_INTERVAL = 0.1
+
+
+def poll(service, stop: threading.Event, latencies: list[float]) -> None:
+    while not stop.is_set():
+        start = time.perf_counter()
+        service.get_snapshot()
+        latencies.append(time.perf_counter() - start)
+        stop.wait(POLL_INTERVAL)
+
+
+def percentile(values: list[float], pct: float) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+    return statistics.quantiles(values, n=100)[int(pct) - 1]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--scenario",
+        default="multiclass-race",
+        help=f"built-in scenario ({', '.join(SCENARIOS)}) or a JSON script",
+    )
+    parser.add_argument("--seconds", type=float, default=10.0)
+    parser.add_argument("--pollers", type=int, default=2, help="pollers per overlay")
+    parser.add_argument("--speed", type=float, default=1.0, help="sim speed")
+    args = parser.parse_args()
+
+    if args.scenario in SCENARIOS:
+        scenario = SCENARIOS[args.scenario]()
+    else:
+        scenario = load_scenario(args.scenario)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "irsdk.bin"
+        with SimEmulator(scenario, path) as emulator:
+            irsdk_service = IRSDKService(test_file=str(path))
+            services = {
+                "radar": RadarService(irsdk_service),
+                "leaderboard": Leaderboard(irsdk_service),
+                "track-map": TrackMapService(irsdk_service),
+                "telemetry": TelemetryService(irsdk_service),
+            }
+            sampler = TelemetrySampler(irsdk_service)
+            published = []
+            irsdk_service.add_frame_listener(published.append)
+
+            emulator.start(args.speed)
+            sampler.start()
+            stop = threading.Event()
+            latencies = {name: [] for name in services}
+            threads = [
+                threading.Thread(
+                    target=poll, args=(service, stop, latencies[name]), daemon=True
+                )
+                for name, service in services.items()
+                for _ in range(args.pollers)
+            ]
+            for thread in threads:
+                thread.start()
+
+            time.sleep(args.seconds)
+            stop.set()
+            for thread in threads:
+                thread.join()
+            sampler.stop()
+            emulator.stop()
+
+    print(
+        f"{scenario.name}: {scenario.car_count} cars, {args.seconds:.0f} s, "
+        f"{args.pollers} pollers per overlay"
+    )
+    print(f"sampler: {len(published) / args.seconds:.1f} frames/s")
+    for name, values in latencies.items():
+        print(
+            f"{name:12} n={len(values):5d} "
+            f"p50={percentile(values, 50) * 1e3:7.2f} ms "
+            f"p99={percentile(values, 99) * 1e3:7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""
+Benchmark the leaderboard standings math.
+
+Compares the fastest laps as Leaderboard computed them before
+compute_standings() (LapTimeService.class_fastest_lap scanning the
+drivers once per class) with compute_standings(), on its NumPy path
+when NumPy is installed and on its Python path, at 20, 40 and 64 cars
+in three classes.
+
+Usage:
+    python -m benchmarks.standings
+"""
+import random
+import timeit
+
+from backend.services.drivers import DriverTable
+from backend.services.leaderboard import standings
+from backend.services.leaderboard.context import LeaderboardContext
+from backend.services.leaderboard.lap_times.service import LapTimeService
+
+CAR_COUNTS = (20, 40, 64)
+CLASSES = (1, 2, 3)
+# The sim sizes the CarIdx arrays for the maximum number of cars.
+ARRAY_SIZE = 64
+
+
+def build_context(cars: int) -> LeaderboardContext:
+    rng = random.Random(cars)
+    drivers = [{"CarClassID": CLASSES[idx % len(CLASSES)]} for idx in range(cars)]
+    positions = list(range(1, cars + 1))
+    rng.shuffle(positions)
+    padding = ARRAY_SIZE - cars
+
+    def laps() -> list[float]:
+        return [rng.uniform(80.0, 95.0) for _ in range(cars)] + [-1.0] * padding
+
+    return LeaderboardContext(
+        drivers=drivers,
+        positions=positions + [0] * padding,
+        class_positions=positions + [0] * padding,
+        last_lap_times=laps(),
+        best_lap_times=laps(),
+        laps_started=[5] * ARRAY_SIZE,
+        lap_dist_pct=[0.5] * ARRAY_SIZE,
+        is_pitroad=[False] * ARRAY_SIZE,
+        multiclass=True,
+        driver_table=DriverTable.from_drivers(drivers),
+    )
+
+
+def per_class(lap_times: LapTimeService, ctx: LeaderboardContext) -> tuple:
+    """The fastest laps as Leaderboard._build_context() computed them."""
+    return lap_times.session_fastest_lap(ctx), {
+        class_id: lap_times.class_fastest_lap(ctx, class_id)
+        for class_id in {driver.get("CarClassID") for driver in ctx.drivers}
+    }
+
+
+def kernel(compute, ctx: LeaderboardContext) -> standings.Standings:
+    return compute(ctx.best_lap_times, ctx.driver_table.class_ids)
+
+
+def main(number: int = 5000) -> None:
+    lap_times = LapTimeService()
+    paths = {"per-class": lambda ctx: per_class(lap_times, ctx)}
+    if standings.np is not None:
+        paths["numpy"] = lambda ctx: kernel(standings._numpy_standings, ctx)
+    paths["python"] = lambda ctx: kernel(standings._python_standings, ctx)
+
+    print(f"{len(CLASSES)} classes, {number} runs each")
+    print(f"{'cars':>5} " + " ".join(f"{name:>10}" for name in paths) + "  (us/run)")
+    for cars in CAR_COUNTS:
+        ctx = build_context(cars)
+        timings = [
+            timeit.timeit(lambda: path(ctx), number=number) / number * 1e6
+            for path in paths.values()
+        ]
+        print(f"{cars:5d} " + " ".join(f"{us:10.2f}" for us in timings))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,7 @@ from backend.services.base import (
     BaseService,
     SessionStateContext,
 )
+from backend.services.drivers import DriverTable
 
 
 @pytest.fixture
@@ -48,6 +49,7 @@ def mock_ctx():
 
     def _make_ctx(**overrides):
         data = {**defaults, **overrides}
+        data.setdefault("driver_table", DriverTable.from_drivers(data["drivers"]))
         return SessionStateContext(**data)
 
     return _make_ctx
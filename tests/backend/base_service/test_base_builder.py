@@ -1,5 +1,7 @@
 import pytest
 
+from backend.services.base import SessionStateContext
+
 
 # --- Positive tests ---
 
@@ -15,21 +17,6 @@ def test_build_returns_car_data(mock_builder, mock_ctx):
     assert car["is_in_pitroad"] is False
 
 
-@pytest.mark.parametrize(
-    "username,expected",
-    [
-        ("PACE CAR", True),
-        ("pace car", True),
-        ("Driver1", False),
-        ("", False),
-    ],
-)
-def test_is_pace_car_variants(mock_builder, username, expected):
-    driver = {"UserName": username}
-
-    assert mock_builder._is_pace_car(driver) is expected
-
-
 # --- Negative tests ---
 
 
@@ -49,7 +36,13 @@ def test_build_returns_none_for_pace_car(mock_builder, mock_ctx):
     assert result is None
 
 
-def test_is_pace_car_returns_false_for_normal_driver(mock_builder):
-    driver = {"UserName": "Driver1"}
-
-    assert mock_builder._is_pace_car(driver) is False
+def test_context_requires_driver_table():
+    with pytest.raises(TypeError):
+        SessionStateContext(
+            drivers=[],
+            positions=[],
+            class_positions=[],
+            lap_dist_pct=[],
+            is_pitroad=[],
+            multiclass=False,
+        )
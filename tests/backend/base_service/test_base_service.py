@@ -1,5 +1,26 @@
+import threading
+import time
+
 import pytest
 
+from backend.services.base import BaseService
+
+
+class CountingService(BaseService):
+    """BaseService counting its builds, each taking a few milliseconds."""
+
+    def __init__(self, irsdk_service):
+        super().__init__(irsdk_service, builder=None)
+        self.builds = 0
+
+    def _build_context(self):
+        return {"speed": self.irsdk.get_value("Speed")}
+
+    def _build_snapshot(self, ctx, sections=None):
+        self.builds += 1
+        time.sleep(0.005)
+        return {"status": "ok", "speed": ctx["speed"]}
+
 
 # --- Positive tests ---
 
@@ -20,7 +41,7 @@ def test_get_snapshot_calls_build_snapshot_when_context_exists(
 ):
     ctx = mock_ctx()
     mock_service._build_context = lambda: ctx
-    mock_service._build_snapshot = lambda c: {
+    mock_service._build_snapshot = lambda c, sections: {
         "status": "ok",
         "cars": [c.drivers[0]["CarNumber"]],
     }
@@ -31,6 +52,70 @@ def test_get_snapshot_calls_build_snapshot_when_context_exists(
     assert "12" in result["cars"]
 
 
+def test_snapshot_is_memoized_per_tick(ticking_irsdk_service):
+    service = CountingService(ticking_irsdk_service)
+
+    first = service.get_versioned_snapshot()
+    second = service.get_versioned_snapshot()
+    ticking_irsdk_service.advance(Speed=20.0)
+    third = service.get_versioned_snapshot()
+
+    assert second == first
+    assert second[1] is first[1]
+    assert third[0] == first[0] + 1
+    assert third[1]["speed"] == 20.0
+    assert service.builds == 2
+
+
+def test_concurrent_callers_share_one_build(ticking_irsdk_service):
+    service = CountingService(ticking_irsdk_service)
+    results = []
+
+    threads = [
+        threading.Thread(target=lambda: results.append(service.get_snapshot()))
+        for _ in range(8)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+
+    assert service.builds == 1
+    assert all(result is results[0] for result in results)
+
+
+class SectionedService(CountingService):
+    """CountingService with two sections, recording which were built."""
+
+    SECTIONS = ("gear", "rpm")
+
+    def _build_snapshot(self, ctx, sections=None):
+        self.built = []
+        return self._build_sections(
+            {
+                "gear": lambda: self.built.append("gear") or 3,
+                "rpm": lambda: self.built.append("rpm") or 7000,
+            },
+            sections,
+        )
+
+
+def test_unrequested_sections_are_not_built(ticking_irsdk_service):
+    service = SectionedService(ticking_irsdk_service)
+
+    snapshot = service.get_snapshot(sections=["gear"])
+
+    assert snapshot == {"gear": 3, "location": snapshot["location"]}
+    assert service.built == ["gear"]
+
+
+def test_all_sections_share_the_full_snapshot(ticking_irsdk_service):
+    service = SectionedService(ticking_irsdk_service)
+
+    assert service.resolve_sections(["rpm", "gear"]) is None
+    assert service.get_snapshot(["rpm", "gear"]) is service.get_snapshot()
+
+
 def test_empty_snapshot_returns_correct_structure(mock_service):
     result = mock_service._empty_snapshot()
     assert isinstance(result, dict)
@@ -52,6 +137,19 @@ def test_get_snapshot_returns_empty_when_context_is_none(mock_service):
     }
 
 
+def test_disconnected_snapshot_is_not_memoized(irsdk_mock_factory):
+    service = CountingService(irsdk_mock_factory(is_connected=False))
+
+    assert service.get_versioned_snapshot() == (-1, service._empty_snapshot())
+    assert service._memo == {}
+
+
+def test_unknown_section_is_rejected(ticking_irsdk_service):
+    service = SectionedService(ticking_irsdk_service)
+    with pytest.raises(ValueError):
+        service.get_snapshot(sections=["gear", "fuel"])
+
+
 def test_build_context_not_implemented(mock_service):
     with pytest.raises(NotImplementedError):
         mock_service._build_context()
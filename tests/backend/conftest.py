@@ -1,6 +1,10 @@
+import itertools
+from contextlib import nullcontext
+
 import pytest
 from unittest.mock import MagicMock
 
+from backend.services.irsdk.frame import TelemetryFrame
 from backend.services.irsdk.service import IRSDKService
 
 
@@ -20,10 +24,17 @@ def irsdk_mock_factory():
         mock_ir.is_connected = is_connected
         mock_ir.__getitem__.side_effect = lambda key: base_values.get(key)
         mock_ir.get_value = lambda key: base_values.get(key)
+        # As without NumPy, tests pass array views explicitly.
+        mock_ir.get_array = lambda key: None
         mock_ir._ensure_connected = lambda: (is_connected, "")
 
         mock_ir.startup = MagicMock()
 
+        # Used as an IRSDKService, every frame is a new tick.
+        ticks = itertools.count()
+        mock_ir.get_frame.side_effect = lambda: TelemetryFrame(next(ticks), None)
+        mock_ir.pinned_frame.side_effect = lambda: nullcontext(mock_ir.get_frame())
+
         return mock_ir
 
     return _factory
@@ -36,5 +47,30 @@ def mock_irsdk_service(irsdk_mock_factory):
     """
     irsdk = IRSDKService()
     irsdk.ir = irsdk_mock_factory()
+    irsdk.ir._var_buffer_latest.tick_count = 1
     irsdk.started = True
     return irsdk
+
+
+@pytest.fixture
+def ticking_irsdk_service(irsdk_mock_factory):
+    """
+    Returns the IRSDKService with a mock irsdk whose tick can be advanced.
+    """
+    values = {"Speed": 10.0, "CarIdxLapDistPct": [0.1, 0.2]}
+    mock_ir = irsdk_mock_factory()
+    mock_ir.__getitem__.side_effect = values.get
+    mock_ir._var_buffer_latest.tick_count = 1
+    mock_ir._header.var_buf = [mock_ir._var_buffer_latest]
+
+    service = IRSDKService()
+    service.ir = mock_ir
+    service.started = True
+    service.request_fields(["Speed", "CarIdxLapDistPct"])
+
+    def advance(**changes):
+        values.update(changes)
+        mock_ir._var_buffer_latest.tick_count += 1
+
+    service.advance = advance
+    return service
@@ -0,0 +1,24 @@
+import pytest
+
+from backend.services.drivers import DriverTable
+
+
+@pytest.fixture
+def mock_table() -> DriverTable:
+    """
+    Returns an empty DriverTable object.
+    """
+
+    return DriverTable()
+
+
+@pytest.fixture
+def mock_driver_info():
+    """
+    Factory for creating DriverInfo sections from driver entries.
+    """
+
+    def _make_driver_info(*drivers):
+        return {"Drivers": [dict(driver) for driver in drivers]}
+
+    return _make_driver_info
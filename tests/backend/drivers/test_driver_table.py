@@ -0,0 +1,156 @@
+import pytest
+
+from backend.services.drivers import DriverRecord, DriverTable
+
+DRIVER_1 = {
+    "CarIdx": 0,
+    "UserID": 101,
+    "UserName": "Driver One",
+    "CarNumber": "12",
+    "CarClassID": 1,
+    "CarClassColor": 0xFF0000,
+    "IRating": 2000,
+    "LicString": "A 4.99",
+}
+DRIVER_2 = {
+    "CarIdx": 3,
+    "UserID": 102,
+    "UserName": "Driver Two",
+    "CarNumber": "8",
+    "CarClassID": 2,
+    "CarClassColor": 0x00FF00,
+}
+
+
+# --- Positive tests ---
+
+
+def test_driver_record_fields():
+    record = DriverRecord(0, DRIVER_1)
+
+    assert record.first_name == "Driver"
+    assert record.is_pace_car is False
+    assert record.class_id == 1
+    assert record.class_rgb == "rgb(255,0,0)"
+    assert record.irating == 2000
+    assert record.license == "A 4.99"
+
+
+@pytest.mark.parametrize(
+    "username,expected",
+    [
+        ("PACE CAR", True),
+        ("pace car", True),
+        ("Driver1", False),
+        ("", False),
+    ],
+)
+def test_driver_record_pace_car_variants(username, expected):
+    assert DriverRecord(0, {"UserName": username}).is_pace_car is expected
+
+
+@pytest.mark.parametrize(
+    "username,expected",
+    [
+        ("Driver One", "Driver"),
+        (" SingleName ", "SingleName"),
+        ("", ""),
+        ("   ", ""),
+    ],
+)
+def test_driver_record_first_name_variants(username, expected):
+    assert DriverRecord(0, {"UserName": username}).first_name == expected
+
+
+def test_driver_table_keyed_by_car_idx_field(mock_table, mock_driver_info):
+    mock_table.update(mock_driver_info(DRIVER_1, DRIVER_2))
+
+    assert mock_table.car_indices == [0, 3]
+    assert mock_table.get(3).first_name == "Driver"
+    assert mock_table.get(1) is None
+    assert mock_table.class_ids == [1, None, None, 2]
+    assert mock_table.multiclass is True
+
+
+def test_driver_table_falls_back_to_list_position():
+    table = DriverTable.from_drivers([{"UserName": "A"}, {"UserName": "B"}])
+
+    assert [record.user_name for record in table] == ["A", "B"]
+    assert table.multiclass is False
+
+
+def test_driver_table_not_rebuilt_for_same_driver_info(
+    mock_table, mock_driver_info
+):
+    driver_info = mock_driver_info(DRIVER_1)
+    mock_table.update(driver_info)
+    record = mock_table.get(0)
+
+    diff = mock_table.update(driver_info)
+
+    assert not diff
+    assert mock_table.get(0) is record
+
+
+def test_driver_table_keeps_unchanged_records(mock_table, mock_driver_info):
+    mock_table.update(mock_driver_info(DRIVER_1, DRIVER_2))
+    record = mock_table.get(0)
+
+    mock_table.update(mock_driver_info(DRIVER_1, {**DRIVER_2, "IRating": 1}))
+
+    assert mock_table.get(0) is record
+    assert mock_table.get(3).irating == 1
+
+
+def test_driver_table_reports_join_and_leave(mock_table, mock_driver_info):
+    first = mock_table.update(mock_driver_info(DRIVER_1))
+
+    diff = mock_table.update(mock_driver_info(DRIVER_2))
+
+    assert first.joined == {0}
+    assert diff.joined == {3}
+    assert diff.left == {0}
+    assert diff.swapped == frozenset()
+
+
+def test_driver_table_reports_driver_swap(mock_table, mock_driver_info):
+    mock_table.update(mock_driver_info(DRIVER_1))
+
+    diff = mock_table.update(
+        mock_driver_info({**DRIVER_1, "UserID": 201, "UserName": "Relief Driver"})
+    )
+
+    assert diff.swapped == {0}
+    assert diff.joined == diff.left == frozenset()
+    assert mock_table.get(0).first_name == "Relief"
+
+
+def test_driver_table_car_rgb(mock_table, mock_driver_info):
+    mock_table.update(mock_driver_info(DRIVER_1, DRIVER_2))
+
+    assert mock_table.car_rgb(0, player_idx=0) == "#1e6cff"
+    assert mock_table.car_rgb(3, player_idx=0) == "rgb(0,255,0)"
+
+
+# --- Negative tests ---
+
+
+def test_driver_table_car_rgb_unknown_or_single_class(
+    mock_table, mock_driver_info
+):
+    mock_table.update(mock_driver_info(DRIVER_1))
+
+    assert mock_table.car_rgb(5, player_idx=0) == "#1b2a3a"
+    assert mock_table.car_rgb(0, player_idx=None) == "#1b2a3a"
+
+
+def test_driver_table_white_class_color_has_no_rgb():
+    assert DriverRecord(0, {"CarClassColor": 0xFFFFFF}).class_rgb is None
+
+
+def test_driver_table_without_driver_info(mock_table):
+    diff = mock_table.update(None)
+
+    assert len(mock_table) == 0
+    assert not diff
+    assert mock_table.class_ids == []
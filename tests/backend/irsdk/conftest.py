@@ -0,0 +1,123 @@
+import struct
+
+import pytest
+from irsdk import VAR_TYPE_MAP
+
+HEADER_SIZE = 112
+DISK_HEADER_SIZE = 32
+VAR_HEADER_SIZE = 144
+
+# irsdk var types, indexes into VAR_TYPE_MAP.
+BOOL, INT, FLOAT, DOUBLE = 1, 2, 4, 5
+
+SESSION_INFO_YAML = """---
+WeekendInfo:
+ TrackName: spa
+ TrackID: 163
+DriverInfo:
+ DriverCarIdx: 1
+ Drivers:
+ - CarIdx: 0
+   UserName: Pace Car
+ - CarIdx: 1
+   UserName: Test Driver
+...
+"""
+
+
+def write_ibt(path, fields, records, session_info=SESSION_INFO_YAML, tick_rate=60):
+    """
+    Write a minimal .ibt telemetry file.
+
+    fields: list of (name, irsdk var type, count)
+    records: list of dicts mapping field name to value (tuples for arrays)
+    """
+    layouts = []
+    offset = 0
+    for name, var_type, count in fields:
+        layouts.append((name, var_type, offset, count))
+        offset += struct.calcsize("<" + VAR_TYPE_MAP[var_type] * count)
+    buf_len = offset
+
+    var_header_offset = HEADER_SIZE + DISK_HEADER_SIZE
+    info = session_info.encode("cp1252") + b"\x00"
+    info_offset = var_header_offset + VAR_HEADER_SIZE * len(fields)
+    records_offset = info_offset + len(info)
+
+    data = bytearray(records_offset + buf_len * len(records))
+    struct.pack_into(
+        "<10i", data, 0,
+        2, 1, tick_rate, 1, len(info), info_offset,
+        len(fields), var_header_offset, 1, buf_len,
+    )
+    struct.pack_into("<2i", data, 48, len(records), records_offset)
+    struct.pack_into("<Qddii", data, HEADER_SIZE, 0, 0.0, 0.0, 0, len(records))
+
+    for i, (name, var_type, var_offset, count) in enumerate(layouts):
+        struct.pack_into(
+            "<3i?3x32s64s32s", data, var_header_offset + i * VAR_HEADER_SIZE,
+            var_type, var_offset, count, False, name.encode(), b"", b"",
+        )
+    data[info_offset: info_offset + len(info)] = info
+
+    for index, record in enumerate(records):
+        base = records_offset + index * buf_len
+        for name, var_type, var_offset, count in layouts:
+            value = record[name]
+            items = value if count > 1 else (value,)
+            struct.pack_into(
+                "<" + VAR_TYPE_MAP[var_type] * count, data, base + var_offset, *items
+            )
+
+    path.write_bytes(bytes(data))
+    return path
+
+
+@pytest.fixture
+def ibt_file(tmp_path):
+    """Telemetry file with 10 records of SessionTime, Speed and lap progress."""
+    fields = [
+        ("SessionTime", DOUBLE, 1),
+        ("IsOnTrack", BOOL, 1),
+        ("Speed", FLOAT, 1),
+        ("CarIdxLapDistPct", FLOAT, 4),
+    ]
+    records = [
+        {
+            "SessionTime": i / 60,
+            "IsOnTrack": True,
+            "Speed": float(i),
+            "CarIdxLapDistPct": (0.0, i / 100, 0.5, -1.0),
+        }
+        for i in range(10)
+    ]
+    return write_ibt(tmp_path / "session.ibt", fields, records)
+
+
+@pytest.fixture
+def player_only_ibt_file(tmp_path):
+    """Telemetry file of the player's car only, without CarIdx arrays."""
+    fields = [
+        ("SessionTime", DOUBLE, 1),
+        ("IsOnTrack", BOOL, 1),
+        ("Speed", FLOAT, 1),
+    ]
+    records = [
+        {"SessionTime": i / 60, "IsOnTrack": True, "Speed": float(i)}
+        for i in range(3)
+    ]
+    return write_ibt(tmp_path / "player.ibt", fields, records)
+
+
+@pytest.fixture
+def special_name_ibt_file(tmp_path):
+    """Telemetry file whose driver name holds YAML syntax characters."""
+    session_info = SESSION_INFO_YAML.replace(
+        "UserName: Test Driver", "UserName: Team #1: O'Neil"
+    )
+    return write_ibt(
+        tmp_path / "names.ibt",
+        [("SessionTime", DOUBLE, 1)],
+        [{"SessionTime": 0.0}],
+        session_info=session_info,
+    )
@@ -0,0 +1,91 @@
+import threading
+import time
+
+from backend.services.irsdk.service import IRSDKService
+
+
+def _run_threads(targets, count=4):
+    errors = []
+
+    def wrap(target):
+        try:
+            target()
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    threads = [
+        threading.Thread(target=wrap, args=(target,))
+        for target in targets
+        for _ in range(count)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(5)
+    return errors
+
+
+def _guard_memory_map(mock_ir):
+    """Make the mock fail like pyirsdk when read during a reconnect."""
+    state = {"open": True}
+
+    def shutdown():
+        state["open"] = False
+        time.sleep(0.001)
+
+    def startup(test_file=None):
+        time.sleep(0.001)
+        state["open"] = True
+
+    def read(field):
+        if not state["open"]:
+            raise ValueError("mmap closed or invalid")
+        return mock_ir._values.get(field)
+
+    mock_ir.shutdown.side_effect = shutdown
+    mock_ir.startup.side_effect = startup
+    mock_ir._values = {"Speed": 10.0, "Gear": 3}
+    mock_ir.__getitem__.side_effect = read
+
+
+# --- Positive tests ---
+
+
+def test_live_reads_never_see_reconnect(irsdk_mock_factory):
+    service = IRSDKService()
+    service.ir = irsdk_mock_factory()
+    _guard_memory_map(service.ir)
+    service._ensure_connected()
+
+    def reconnect():
+        for _ in range(20):
+            with service._lock:
+                service._probe()
+
+    def read():
+        for _ in range(50):
+            assert service.get_value("Gear") == 3
+
+    assert _run_threads([reconnect, read]) == []
+
+
+def test_concurrent_refresh_captures_each_tick_once(ticking_irsdk_service):
+    var_buf = ticking_irsdk_service.ir._header.var_buf[0]
+    ticking_irsdk_service.get_frame()
+    var_buf.freeze.reset_mock()
+    ticking_irsdk_service.advance(Speed=20.0)
+
+    assert _run_threads([ticking_irsdk_service.get_frame], count=8) == []
+    var_buf.freeze.assert_called_once()
+
+
+def test_request_fields_during_capture(ticking_irsdk_service):
+    def register():
+        for i in range(50):
+            ticking_irsdk_service.request_fields([f"Field{i}"])
+
+    def capture():
+        for _ in range(50):
+            ticking_irsdk_service.get_frame()
+
+    assert _run_threads([register, capture], count=2) == []
@@ -0,0 +1,183 @@
+import pytest
+
+from backend.services.irsdk.connection import (
+    ConnectionState,
+    ConnectionSupervisor,
+)
+from backend.services.irsdk.sampler import TelemetrySampler
+from backend.services.irsdk.service import IRSDKService
+
+
+class FakeSim:
+    """Probe/release callbacks and a manual clock for the supervisor."""
+
+    def __init__(self):
+        self.now = 0.0
+        self.running = False
+        self.tick = 0
+        self.probes = 0
+        self.releases = 0
+
+    def probe(self) -> bool:
+        self.probes += 1
+        return self.running
+
+    def release(self) -> None:
+        self.releases += 1
+
+    def supervisor(self, **kwargs) -> ConnectionSupervisor:
+        return ConnectionSupervisor(
+            probe=self.probe,
+            release=self.release,
+            is_alive=lambda: self.running,
+            latest_tick=lambda: self.tick,
+            clock=lambda: self.now,
+            **kwargs,
+        )
+
+
+@pytest.fixture
+def sim():
+    return FakeSim()
+
+
+# --- Positive tests ---
+
+
+def test_connects_on_first_poll(sim):
+    sim.running = True
+    supervisor = sim.supervisor()
+
+    assert supervisor.poll() is ConnectionState.CONNECTED
+    assert supervisor.is_connected is True
+    assert sim.probes == 1
+
+
+def test_connected_poll_does_not_probe_again(sim):
+    sim.running = True
+    supervisor = sim.supervisor()
+
+    for _ in range(10):
+        sim.tick += 1
+        supervisor.poll()
+    assert sim.probes == 1
+
+
+def test_failed_probes_back_off_exponentially(sim):
+    supervisor = sim.supervisor(initial_backoff=0.5, max_backoff=2.0)
+
+    supervisor.poll()
+    assert supervisor.retry_in() == pytest.approx(0.5)
+
+    # Polling before the backoff elapsed does not probe.
+    sim.now = 0.4
+    supervisor.poll()
+    assert sim.probes == 1
+
+    sim.now = 0.5
+    supervisor.poll()
+    assert sim.probes == 2
+    assert supervisor.retry_in() == pytest.approx(1.0)
+
+    sim.now = 1.5
+    supervisor.poll()
+    sim.now = 3.5
+    supervisor.poll()
+    assert supervisor.retry_in() == pytest.approx(2.0)
+    assert sim.probes == 4
+
+
+def test_backoff_resets_after_connect(sim):
+    supervisor = sim.supervisor(initial_backoff=0.5)
+    supervisor.poll()
+    sim.now = 0.5
+    supervisor.poll()
+
+    sim.running = True
+    sim.now = 1.5
+    assert supervisor.poll() is ConnectionState.CONNECTED
+
+    sim.running = False
+    sim.now = 2.0
+    assert supervisor.poll() is ConnectionState.DISCONNECTED
+    assert sim.releases == 1
+
+    # Re-probed immediately, then the backoff starts from the beginning.
+    supervisor.poll()
+    assert supervisor.retry_in() == pytest.approx(0.5)
+
+
+def test_goes_stale_and_recovers(sim):
+    sim.running = True
+    supervisor = sim.supervisor(stale_after=2.0)
+    supervisor.poll()
+
+    sim.now = 2.5
+    assert supervisor.poll() is ConnectionState.STALE
+    assert supervisor.is_connected is True
+
+    sim.tick += 1
+    sim.now = 2.6
+    assert supervisor.poll() is ConnectionState.CONNECTED
+
+
+def test_listeners_receive_transitions(sim):
+    sim.running = True
+    supervisor = sim.supervisor(stale_after=1.0)
+    events = []
+    supervisor.add_listener(lambda old, new: events.append((old, new)))
+
+    supervisor.poll()
+    sim.now = 1.5
+    supervisor.poll()
+    sim.running = False
+    supervisor.poll()
+
+    assert events == [
+        (ConnectionState.DISCONNECTED, ConnectionState.PROBING),
+        (ConnectionState.PROBING, ConnectionState.CONNECTED),
+        (ConnectionState.CONNECTED, ConnectionState.STALE),
+        (ConnectionState.STALE, ConnectionState.DISCONNECTED),
+    ]
+
+
+def test_service_does_not_restart_on_every_call(irsdk_mock_factory):
+    service = IRSDKService()
+    service.ir = irsdk_mock_factory()
+
+    for _ in range(5):
+        assert service._ensure_connected() == (True, "")
+    service.ir.startup.assert_called_once()
+    service.ir.shutdown.assert_not_called()
+
+
+def test_sampler_idle_wait_follows_backoff(ticking_irsdk_service):
+    sampler = TelemetrySampler(
+        ticking_irsdk_service, poll_interval=0.01, idle_interval=5.0
+    )
+    ticking_irsdk_service.connection.retry_in = lambda: 2.0
+
+    assert sampler._next_wait(False) == pytest.approx(2.0)
+    assert sampler._next_wait(True) == pytest.approx(0.01)
+
+
+# --- Negative tests ---
+
+
+def test_service_rate_limits_probes_while_sim_is_down(irsdk_mock_factory):
+    service = IRSDKService()
+    service.ir = irsdk_mock_factory(is_connected=False)
+
+    for _ in range(5):
+        assert service._ensure_connected() == (False, "not connected")
+    service.ir.startup.assert_called_once()
+
+
+def test_service_releases_memory_map_when_sim_exits(irsdk_mock_factory):
+    service = IRSDKService()
+    service.ir = irsdk_mock_factory()
+    service._ensure_connected()
+
+    service.ir.is_connected = False
+    assert service._ensure_connected() == (False, "not connected")
+    service.ir.shutdown.assert_called_once()
@@ -0,0 +1,188 @@
+import irsdk
+import pytest
+
+from backend.services.irsdk.connection import ConnectionState
+from backend.services.irsdk.emulator import SimEmulator
+from backend.services.irsdk.scenario import (
+    CarClass,
+    DriverSwap,
+    PitStop,
+    Scenario,
+    SessionSpec,
+    multiclass_race,
+)
+from backend.services.irsdk.service import IRSDKService
+from backend.services.leaderboard.service import Leaderboard
+
+
+def _scenario(**kwargs):
+    data = dict(
+        name="test",
+        classes=(
+            CarClass(1, "GTP", 0xFFDA59, 10.0, 2),
+            CarClass(2, "GT3", 0xFF5888, 12.0, 2),
+        ),
+        sessions=(SessionSpec("Open Qualify", 5.0), SessionSpec("Race", 600.0)),
+        tick_rate=10,
+    )
+    data.update(kwargs)
+    return Scenario(**data)
+
+
+@pytest.fixture
+def emulator(tmp_path):
+    with SimEmulator(_scenario(), tmp_path / "irsdk.bin") as emulator:
+        yield emulator
+
+
+@pytest.fixture
+def emulated_service(emulator):
+    service = IRSDKService(test_file=str(emulator.path))
+    service.request_fields(["CarIdxLapDistPct", "CarIdxPosition"])
+    yield service
+    service.ir.shutdown()
+
+
+# --- Positive tests ---
+
+
+def test_pyirsdk_reads_emulated_memory(emulator):
+    ir = irsdk.IRSDK()
+    assert ir.startup(test_file=str(emulator.path))
+    try:
+        emulator.step(3)
+        ir.freeze_var_buffer_latest()
+        assert ir.is_connected
+        assert ir["SessionTick"] == 3
+        assert len(ir["CarIdxLapDistPct"]) == 64
+        assert ir["WeekendInfo"]["TrackID"] == 525
+        assert len(ir["DriverInfo"]["Drivers"]) == 5
+    finally:
+        ir.shutdown()
+
+
+def test_var_buffers_rotate(emulator):
+    emulator.step(5)
+    ir = irsdk.IRSDK()
+    ir.startup(test_file=str(emulator.path))
+    try:
+        ticks = sorted(buf.tick_count for buf in ir._header.var_buf)
+        assert ticks == [2, 3, 4, 5]
+    finally:
+        ir.shutdown()
+
+
+def test_freeze_latest_sets_pyirsdk_buffer(emulated_service, emulator):
+    # _freeze_latest() writes a private pyirsdk attribute, this fails
+    # loudly when a pyirsdk upgrade renames it.
+    emulated_service.connect()
+    emulator.step(5)
+    ir = emulated_service.ir
+
+    emulated_service._freeze_latest()
+
+    latest = max(ir._header.var_buf, key=lambda buf: buf.tick_count)
+    assert ir._var_buffer_latest is latest
+    assert ir["SessionTick"] == latest.tick_count
+    ir.unfreeze_var_buffer_latest()
+
+
+def test_service_frames_follow_ticks(emulated_service, emulator):
+    assert emulated_service.connect() == (True, "")
+    first = emulated_service.get_frame()
+
+    emulator.step()
+    second = emulated_service.get_frame()
+
+    assert second.tick_count == first.tick_count + 1
+    assert second.session_time > first.session_time
+
+
+def test_session_transition_bumps_session_info(emulated_service, emulator):
+    emulated_service.connect()
+    revision = emulated_service.ir.session_info_update
+
+    emulator.step(60)
+
+    assert emulated_service.get_value("SessionNum") == 1
+    assert emulated_service.get_value("SessionInfo")["CurrentSessionNum"] == 1
+    assert emulated_service.ir.session_info_update > revision
+
+
+def test_scripted_pit_stop(tmp_path):
+    scenario = _scenario(
+        sessions=(SessionSpec("Race", 600.0),),
+        pit_stops=(PitStop(1, 2, 5.0),),
+    )
+    with SimEmulator(scenario, tmp_path / "irsdk.bin") as emulator:
+        service = IRSDKService(test_file=str(emulator.path))
+        service.connect()
+
+        on_pit_road = False
+        for _ in range(400):
+            emulator.step()
+            if service.get_value("CarIdxOnPitRoad")[1]:
+                on_pit_road = True
+                break
+        service.ir.shutdown()
+
+    assert on_pit_road
+
+
+def test_driver_swap_updates_driver_info(tmp_path):
+    scenario = _scenario(
+        sessions=(SessionSpec("Race", 600.0),),
+        pit_stops=(PitStop(1, 1, 1.0),),
+        driver_swaps=(DriverSwap(1, 1, "Second Driver"),),
+    )
+    with SimEmulator(scenario, tmp_path / "irsdk.bin") as emulator:
+        service = IRSDKService(test_file=str(emulator.path))
+        service.connect()
+        emulator.step(300)
+        drivers = service.get_value("DriverInfo")["Drivers"]
+        service.ir.shutdown()
+
+    assert drivers[1]["UserName"] == "Second Driver"
+
+
+def test_multiclass_race_drives_leaderboard(tmp_path):
+    with SimEmulator(multiclass_race(), tmp_path / "irsdk.bin") as emulator:
+        service = IRSDKService(test_file=str(emulator.path))
+        leaderboard = Leaderboard(service)
+        emulator.step(60)
+
+        snapshot = leaderboard.get_snapshot()
+        service.ir.shutdown()
+
+    assert snapshot["multiclass"] is True
+    assert snapshot["player"]["car_idx"] == 1
+
+
+def test_scenario_round_trip():
+    scenario = _scenario(pit_stops=(PitStop(1, 2),))
+    assert Scenario.from_dict(scenario.to_dict()) == scenario
+
+
+def test_paused_sim_goes_stale(emulated_service, emulator):
+    clock = [0.0]
+    emulated_service.connection._clock = lambda: clock[0]
+    emulated_service.connect()
+
+    emulator.pause()
+    clock[0] = 5.0
+    emulated_service.connect()
+    assert emulated_service.connection.state is ConnectionState.STALE
+
+    emulator.resume()
+    emulator.step()
+    emulated_service.connect()
+    assert emulated_service.connection.state is ConnectionState.CONNECTED
+
+
+# --- Negative tests ---
+
+
+def test_too_many_cars(tmp_path):
+    scenario = _scenario(classes=(CarClass(1, "GT3", 0, 90.0, 64),))
+    with pytest.raises(ValueError):
+        SimEmulator(scenario, tmp_path / "irsdk.bin")
@@ -0,0 +1,86 @@
+import struct
+
+import pytest
+
+from backend.services.irsdk.frame import TelemetryFrame
+from backend.services.irsdk.reader import VarLayout
+
+np = pytest.importorskip("numpy")
+
+LAYOUTS = {
+    "CarIdxLap": VarLayout("CarIdxLap", 2, 0, 3),
+    "CarIdxLapDistPct": VarLayout("CarIdxLapDistPct", 4, 12, 3),
+    "CarIdxOnPitRoad": VarLayout("CarIdxOnPitRoad", 1, 24, 3),
+}
+
+
+@pytest.fixture
+def frame() -> TelemetryFrame:
+    """
+    Returns a frame backed by a frozen var buffer holding LAYOUTS.
+    """
+    buf = bytearray(27)
+    struct.pack_into("<3i", buf, 0, 4, 5, 6)
+    struct.pack_into("<3f", buf, 12, 0.25, 0.5, 0.75)
+    struct.pack_into("<3?", buf, 24, True, False, True)
+    return TelemetryFrame(
+        tick_count=1,
+        session_time=10.0,
+        values={"CarIdxLap": (4, 5, 6), "Gear": 3},
+        buffer=bytes(buf),
+        layouts=LAYOUTS,
+    )
+
+
+# --- Positive tests ---
+
+
+def test_array_is_zero_copy_view_over_buffer(frame):
+    laps = frame.array("CarIdxLap")
+
+    assert laps.tolist() == [4, 5, 6]
+    assert np.shares_memory(laps, np.frombuffer(frame.buffer, dtype=np.uint8))
+
+
+@pytest.mark.parametrize(
+    "name,expected",
+    [
+        ("CarIdxLapDistPct", [0.25, 0.5, 0.75]),
+        ("CarIdxOnPitRoad", [True, False, True]),
+    ],
+)
+def test_array_dtypes_follow_var_type(frame, name, expected):
+    assert frame.array(name).tolist() == pytest.approx(expected)
+
+
+def test_array_is_read_only(frame):
+    with pytest.raises(ValueError):
+        frame.array("CarIdxLap")[0] = 1
+
+
+def test_array_falls_back_to_stored_value():
+    frame = TelemetryFrame(
+        tick_count=1, session_time=None, values={"CarIdxLap": (1, 2)}
+    )
+    laps = frame.array("CarIdxLap")
+
+    assert laps.tolist() == [1, 2]
+    assert laps.flags.writeable is False
+
+
+def test_irsdk_service_get_array(ticking_irsdk_service):
+    ticking_irsdk_service.request_fields(["CarIdxLapDistPct"])
+    pct = ticking_irsdk_service.get_array("CarIdxLapDistPct")
+    assert pct.tolist() == pytest.approx([0.1, 0.2])
+
+
+# --- Negative tests ---
+
+
+def test_array_missing_field_returns_none(frame):
+    assert frame.array("NotCaptured") is None
+
+
+def test_array_without_numpy(frame, monkeypatch):
+    monkeypatch.setattr("backend.services.irsdk.frame.np", None)
+    assert frame.array("CarIdxLap") is None
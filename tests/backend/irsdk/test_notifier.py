@@ -0,0 +1,80 @@
+import asyncio
+import threading
+
+import pytest
+
+from backend.services.irsdk.notifier import FrameNotifier
+
+
+@pytest.fixture
+def sampled_irsdk_service(ticking_irsdk_service):
+    """
+    Returns the ticking IRSDKService as seen while the sampler runs.
+    """
+    ticking_irsdk_service.refresh_frame()
+    ticking_irsdk_service.sampling = True
+    ticking_irsdk_service._status = (True, "")
+    return ticking_irsdk_service
+
+
+def _publish_later(irsdk_service, delay=0.05):
+    def publish():
+        irsdk_service.advance(Speed=20.0)
+        irsdk_service.refresh_frame()
+
+    timer = threading.Timer(delay, publish)
+    timer.start()
+    return timer
+
+
+# --- Positive tests ---
+
+
+def test_wait_for_frame_wakes_on_published_frame(sampled_irsdk_service):
+    notifier = FrameNotifier(sampled_irsdk_service)
+    tick = sampled_irsdk_service.current_tick()
+
+    timer = _publish_later(sampled_irsdk_service)
+    result = asyncio.run(notifier.wait_for_frame(tick, 5))
+    timer.join()
+
+    assert result == tick + 1
+
+
+def test_many_waiters_hold_no_threads(sampled_irsdk_service):
+    notifier = FrameNotifier(sampled_irsdk_service)
+    tick = sampled_irsdk_service.current_tick()
+
+    async def scenario():
+        waits = [notifier.wait_for_frame(tick, 5) for _ in range(100)]
+        return await asyncio.wait_for(asyncio.gather(*waits), 3)
+
+    timer = _publish_later(sampled_irsdk_service, delay=0.2)
+    results = asyncio.run(scenario())
+    timer.join()
+
+    assert results == [tick + 1] * 100
+
+
+def test_wait_for_frame_returns_at_once_on_other_tick(sampled_irsdk_service):
+    notifier = FrameNotifier(sampled_irsdk_service)
+    tick = sampled_irsdk_service.current_tick()
+
+    assert asyncio.run(notifier.wait_for_frame(tick - 1, 5)) == tick
+
+
+# --- Negative tests ---
+
+
+def test_wait_for_frame_times_out(sampled_irsdk_service):
+    notifier = FrameNotifier(sampled_irsdk_service)
+    tick = sampled_irsdk_service.current_tick()
+
+    assert asyncio.run(notifier.wait_for_frame(tick, 0.05)) == tick
+
+
+def test_closed_notifier_stops_listening(sampled_irsdk_service):
+    notifier = FrameNotifier(sampled_irsdk_service)
+    notifier.close()
+
+    assert notifier._on_frame not in sampled_irsdk_service._frame_listeners
@@ -0,0 +1,115 @@
+import struct
+from types import SimpleNamespace
+
+import pytest
+
+from backend.services.irsdk.reader import FrameReader, VarLayout
+
+# irsdk var types: 1 = bool, 2 = int, 4 = float, 5 = double
+VAR_HEADERS = {
+    "SessionTime": SimpleNamespace(type=5, offset=0, count=1),
+    "PlayerCarIdx": SimpleNamespace(type=2, offset=8, count=1),
+    "IsOnTrack": SimpleNamespace(type=1, offset=12, count=1),
+    "CarIdxPosition": SimpleNamespace(type=2, offset=16, count=3),
+    "CarIdxLapDistPct": SimpleNamespace(type=4, offset=40, count=3),
+    "CarIdxOnPitRoad": SimpleNamespace(type=1, offset=60, count=3),
+}
+
+
+@pytest.fixture
+def buffer() -> bytes:
+    """
+    Returns a var buffer laid out according to VAR_HEADERS,
+    with unused gaps between some variables.
+    """
+    buf = bytearray(64)
+    struct.pack_into("<d", buf, 0, 123.5)
+    struct.pack_into("<i", buf, 8, 2)
+    struct.pack_into("<?", buf, 12, True)
+    struct.pack_into("<3i", buf, 16, 1, 2, 3)
+    struct.pack_into("<3f", buf, 40, 0.25, 0.5, 0.75)
+    struct.pack_into("<3?", buf, 60, False, True, False)
+    return bytes(buf)
+
+
+# --- Positive tests ---
+
+
+def test_reader_unpacks_all_fields_in_one_pass(buffer):
+    reader = FrameReader.compile(VAR_HEADERS, VAR_HEADERS.keys())
+
+    values = reader.unpack(buffer)
+
+    assert values["SessionTime"] == pytest.approx(123.5)
+    assert values["PlayerCarIdx"] == 2
+    assert values["IsOnTrack"] is True
+    assert values["CarIdxPosition"] == (1, 2, 3)
+    assert values["CarIdxLapDistPct"] == pytest.approx((0.25, 0.5, 0.75))
+    assert values["CarIdxOnPitRoad"] == (False, True, False)
+
+
+def test_reader_matches_per_field_unpack(buffer):
+    reader = FrameReader.compile(VAR_HEADERS, VAR_HEADERS.keys())
+    values = reader.unpack(buffer)
+
+    for name, header in VAR_HEADERS.items():
+        layout = VarLayout(name, header.type, header.offset, header.count)
+        expected = struct.unpack_from("<" + layout.fmt, buffer, header.offset)
+        assert values[name] == (expected if header.count > 1 else expected[0])
+
+
+def test_reader_subset_skips_gaps(buffer):
+    reader = FrameReader.compile(VAR_HEADERS, ["CarIdxOnPitRoad", "PlayerCarIdx"])
+
+    assert reader.fields == {"CarIdxOnPitRoad", "PlayerCarIdx"}
+    assert reader.size == 63 - 8
+    assert reader.unpack(buffer) == {
+        "PlayerCarIdx": 2,
+        "CarIdxOnPitRoad": (False, True, False),
+    }
+
+
+def test_reader_respects_buffer_offset(buffer):
+    reader = FrameReader.compile(VAR_HEADERS, ["PlayerCarIdx"])
+    assert reader.unpack(b"\x00" * 16 + buffer, 16) == {"PlayerCarIdx": 2}
+
+
+def test_irsdk_service_reads_frame_with_compiled_reader(
+    ticking_irsdk_service, buffer
+):
+    mock_ir = ticking_irsdk_service.ir
+    mock_ir._var_headers_dict = VAR_HEADERS
+    mock_ir._var_buffer_latest.get_memory.return_value = buffer
+    mock_ir._var_buffer_latest.buf_offset = 0
+    ticking_irsdk_service.request_fields(["CarIdxPosition", "PlayerCarIdx"])
+
+    values = ticking_irsdk_service.get_values(["CarIdxPosition", "PlayerCarIdx"])
+
+    assert values == {"CarIdxPosition": (1, 2, 3), "PlayerCarIdx": 2}
+    read_keys = {c.args[0] for c in mock_ir.__getitem__.call_args_list}
+    assert "CarIdxPosition" not in read_keys
+    assert "PlayerCarIdx" not in read_keys
+
+
+# --- Negative tests ---
+
+
+def test_reader_ignores_fields_without_var_header(buffer):
+    reader = FrameReader.compile(VAR_HEADERS, ["DriverInfo", "PlayerCarIdx"])
+
+    assert reader.fields == {"PlayerCarIdx"}
+    assert reader.unpack(buffer) == {"PlayerCarIdx": 2}
+
+
+def test_empty_reader_returns_empty_dict():
+    assert FrameReader([]).unpack(b"") == {}
+
+
+def test_reader_rejects_overlapping_layouts():
+    with pytest.raises(ValueError):
+        FrameReader(
+            [
+                VarLayout("A", 2, 0, 2),
+                VarLayout("B", 2, 4, 1),
+            ]
+        )
@@ -0,0 +1,170 @@
+import threading
+
+import pytest
+
+from backend.services.irsdk import recording as recording_module
+from backend.services.irsdk.recording import (
+    RECORDING_MAGIC,
+    RecordingFile,
+    RecordingReplayService,
+    SessionRecorder,
+)
+from backend.services.irsdk.replay import IBTReplayService
+
+
+def _record(ibt_file, path, chunk_frames=4):
+    """Record every record of ibt_file through a SessionRecorder."""
+    source = IBTReplayService(ibt_file, speed=None)
+    source.request_fields(["Speed", "CarIdxLapDistPct", "DriverInfo"])
+    source.connect()
+
+    recorder = SessionRecorder(source, path, chunk_frames=chunk_frames)
+    recorder.start()
+    while True:
+        source.refresh_frame()
+        if source.finished:
+            break
+        source.step()
+    recorder.stop()
+    return path
+
+
+@pytest.fixture
+def recording(ibt_file, tmp_path):
+    return _record(ibt_file, tmp_path / "session.rwrec")
+
+
+def _replay(path, **kwargs):
+    service = RecordingReplayService(path, **kwargs)
+    service.request_fields(["Speed", "CarIdxLapDistPct"])
+    service.connect()
+    return service
+
+
+# --- Positive tests ---
+
+
+def test_recording_index(recording):
+    rec = RecordingFile(recording)
+    try:
+        assert rec.frame_count == 10
+        assert [chunk.count for chunk in rec.chunks] == [4, 4, 2]
+        assert [chunk.first_frame for chunk in rec.chunks] == [0, 4, 8]
+    finally:
+        rec.close()
+
+
+def test_replay_reproduces_recorded_frames(recording):
+    service = _replay(recording, speed=None)
+
+    speeds = []
+    for _ in range(10):
+        speeds.append(service.get_frame().get("Speed"))
+        service.step()
+    assert speeds == [float(i) for i in range(10)]
+    assert service.get_frame().get("CarIdxLapDistPct") == pytest.approx(
+        (0.0, 0.09, 0.5, -1.0)
+    )
+
+
+def test_replay_serves_recorded_session_info(recording):
+    service = _replay(recording, speed=None)
+    drivers = service.get_value("DriverInfo")["Drivers"]
+    assert drivers[1]["UserName"] == "Test Driver"
+
+
+def test_seek_to_session_time(recording):
+    service = _replay(recording, speed=None)
+
+    service.seek(5 / 60)
+    assert service.position == 5
+    assert service.get_frame().get("Speed") == pytest.approx(5.0)
+
+    service.seek(1 / 60 + 0.001)
+    assert service.position == 1
+
+
+def test_paced_replay_follows_timeline(recording):
+    clock = [0.0]
+    service = _replay(recording, clock=lambda: clock[0])
+
+    clock[0] = 3 / 60
+    service.refresh_frame()
+    assert service.position == 3
+
+
+def test_timeline_continues_across_session_restart(tmp_path):
+    recorder = SessionRecorder(irsdk_service=None, path=tmp_path / "x.rwrec")
+
+    class Frame:
+        def __init__(self, session_time):
+            self.session_time = session_time
+
+    times = [recorder._timeline(Frame(t)) for t in (10.0, 11.0, 0.0, 1.0)]
+    assert times == [10.0, 11.0, 11.0, 12.0]
+
+
+def test_recorder_writes_on_writer_thread(ibt_file, tmp_path, monkeypatch):
+    threads = set()
+    encode_chunk = recording_module.encode_chunk
+
+    def spy_encode_chunk(frames, times):
+        threads.add(threading.current_thread().name)
+        return encode_chunk(frames, times)
+
+    monkeypatch.setattr(recording_module, "encode_chunk", spy_encode_chunk)
+
+    _record(ibt_file, tmp_path / "threaded.rwrec")
+
+    assert threads == {"session-recorder"}
+
+
+# --- Negative tests ---
+
+
+def test_truncated_recording_keeps_complete_chunks(recording):
+    data = recording.read_bytes()
+    recording.write_bytes(data[:-10])
+
+    rec = RecordingFile(recording)
+    try:
+        assert rec.frame_count == 8
+    finally:
+        rec.close()
+
+
+def test_not_a_recording(tmp_path):
+    path = tmp_path / "bad.rwrec"
+    path.write_bytes(b"garbage!" * 4)
+    with pytest.raises(ValueError):
+        RecordingFile(path)
+
+
+def test_replay_of_invalid_file_is_not_connected(tmp_path):
+    path = tmp_path / "empty.rwrec"
+    path.write_bytes(b"")
+    service = RecordingReplayService(path)
+    assert service.connect() == (False, "not connected")
+
+
+def test_recorder_skips_session_info_of_replaced_revision(
+    ibt_file, tmp_path, monkeypatch
+):
+    # The sim already moved on to another revision when it is read.
+    monkeypatch.setattr(
+        IBTReplayService, "get_session_info", lambda self: (99, "---\n")
+    )
+    path = _record(ibt_file, tmp_path / "replaced.rwrec")
+
+    service = _replay(path, speed=None)
+    assert service.get_value("DriverInfo") is None
+    assert service.recording.session_info_yaml(99) == ""
+
+
+def test_recorder_ignores_frames_without_buffer(tmp_path, ticking_irsdk_service):
+    path = tmp_path / "mock.rwrec"
+    recorder = SessionRecorder(ticking_irsdk_service, path)
+    recorder.start()
+    ticking_irsdk_service.get_frame()
+    recorder.stop()
+    assert path.read_bytes() == RECORDING_MAGIC
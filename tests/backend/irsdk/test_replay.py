@@ -0,0 +1,164 @@
+import pytest
+
+from backend.services.irsdk.replay import IBTReplayService
+from backend.services.irsdk.sampler import TelemetrySampler
+from backend.services.leaderboard.service import Leaderboard
+from backend.services.radar.service import RadarService
+from backend.services.track_map.service import TrackMapService
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 100.0
+
+    def __call__(self):
+        return self.now
+
+
+def _replay(path, **kwargs):
+    service = IBTReplayService(path, **kwargs)
+    service.request_fields(["Speed", "CarIdxLapDistPct"])
+    return service
+
+
+# --- Positive tests ---
+
+
+def test_fast_replay_serves_one_record_per_step(ibt_file):
+    service = _replay(ibt_file, speed=None)
+    assert service._ensure_connected() == (True, "")
+
+    speeds = []
+    for _ in range(3):
+        speeds.append(service.get_frame().get("Speed"))
+        service.step()
+    assert speeds == [0.0, 1.0, 2.0]
+    assert service.get_frame().tick_count == 3
+
+
+def test_replay_frame_matches_record(ibt_file):
+    service = _replay(ibt_file, speed=None)
+    service._ensure_connected()
+    service.step()
+
+    frame = service.get_frame()
+    assert frame.session_time == pytest.approx(1 / 60)
+    assert frame.get("IsOnTrack") is True
+    assert frame.get("CarIdxLapDistPct") == pytest.approx((0.0, 0.01, 0.5, -1.0))
+
+
+def test_realtime_replay_follows_clock(ibt_file):
+    clock = FakeClock()
+    service = _replay(ibt_file, clock=clock)
+    service._ensure_connected()
+
+    service.refresh_frame()
+    assert service.position == 0
+
+    clock.now += 5 / 60
+    service.refresh_frame()
+    assert service.position == 5
+
+
+def test_speed_multiplier(ibt_file):
+    clock = FakeClock()
+    service = _replay(ibt_file, speed=4.0, clock=clock)
+    service._ensure_connected()
+
+    clock.now += 1 / 60
+    service.refresh_frame()
+    assert service.position == 4
+
+
+def test_replay_stops_at_last_record(ibt_file):
+    service = _replay(ibt_file, speed=None)
+    service._ensure_connected()
+
+    for _ in range(15):
+        service.step()
+    assert service.position == 9
+    assert service.finished is True
+
+
+def test_replay_loops(ibt_file):
+    service = _replay(ibt_file, speed=None, loop=True)
+    service._ensure_connected()
+
+    for _ in range(10):
+        service.step()
+    assert service.position == 0
+    assert service.finished is False
+
+
+def test_session_info_sections(ibt_file):
+    service = _replay(ibt_file, speed=None)
+    service._ensure_connected()
+
+    weekend = service.get_value("WeekendInfo")
+    drivers = service.get_value("DriverInfo")["Drivers"]
+    assert weekend["TrackName"] == "spa"
+    assert drivers[1]["UserName"] == "Test Driver"
+    assert service.get_value("WeekendInfo") is weekend
+
+
+def test_session_info_with_special_driver_name(special_name_ibt_file):
+    service = IBTReplayService(special_name_ibt_file, speed=None)
+    service._ensure_connected()
+
+    drivers = service.get_value("DriverInfo")["Drivers"]
+    assert drivers[1]["UserName"] == "Team #1: O'Neil"
+
+
+def test_live_read_of_unrequested_field(ibt_file):
+    service = IBTReplayService(ibt_file, speed=None)
+    service._ensure_connected()
+    service.step()
+
+    assert service.get_value("Speed") == pytest.approx(1.0)
+
+
+def test_array_view(ibt_file):
+    np = pytest.importorskip("numpy")
+    service = _replay(ibt_file, speed=None)
+    service._ensure_connected()
+    service.refresh_frame()
+
+    array = service.get_array("CarIdxLapDistPct")
+    assert array.dtype == np.float32
+    assert array.flags.writeable is False
+
+
+def test_sampler_drives_replay(ibt_file):
+    service = _replay(ibt_file, speed=None)
+    sampler = TelemetrySampler(service)
+
+    assert sampler.run_once() == (True, True)
+    assert sampler.run_once() == (True, True)
+    assert service.get_frame().get("Speed") == pytest.approx(1.0)
+
+
+# --- Negative tests ---
+
+
+def test_missing_file_is_not_connected(tmp_path):
+    service = IBTReplayService(tmp_path / "missing.ibt")
+    assert service._ensure_connected() == (False, "not connected")
+    assert service.get_frame().tick_count == -1
+
+
+def test_player_only_file_does_not_drive_car_overlays(player_only_ibt_file):
+    service = IBTReplayService(player_only_ibt_file, speed=None)
+    leaderboard = Leaderboard(service)
+    track_map = TrackMapService(service)
+    radar = RadarService(service)
+    service._ensure_connected()
+    service.step()
+
+    assert leaderboard.get_snapshot()["status"] == "waiting"
+    assert radar.get_snapshot()["status"] == "waiting"
+    assert track_map.get_snapshot(["cars"])["cars"] == []
+
+
+def test_invalid_speed():
+    with pytest.raises(ValueError):
+        IBTReplayService("session.ibt", speed=0)
@@ -0,0 +1,90 @@
+import time
+
+import pytest
+
+from backend.services.irsdk.frame import EMPTY_FRAME
+from backend.services.irsdk.sampler import TelemetrySampler
+
+
+def _wait_until(predicate, timeout=1.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.005)
+    return False
+
+
+# --- Positive tests ---
+
+
+def test_run_once_publishes_frame_on_new_tick(ticking_irsdk_service):
+    sampler = TelemetrySampler(ticking_irsdk_service)
+
+    assert sampler.run_once() == (True, True)
+    assert sampler.run_once() == (True, False)
+
+    ticking_irsdk_service.advance(Speed=12.0)
+    assert sampler.run_once() == (True, True)
+    assert ticking_irsdk_service.get_frame().get("Speed") == pytest.approx(12.0)
+
+
+def test_run_once_waits_for_sim_data_once(ticking_irsdk_service):
+    sampler = TelemetrySampler(ticking_irsdk_service)
+
+    assert sampler.run_once() == (True, True)
+
+    ticking_irsdk_service.ir._wait_valid_data_event.assert_called_once()
+    ticking_irsdk_service.ir.freeze_var_buffer_latest.assert_not_called()
+
+
+def test_requests_only_read_published_frame(ticking_irsdk_service):
+    sampler = TelemetrySampler(ticking_irsdk_service)
+    sampler.run_once()
+    ticking_irsdk_service.sampling = True
+
+    ticking_irsdk_service.advance(Speed=50.0)
+    reads = ticking_irsdk_service.ir.__getitem__.call_count
+
+    assert ticking_irsdk_service.get_value("Speed") == pytest.approx(10.0)
+    assert ticking_irsdk_service.get_value("NotCaptured") is None
+    assert ticking_irsdk_service.ir.__getitem__.call_count == reads
+
+
+def test_ensure_connected_returns_sampler_status(ticking_irsdk_service):
+    ticking_irsdk_service.sampling = True
+    ticking_irsdk_service._status = (False, "not connected")
+
+    assert ticking_irsdk_service._ensure_connected() == (False, "not connected")
+    ticking_irsdk_service.ir.startup.assert_not_called()
+
+
+def test_start_and_stop_thread(ticking_irsdk_service):
+    sampler = TelemetrySampler(ticking_irsdk_service, poll_interval=0.001)
+
+    sampler.start()
+    try:
+        assert sampler.is_running
+        assert ticking_irsdk_service.sampling is True
+
+        ticking_irsdk_service.advance(Speed=30.0)
+        assert _wait_until(
+            lambda: ticking_irsdk_service.get_frame().get("Speed") == 30.0
+        )
+    finally:
+        sampler.stop()
+
+    assert not sampler.is_running
+    assert ticking_irsdk_service.sampling is False
+
+
+# --- Negative tests ---
+
+
+def test_run_once_publishes_empty_frame_when_disconnected(ticking_irsdk_service):
+    sampler = TelemetrySampler(ticking_irsdk_service)
+    sampler.run_once()
+    ticking_irsdk_service.ir.is_connected = False
+
+    assert sampler.run_once() == (False, False)
+    assert ticking_irsdk_service.get_frame() is EMPTY_FRAME
@@ -0,0 +1,148 @@
+from types import MappingProxyType
+
+import pytest
+
+from backend.services.irsdk import session_info as session_info_module
+from backend.services.irsdk.session_info import (
+    SessionInfoCache,
+    decode_session_info,
+    freeze,
+    parse_section,
+)
+
+SESSION_INFO_YAML = """---
+WeekendInfo:
+ TrackName: test_track
+ TrackID: 123
+
+SessionInfo:
+ CurrentSessionNum: 1
+ Sessions:
+ - SessionNum: 0
+   SessionType: Lone Qualify
+ - SessionNum: 1
+   SessionType: Race
+
+DriverInfo:
+ DriverCarIdx: 0
+ Drivers:
+ - CarIdx: 0
+   UserName: Driver One
+ - CarIdx: 1
+   UserName: Driver Two
+
+...
+"""
+
+
+# --- parse_section tests ---
+
+
+def test_parse_section_returns_requested_section():
+    drivers = parse_section(SESSION_INFO_YAML, "DriverInfo")
+
+    assert drivers["DriverCarIdx"] == 0
+    assert [d["UserName"] for d in drivers["Drivers"]] == [
+        "Driver One",
+        "Driver Two",
+    ]
+
+
+def test_parse_section_only_loads_section_text(monkeypatch):
+    loaded: list[str] = []
+    real_load = session_info_module.yaml.load
+
+    def spy_load(text, Loader):
+        loaded.append(text)
+        return real_load(text, Loader=Loader)
+
+    monkeypatch.setattr(session_info_module.yaml, "load", spy_load)
+
+    assert parse_section(SESSION_INFO_YAML, "WeekendInfo")["TrackID"] == 123
+    assert "DriverInfo" not in loaded[0]
+    assert "SessionInfo" not in loaded[0]
+
+
+def test_parse_section_quotes_driver_names():
+    yaml_text = SESSION_INFO_YAML.replace(
+        "UserName: Driver Two", "UserName: O'Neil: \"Fast\" #2"
+    )
+
+    drivers = parse_section(yaml_text, "DriverInfo")["Drivers"]
+
+    assert drivers[1]["UserName"] == "O'Neil: \"Fast\" #2"
+
+
+def test_decode_session_info_strips_non_printable():
+    raw = "DriverInfo:\n UserName: Dri\x07ver\n".encode("cp1252") + b"\x00\x00"
+
+    assert decode_session_info(raw) == "DriverInfo:\n UserName: Driver\n"
+
+
+def test_parse_section_missing_returns_none():
+    assert parse_section(SESSION_INFO_YAML, "CarSetup") is None
+
+
+def test_parse_section_invalid_yaml_returns_none():
+    yaml_text = SESSION_INFO_YAML.replace("TrackID: 123", "TrackID: [123")
+
+    assert parse_section(yaml_text, "WeekendInfo") is None
+
+
+# --- freeze tests ---
+
+
+def test_freeze_returns_read_only_structures():
+    frozen = freeze({"Drivers": [{"CarIdx": 0}]})
+
+    assert isinstance(frozen, MappingProxyType)
+    assert isinstance(frozen["Drivers"], tuple)
+    with pytest.raises(TypeError):
+        frozen["Drivers"][0]["CarIdx"] = 1
+
+
+# --- SessionInfoCache tests ---
+
+
+def test_cache_loads_section_once_per_revision():
+    calls: list[str] = []
+
+    def load(section):
+        calls.append(section)
+        return {"Drivers": []}
+
+    cache = SessionInfoCache()
+    first = cache.get("DriverInfo", 1, load)
+    second = cache.get("DriverInfo", 1, load)
+    cache.get("WeekendInfo", 1, load)
+
+    assert first is second
+    assert calls == ["DriverInfo", "WeekendInfo"]
+
+    cache.get("DriverInfo", 2, load)
+    assert calls == ["DriverInfo", "WeekendInfo", "DriverInfo"]
+
+
+def test_irsdk_service_parses_session_info_per_update(ticking_irsdk_service):
+    mock_ir = ticking_irsdk_service.ir
+    mock_ir.session_info_update = 1
+    mock_ir.__getitem__.side_effect = lambda key: {"Drivers": [{"CarIdx": 0}]}
+    ticking_irsdk_service.request_fields(["DriverInfo"])
+
+    def driver_info_reads():
+        return sum(
+            1 for c in mock_ir.__getitem__.call_args_list if c.args == ("DriverInfo",)
+        )
+
+    for _ in range(3):
+        ticking_irsdk_service.advance()
+        driver_info = ticking_irsdk_service.get_value("DriverInfo")
+
+    assert driver_info_reads() == 1
+    assert isinstance(driver_info, MappingProxyType)
+    assert ticking_irsdk_service.get_frame().session_info_update == 1
+
+    mock_ir.session_info_update = 2
+    ticking_irsdk_service.advance()
+    ticking_irsdk_service.get_value("DriverInfo")
+    assert driver_info_reads() == 2
@@ -1,6 +1,7 @@
 import pytest
 from typing import Callable
 
+from backend.services.drivers import DriverTable
 from backend.services.leaderboard.lap_times.service import LapTimeService
 from backend.services.leaderboard.neighbords import NeighborsService
 from backend.services.leaderboard.context import LeaderboardContext
@@ -73,8 +74,15 @@ def mock_ctx(mock_values: Callable) -> LeaderboardContext:
         "multiclass": False,
     }
 
+    # One table for every context, as Leaderboard keeps one: records
+    # of unchanged drivers stay the same objects between contexts.
+    driver_table = DriverTable()
+
     def _make_ctx(**overrides):
         data = {**defaults, **overrides}
+        if "driver_table" not in data:
+            driver_table.update({"Drivers": data["drivers"]})
+            data["driver_table"] = driver_table
         return LeaderboardContext(**data)
 
     return _make_ctx
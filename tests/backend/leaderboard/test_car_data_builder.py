@@ -14,6 +14,16 @@ def test_builder_returns_none_for_pace_car(mock_ctx, mock_builder):
     assert result is None
 
 
+def test_forget_pit_data_drops_given_cars(mock_builder):
+    mock_builder._last_pit_laps = {0: 5, 1: 3}
+    mock_builder._pit_exit_times = {0: 1234567890.0}
+
+    mock_builder.forget_pit_data({0})
+
+    assert mock_builder._last_pit_laps == {1: 3}
+    assert mock_builder._pit_exit_times == {}
+
+
 def test_reset_pit_data_clears_dicts(mock_builder):
     mock_builder._last_pit_laps = {0: 5}
     mock_builder._pit_exit_times = {0: 1234567890.0}
@@ -24,21 +34,6 @@ def test_reset_pit_data_clears_dicts(mock_builder):
     assert mock_builder._pit_exit_times == {}
 
 
-@pytest.mark.parametrize(
-    "username,expected",
-    [
-        ("Driver One", "Driver"),
-        (" SingleName ", "SingleName"),
-        ("", ""),
-        ("   ", ""),
-    ],
-)
-def test_get_first_name_variants(mock_values, mock_lap_times, username, expected):
-    mock_builder = CarDataBuilder(mock_values, mock_lap_times)
-    driver = {"UserName": username}
-    assert mock_builder._get_first_name(driver) == expected
-
-
 @pytest.mark.parametrize(
     "lap_dist,expected",
     [
@@ -74,20 +69,22 @@ def test_resolve_position_normal_and_negative(mock_builder, mock_ctx):
     assert mock_builder._resolve_position(1, ctx) == 3
 
 
-def test_get_starting_position_from_qualify_stats(mock_builder):
-    pos = mock_builder._get_starting_position(
-        car_idx=1, field="Position", offset=0
-    )
+def test_grid_index_starting_position_from_qualify_stats(mock_builder):
+    pos = mock_builder.grid_index().starting_position(1, multiclass=False)
     assert pos == 2
 
 
-def test_get_starting_position_missing_qualify(mock_builder):
-    pos = mock_builder._get_starting_position(
-        car_idx=999, field="Position", offset=0
-    )
+def test_grid_index_starting_position_missing_qualify(mock_builder):
+    pos = mock_builder.grid_index().starting_position(999, multiclass=False)
     assert pos == 0
 
 
+def test_grid_index_built_once_per_session_info(mock_builder):
+    grid = mock_builder.grid_index()
+
+    assert mock_builder.grid_index() is grid
+
+
 def test_starting_position_falls_back_to_race(mock_builder, mock_ctx):
     ctx = mock_ctx(positions=[0])
     result = mock_builder.build(0, ctx)
@@ -197,3 +194,20 @@ def test_build_all_sorted_by_position(mock_builder, mock_ctx):
 
     positions = [car["pos"] for car in cars]
     assert positions == sorted(positions)
+
+
+def test_build_table_keys_cars_by_index(mock_builder, mock_ctx):
+    table = mock_builder.build_table(mock_ctx())
+
+    assert sorted(table) == [0, 1, 2]
+    assert all(car["car_idx"] == idx for idx, car in table.items())
+
+
+def test_build_all_uses_given_table(mock_builder, mock_ctx):
+    ctx = mock_ctx()
+    table = mock_builder.build_table(ctx)
+
+    cars = mock_builder.build_all(ctx, exclude_idx=1, table=table)
+
+    assert [car["car_idx"] for car in cars] == [0, 2]
+    assert all(car is table[car["car_idx"]] for car in cars)
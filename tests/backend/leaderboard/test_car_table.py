@@ -0,0 +1,180 @@
+from backend.services.leaderboard.car_table import CarTable
+
+
+# --- Positive tests ---
+
+
+def test_car_table_rows_match_builder(mock_ctx, mock_builder):
+    ctx = mock_ctx()
+    expected = mock_builder.build_table(ctx)
+    mock_builder.reset_pit_data()
+
+    rows = CarTable(mock_builder).update(ctx)
+
+    assert rows == expected
+    assert list(rows[0]) == list(expected[0])
+
+
+def test_car_table_first_update_marks_every_car_dirty(mock_ctx, mock_builder):
+    table = CarTable(mock_builder)
+
+    table.update(mock_ctx())
+
+    assert table.dirty == {0, 1, 2}
+    assert table.removed == frozenset()
+    assert [row["car_idx"] for row in table.sorted_rows()] == [0, 1, 2]
+
+
+def test_car_table_reuses_unchanged_rows(mock_ctx, mock_builder):
+    table = CarTable(mock_builder)
+    ctx = mock_ctx()
+    first = dict(table.update(ctx))
+
+    second = table.update(ctx)
+
+    assert table.dirty == frozenset()
+    assert all(second[idx] is first[idx] for idx in first)
+
+
+def test_car_table_marks_only_changed_cars_dirty(mock_ctx, mock_builder):
+    table = CarTable(mock_builder)
+    first = dict(table.update(mock_ctx()))
+
+    rows = table.update(mock_ctx(lap_dist_pct=[0.6, 0.35, 0.9]))
+
+    assert table.dirty == {1}
+    assert rows[1]["lap_dist_pct"] == 0.35
+    assert rows[0] is first[0]
+    assert first[1]["lap_dist_pct"] == 0.3
+
+
+def test_car_table_builds_only_cars_with_changed_inputs(
+    mock_ctx, mock_builder, monkeypatch
+):
+    table = CarTable(mock_builder)
+    table.update(mock_ctx())
+    built = []
+    build = mock_builder.build
+    monkeypatch.setattr(
+        mock_builder, "build", lambda idx, ctx: built.append(idx) or build(idx, ctx)
+    )
+
+    table.update(mock_ctx(
+        lap_dist_pct=[0.7, 0.4, 0.95], last_lap_times=[80.0, 81.0, 82.2]
+    ))
+
+    assert built == [1]
+    assert table.dirty == {0, 1, 2}
+
+
+def test_car_table_rebuilds_row_on_pit_exit_timeout(
+    mock_ctx, mock_builder, monkeypatch
+):
+    now = [1000.0]
+    monkeypatch.setattr(
+        "backend.services.leaderboard.car_data_builder.time.time",
+        lambda: now[0],
+    )
+    table = CarTable(mock_builder)
+    table.update(mock_ctx(is_pitroad=[True, False, False]))
+    ctx = mock_ctx()
+    assert table.update(ctx)[0]["last_pit_lap"] == "OUT L5"
+
+    now[0] += 6
+    rows = table.update(ctx)
+
+    assert rows[0]["last_pit_lap"] == "L5"
+    assert table.dirty == {0}
+
+
+def test_car_table_resorts_on_position_change(mock_ctx, mock_builder):
+    table = CarTable(mock_builder)
+    table.update(mock_ctx())
+
+    table.update(mock_ctx(positions=[2, 1, 3]))
+
+    assert [row["car_idx"] for row in table.sorted_rows()] == [1, 0, 2]
+
+
+def test_car_table_keeps_order_without_position_change(
+    mock_ctx, mock_builder, monkeypatch
+):
+    table = CarTable(mock_builder)
+    table.update(mock_ctx())
+    sort_calls = []
+    monkeypatch.setattr(
+        "backend.services.leaderboard.car_table.CarSorter.sort",
+        lambda cars: sort_calls.append(cars) or cars,
+    )
+
+    table.update(mock_ctx(lap_dist_pct=[0.7, 0.4, 0.95]))
+
+    assert sort_calls == []
+
+
+def test_car_table_sorted_rows_excludes_car(mock_ctx, mock_builder):
+    table = CarTable(mock_builder)
+    table.update(mock_ctx())
+
+    assert [row["car_idx"] for row in table.sorted_rows(exclude_idx=0)] == [1, 2]
+
+
+def test_car_table_driver_swap_updates_name(mock_ctx, mock_builder):
+    table = CarTable(mock_builder)
+    ctx = mock_ctx()
+    table.update(ctx)
+    drivers = [dict(driver) for driver in ctx.drivers]
+    drivers[2]["UserName"] = "Other Driver"
+
+    rows = table.update(mock_ctx(drivers=drivers))
+
+    assert rows[2]["name"] == "Other"
+    assert table.dirty == {2}
+
+
+def test_car_table_reports_removed_cars(mock_ctx, mock_builder):
+    table = CarTable(mock_builder)
+    ctx = mock_ctx()
+    table.update(ctx)
+
+    rows = table.update(mock_ctx(drivers=ctx.drivers[:2]))
+
+    assert set(rows) == {0, 1}
+    assert table.removed == {2}
+    assert [row["car_idx"] for row in table.sorted_rows()] == [0, 1]
+
+
+def test_car_table_rows_keyed_by_car_idx_field(mock_ctx, mock_builder):
+    ctx = mock_ctx()
+    drivers = [
+        {**ctx.drivers[0], "CarIdx": 0},
+        {**ctx.drivers[2], "CarIdx": 2},
+    ]
+
+    rows = CarTable(mock_builder).update(mock_ctx(drivers=drivers))
+
+    assert set(rows) == {0, 2}
+    assert rows[2]["name"] == "Driver3"
+    assert rows[2]["lap_dist_pct"] == 0.9
+
+
+def test_car_table_reset_rebuilds_every_row(mock_ctx, mock_builder):
+    table = CarTable(mock_builder)
+    table.update(mock_ctx())
+
+    table.reset()
+    table.update(mock_ctx())
+
+    assert table.dirty == {0, 1, 2}
+
+
+# --- Negative tests ---
+
+
+def test_car_table_skips_pace_car(mock_ctx, mock_builder):
+    table = CarTable(mock_builder)
+
+    rows = table.update(mock_ctx(drivers=[{"UserName": "PACE CAR"}]))
+
+    assert rows == {}
+    assert table.sorted_rows() == []
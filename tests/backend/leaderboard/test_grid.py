@@ -0,0 +1,61 @@
+from backend.services.leaderboard.grid import GridIndex
+
+SESSION_INFO = {
+    "Sessions": [
+        {
+            "SessionType": "Practice",
+            "ResultsPositions": [
+                {"CarIdx": 0, "Position": 9, "ClassPosition": 8},
+            ],
+        },
+        {
+            "SessionType": "Lone Qualify",
+            "ResultsPositions": [
+                {"CarIdx": 0, "Position": 2, "ClassPosition": 1},
+                {"CarIdx": 1, "Position": 1, "ClassPosition": 0},
+            ],
+        },
+        {
+            "SessionType": "Warmup",
+            "ResultsPositions": [
+                {"CarIdx": 0, "Position": 5, "ClassPosition": 4},
+                {"CarIdx": 2, "Position": 3, "ClassPosition": 0},
+            ],
+        },
+    ]
+}
+
+
+# --- Positive tests ---
+
+
+def test_grid_index_uses_first_grid_session_of_each_car():
+    grid = GridIndex.from_session_info(SESSION_INFO)
+
+    assert grid.positions == {0: 2, 1: 1, 2: 3}
+    assert grid.class_positions == {0: 1, 1: 0, 2: 0}
+
+
+def test_grid_index_starting_position():
+    grid = GridIndex.from_session_info(SESSION_INFO)
+
+    assert grid.starting_position(0, multiclass=False) == 2
+    assert grid.starting_position(0, multiclass=True) == 2
+    assert grid.starting_position(2, multiclass=True) == 1
+
+
+# --- Negative tests ---
+
+
+def test_grid_index_car_not_on_grid():
+    grid = GridIndex.from_session_info(SESSION_INFO)
+
+    assert grid.starting_position(7, multiclass=False) == 0
+    assert grid.starting_position(7, multiclass=True) == 0
+
+
+def test_grid_index_without_sessions():
+    grid = GridIndex.from_session_info({"Sessions": None})
+
+    assert grid.positions == {}
+    assert grid.starting_position(0, multiclass=False) == 0
@@ -1,6 +1,7 @@
 import pytest
 from unittest.mock import MagicMock
 
+from backend.services.irsdk.frame import TelemetryFrame
 from backend.services.leaderboard.context import LeaderboardContext
 from backend.services.leaderboard.service import Leaderboard
 
@@ -49,6 +50,43 @@ def test_leaderboard_snapshot_structure(mock_service):
     assert all(k in snapshot for k in keys)
 
 
+def test_leaderboard_builds_requested_sections_only(mock_service):
+    mock_service.car_table.sorted_rows = MagicMock(side_effect=AssertionError)
+    mock_service.neighbors.get_neighbors = MagicMock(side_effect=AssertionError)
+
+    snapshot = mock_service.get_snapshot(sections=["player", "leaderboard_data"])
+
+    assert "player" in snapshot
+    assert "leaderboard_data" in snapshot
+    assert "cars" not in snapshot
+    assert "neighbors" not in snapshot
+    mock_service.car_table.sorted_rows.assert_not_called()
+    mock_service.neighbors.get_neighbors.assert_not_called()
+
+
+def test_leaderboard_builds_each_car_once_per_tick(mock_values):
+    irsdk = mock_values()
+    frame = TelemetryFrame(tick_count=7, session_time=None)
+    irsdk.get_frame.side_effect = lambda: frame
+    lb = Leaderboard(irsdk)
+    lb.car_table.update = MagicMock(wraps=lb.car_table.update)
+
+    lb.get_snapshot()
+    lb.get_snapshot(sections=["cars"])
+    lb.get_snapshot(sections=["neighbors", "player"])
+
+    assert lb.car_table.update.call_count == 1
+
+
+def test_leaderboard_sections_share_table_cars(mock_service):
+    snapshot = mock_service.get_snapshot()
+
+    cars = {car["car_idx"]: car for car in snapshot["cars"]}
+    neighbors = snapshot["neighbors"]["ahead"] + snapshot["neighbors"]["behind"]
+    assert all("lap_status" not in car for car in cars.values())
+    assert all(car["name"] == cars[car["car_idx"]]["name"] for car in neighbors)
+
+
 def test_leaderboard_snapshot_multiclass(mock_values):
     lb = Leaderboard(mock_values(is_multiclass=True))
     snapshot = lb.get_snapshot()
@@ -65,18 +103,6 @@ def test_leaderboard_no_drivers_returns_error(irsdk_mock_factory):
     assert result["cars"] == []
 
 
-def test_is_multiclass_returns_false_for_single_class(mock_service, mock_ctx):
-    ctx = mock_ctx(drivers=[{"CarClassID": 1}, {"CarClassID": 1}])
-    assert mock_service._is_multiclass(ctx.drivers) is False
-
-
-def test_is_multiclass_returns_true_for_multiple_classes(
-    mock_service, mock_ctx
-):
-    ctx = mock_ctx(drivers=[{"CarClassID": 1}, {"CarClassID": 2}])
-    assert mock_service._is_multiclass(ctx.drivers) is True
-
-
 def test_reset_pit_status_calls_reset_on_new_session(mock_service):
     mock_service._last_session_num = 1
     session_info = {"CurrentSessionNum": 2}
@@ -167,3 +193,8 @@ def test_build_context_returns_none_when_no_drivers(irsdk_mock_factory):
 )
 def test_normalize_laps_started(mock_service, raw_laps, expected):
     assert mock_service._normalize_laps_started(raw_laps) == expected
+
+
+def test_leaderboard_unknown_section(mock_service):
+    with pytest.raises(ValueError):
+        mock_service.get_snapshot(sections=["weather"])
@@ -0,0 +1,84 @@
+import pytest
+
+from backend.services.leaderboard import standings
+from backend.services.leaderboard.standings import compute_standings
+
+
+@pytest.fixture(params=["numpy", "python"])
+def kernel(request, monkeypatch):
+    """Run a test against both the NumPy and the Python path."""
+    if request.param == "numpy":
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(standings, "np", None)
+    return compute_standings
+
+
+# --- Positive tests ---
+
+
+def test_standings_fastest_laps(kernel):
+    result = kernel(
+        best_laps=[82.0, 79.5, 90.0, 0, -1, -1],
+        class_ids=[1, 1, 2, 2],
+    )
+
+    assert result.session_fastest_lap == pytest.approx(79.5)
+    assert result.class_fastest_laps == {
+        1: pytest.approx(79.5),
+        2: pytest.approx(90.0),
+    }
+
+
+def test_standings_ignore_array_entries_without_driver(kernel):
+    result = kernel(best_laps=[80.0, 70.0], class_ids=[1])
+
+    assert result.class_fastest_laps == {1: pytest.approx(80.0)}
+
+
+def test_standings_paths_agree(monkeypatch):
+    pytest.importorskip("numpy")
+    args = ([82.0, 79.5, 90.0, None, 88.1, -1], [1, 1, 2, None, 2, 3])
+
+    vectorized = compute_standings(*args)
+    monkeypatch.setattr(standings, "np", None)
+    fallback = compute_standings(*args)
+
+    assert vectorized == fallback
+
+
+def test_leaderboard_context_uses_standings(mock_service):
+    ctx = mock_service._build_context()
+
+    assert ctx.session_fastest_lap == pytest.approx(11.1)
+    assert ctx.class_fastest_laps == {1: pytest.approx(11.1)}
+
+
+def test_leaderboard_context_reads_best_laps_as_array(mock_service):
+    np = pytest.importorskip("numpy")
+    best_laps = np.array([95.5, 90.25, -1.0], dtype=np.float32)
+    mock_service.irsdk.get_array = (
+        lambda field: best_laps if field == "CarIdxBestLapTime" else None
+    )
+
+    ctx = mock_service._build_context()
+
+    assert ctx.session_fastest_lap == pytest.approx(90.25)
+    assert ctx.class_fastest_laps == {1: pytest.approx(90.25)}
+
+
+# --- Negative tests ---
+
+
+def test_standings_without_valid_laps(kernel):
+    result = kernel(best_laps=[0, -1, None], class_ids=[1, 2, None])
+
+    assert result.session_fastest_lap is None
+    assert result.class_fastest_laps == {1: None, 2: None, None: None}
+
+
+def test_standings_without_drivers(kernel):
+    result = kernel(best_laps=[], class_ids=[])
+
+    assert result.session_fastest_lap is None
+    assert result.class_fastest_laps == {}
@@ -0,0 +1,57 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.routers import ws
+from backend.services.push.hub import SnapshotHub
+
+
+class CountingService:
+    """Snapshot service counting how often a snapshot was built."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.builds = 0
+
+    SECTIONS = ("name", "build")
+
+    def get_snapshot(self, sections=None) -> dict:
+        self.builds += 1
+        snapshot = {"name": self.name, "build": self.builds}
+        return {
+            key: value for key, value in snapshot.items()
+            if sections is None or key in sections
+        }
+
+    def get_versioned_snapshot(self, sections=None) -> tuple[int, dict]:
+        return self.builds, self.get_snapshot(sections)
+
+    def resolve_sections(self, sections):
+        if not set(sections) <= set(self.SECTIONS):
+            raise ValueError("Unknown sections")
+        return frozenset(sections)
+
+
+@pytest.fixture
+def services() -> dict:
+    return {"radar": CountingService("radar"), "telemetry": CountingService("telemetry")}
+
+
+@pytest.fixture
+def hub(ticking_irsdk_service, services) -> SnapshotHub:
+    """
+    Returns a SnapshotHub over the ticking IRSDKService, not started.
+    """
+    return SnapshotHub(ticking_irsdk_service, services)
+
+
+@pytest.fixture
+def ws_client(hub, monkeypatch):
+    """
+    Returns a TestClient of an app serving /ws from the hub fixture.
+    """
+    monkeypatch.setattr(ws, "snapshot_hub", hub)
+    app = FastAPI()
+    app.include_router(ws.router)
+    with TestClient(app) as client:
+        yield client
@@ -0,0 +1,136 @@
+import json
+
+from backend.services.push.delta import (
+    KEYFRAME_TICKS,
+    SnapshotHistory,
+    apply_delta,
+    diff_snapshot,
+    encode_update,
+)
+
+
+def _car(idx, **changes):
+    car = {
+        "car_idx": idx,
+        "name": f"Driver {idx}",
+        "irating": 2000 + idx,
+        "license": "A 4.99",
+        "car_class_color": 0xFFDA59,
+        "lap_dist_pct": idx / 100,
+        "last_lap_time_formatted": "1:58.123",
+        "best_lap_seconds": 117.5,
+    }
+    car.update(changes)
+    return car
+
+
+def _snapshot(cars, **changes):
+    snapshot = {
+        "status": "ok",
+        "cars": cars,
+        "player": _car(0),
+        "neighbors": {"ahead": cars[:2], "behind": []},
+        "location": "on_track",
+    }
+    snapshot.update(changes)
+    return snapshot
+
+
+# --- Positive tests ---
+
+
+def test_round_trip_moving_cars():
+    base = _snapshot([_car(i) for i in range(1, 61)])
+    snapshot = _snapshot([_car(i, lap_dist_pct=i / 100 + 0.001) for i in range(1, 61)])
+
+    delta = diff_snapshot(base, snapshot)
+
+    assert apply_delta(base, delta) == snapshot
+    assert "order" not in delta["sub"]["cars"]
+    assert delta["sub"]["cars"]["sub"]["5"].keys() == {"set"}
+    assert delta["sub"]["cars"]["sub"]["5"]["set"].keys() == {"lap_dist_pct"}
+    # Only lap_dist_pct changed, so the delta is much smaller than a keyframe.
+    assert len(json.dumps(delta)) * 4 < len(json.dumps(snapshot))
+
+
+def test_round_trip_reordered_added_and_removed_cars():
+    base = _snapshot([_car(1), _car(2), _car(3)])
+    snapshot = _snapshot([_car(3), _car(1, name="New"), _car(4)])
+
+    delta = diff_snapshot(base, snapshot)
+
+    assert apply_delta(base, delta) == snapshot
+    assert delta["sub"]["cars"]["order"] == [3, 1, 4]
+    assert delta["sub"]["cars"]["set"] == {"4": _car(4)}
+
+
+def test_round_trip_changed_and_removed_keys():
+    base = _snapshot([_car(1)], extra=True)
+    snapshot = _snapshot([], status="waiting")
+
+    delta = diff_snapshot(base, snapshot)
+
+    assert apply_delta(base, delta) == snapshot
+    assert delta["del"] == ["extra"]
+
+
+def test_unchanged_snapshot_has_empty_delta():
+    snapshot = _snapshot([_car(1)])
+    assert diff_snapshot(snapshot, dict(snapshot)) == {}
+
+
+def test_apply_does_not_change_base():
+    base = _snapshot([_car(1)])
+    copy = json.loads(json.dumps(base))
+    apply_delta(base, diff_snapshot(base, _snapshot([_car(1, name="New")])))
+    assert base == copy
+
+
+def test_history_update_since():
+    history = SnapshotHistory()
+    first = _snapshot([_car(1)])
+    second = _snapshot([_car(1, lap_dist_pct=0.5)])
+
+    keyframe = history.update_since(-1, 10, first)
+    update = history.update_since(10, 12, second)
+
+    assert keyframe == {"tick": 10, "keyframe": True, "data": first}
+    assert update["base"] == 10
+    assert apply_delta(first, update["delta"]) == second
+
+
+# --- Negative tests ---
+
+
+def test_keyframe_without_base():
+    assert encode_update(5, {"a": 1}, 4, None)["keyframe"] is True
+
+
+def test_keyframe_on_tick_going_backwards():
+    assert encode_update(5, {"a": 1}, 100, {"a": 0})["keyframe"] is True
+
+
+def test_keyframe_on_new_window():
+    update = encode_update(KEYFRAME_TICKS, {"a": 1}, KEYFRAME_TICKS - 1, {"a": 0})
+    assert update["keyframe"] is True
+
+
+def test_history_evicts_old_ticks():
+    history = SnapshotHistory(size=2)
+    for tick in range(3):
+        history.add(tick, {"tick": tick})
+    assert history.get(0) is None
+    assert history.get(2) == {"tick": 2}
+
+
+def test_history_cleared_on_sim_restart():
+    history = SnapshotHistory()
+    history.add(100, {})
+    history.add(3, {})
+    assert history.get(100) is None
+
+
+def test_history_ignores_negative_ticks():
+    history = SnapshotHistory()
+    history.add(-1, {"status": "waiting"})
+    assert history.update_since(-1, 4, {})["keyframe"] is True
@@ -0,0 +1,217 @@
+import asyncio
+import json
+import threading
+from concurrent.futures import wait
+
+import pytest
+
+from backend.services.push.delta import apply_delta
+from backend.services.push.hub import SnapshotHub, Subscription, Update
+
+
+def _drain(loop):
+    """Run the callbacks the hub scheduled on the loop."""
+    loop.run_until_complete(asyncio.sleep(0))
+
+
+# --- Positive tests ---
+
+
+def test_subscription_latest_wins():
+    async def scenario():
+        subscription = Subscription(asyncio.get_running_loop())
+        subscription.add("radar")
+        subscription.offer("radar", Update(1, {}, "first"))
+        subscription.offer("radar", Update(2, {}, "second"))
+        return subscription, await subscription.next_messages()
+
+    subscription, messages = asyncio.run(scenario())
+
+    assert messages == ["second"]
+    assert subscription.dropped == 1
+
+
+def test_publish_builds_each_topic_once(hub, services):
+    loop = asyncio.new_event_loop()
+    try:
+        subscriptions = [hub.subscribe(loop) for _ in range(3)]
+        for subscription in subscriptions:
+            subscription.add("radar")
+
+        wait(hub.publish())
+        _drain(loop)
+
+        messages = [loop.run_until_complete(s.next_messages()) for s in subscriptions]
+    finally:
+        loop.close()
+
+    assert services["radar"].builds == 1
+    assert services["telemetry"].builds == 0
+    assert messages[0] == messages[1] == messages[2]
+    payload = json.loads(messages[0][0])
+    assert payload["topic"] == "radar"
+    assert payload["data"] == {"name": "radar", "build": 1}
+
+
+def test_subscription_routes_replaced_not_mutated():
+    async def scenario():
+        subscription = Subscription(asyncio.get_running_loop())
+        subscription.add("radar")
+        routes = subscription.routes
+        subscription.add("telemetry", frozenset({"name"}))
+        subscription.discard("radar")
+        return routes, subscription.routes
+
+    before, after = asyncio.run(scenario())
+
+    assert dict(before) == {"radar": None}
+    assert dict(after) == {"telemetry": frozenset({"name"})}
+
+
+def test_slow_topic_does_not_block_others(ticking_irsdk_service, services):
+    release = threading.Event()
+    radar = services["radar"]
+
+    def slow_snapshot(sections=None):
+        release.wait(2)
+        return radar.builds, {}
+
+    radar.get_versioned_snapshot = slow_snapshot
+    hub = SnapshotHub(ticking_irsdk_service, services)
+    loop = asyncio.new_event_loop()
+    try:
+        subscription = hub.subscribe(loop)
+        subscription.add("radar")
+        subscription.add("telemetry")
+
+        futures = hub.publish()
+        messages = loop.run_until_complete(
+            asyncio.wait_for(subscription.next_messages(), 2)
+        )
+        # The radar build is still running, a new round skips it.
+        assert len(hub.publish()) == 1
+        release.set()
+        wait(futures)
+    finally:
+        release.set()
+        hub.stop()
+        loop.close()
+
+    assert [json.loads(message)["topic"] for message in messages] == ["telemetry"]
+
+
+def test_hub_pushes_on_new_tick(hub, ticking_irsdk_service, services):
+    loop = asyncio.new_event_loop()
+    subscription = hub.subscribe(loop)
+    subscription.add("telemetry")
+    hub.start()
+    try:
+        ticking_irsdk_service.advance(Speed=20.0)
+        ticking_irsdk_service.refresh_frame()
+        messages = loop.run_until_complete(
+            asyncio.wait_for(subscription.next_messages(), 2)
+        )
+    finally:
+        hub.stop()
+        loop.close()
+
+    assert json.loads(messages[-1])["topic"] == "telemetry"
+    assert services["telemetry"].builds >= 1
+
+
+def test_ws_subscribe_sends_snapshots(ws_client, hub, services):
+    with ws_client.websocket_connect("/ws") as websocket:
+        websocket.send_json({"subscribe": ["radar"]})
+        initial = websocket.receive_json()
+
+        hub.publish()
+        pushed = websocket.receive_json()
+
+    assert initial["topic"] == pushed["topic"] == "radar"
+    assert initial["data"]["build"] == 1
+    assert pushed["data"]["build"] == 2
+    assert services["telemetry"].builds == 0
+
+
+def test_ws_delta_mode(ws_client, hub):
+    with ws_client.websocket_connect("/ws") as websocket:
+        websocket.send_json({"subscribe": ["radar"], "delta": True})
+        keyframe = websocket.receive_json()
+
+        hub.publish()
+        update = websocket.receive_json()
+
+    assert keyframe["keyframe"] is True
+    assert update["base"] == keyframe["tick"]
+    assert apply_delta(keyframe["data"], update["delta"]) == {"name": "radar", "build": 2}
+
+
+def test_ws_keyframe_request(ws_client, hub):
+    with ws_client.websocket_connect("/ws") as websocket:
+        websocket.send_json({"subscribe": ["radar"], "delta": True})
+        websocket.receive_json()
+
+        websocket.send_json({"keyframe": ["radar"]})
+        resync = websocket.receive_json()
+
+    assert resync["keyframe"] is True
+    assert resync["data"] == {"name": "radar", "build": 2}
+
+
+def test_ws_sections_projection(ws_client, hub):
+    with ws_client.websocket_connect("/ws") as websocket:
+        websocket.send_json({"subscribe": ["radar"], "sections": {"radar": ["name"]}})
+        initial = websocket.receive_json()
+
+        hub.publish()
+        pushed = websocket.receive_json()
+
+    assert initial["data"] == pushed["data"] == {"name": "radar"}
+
+
+# --- Negative tests ---
+
+
+def test_ws_unknown_topic(ws_client):
+    with ws_client.websocket_connect("/ws") as websocket:
+        websocket.send_json({"subscribe": ["weather"]})
+        assert "weather" in websocket.receive_json()["error"]
+
+
+def test_ws_invalid_message(ws_client):
+    with ws_client.websocket_connect("/ws") as websocket:
+        websocket.send_text("subscribe radar")
+        assert websocket.receive_json() == {"error": "invalid message"}
+
+
+def test_unsubscribed_topic_not_offered():
+    async def scenario():
+        subscription = Subscription(asyncio.get_running_loop())
+        subscription.offer("radar", Update(1, {}, "message"))
+        return subscription._pending
+
+    assert asyncio.run(scenario()) == {}
+
+
+@pytest.mark.parametrize(
+    "message",
+    [
+        {"subscribe": ["radar"], "sections": ["name"]},
+        {"subscribe": ["radar"], "sections": {"radar": 5}},
+        {"subscribe": "radar"},
+        {"subscribe": [["radar"]]},
+    ],
+)
+def test_ws_invalid_sections_keep_socket_open(ws_client, message):
+    with ws_client.websocket_connect("/ws") as websocket:
+        websocket.send_json(message)
+        assert "error" in websocket.receive_json()
+
+        websocket.send_json({"subscribe": ["radar"]})
+        assert websocket.receive_json()["topic"] == "radar"
+
+
+def test_ws_unknown_section(ws_client):
+    with ws_client.websocket_connect("/ws") as websocket:
+        websocket.send_json({"subscribe": ["radar"], "sections": {"radar": ["x"]}})
+        assert "Unknown sections" in websocket.receive_json()["error"]
@@ -144,6 +144,32 @@ def test_find_closest_side_car_basic(mock_service, mock_ctx):
     result = mock_service._find_closest_side_car(ctx)
     assert result == 1
 
+@pytest.mark.parametrize(
+    "lap_dist_pct, player_idx",
+    [
+        ([0.50, 0.51, 0.60], 0),
+        ([0.98, 0.40, 0.02, -1.0, -1.0], 0),
+        ([0.30, 0.20, 0.40, 0.10], 0),
+        ([0.50, -1.0], 1),
+    ],
+)
+def test_find_closest_side_car_array_matches_list(
+    mock_service, mock_ctx, lap_dist_pct, player_idx
+):
+    np = pytest.importorskip("numpy")
+    # Both read from the same float32 buffer, as in a frame.
+    array = np.array(lap_dist_pct, dtype=np.float32)
+    array.flags.writeable = False
+    lap_dist_pct = array.tolist()
+    ctx = mock_ctx(lap_dist_pct=lap_dist_pct, player_idx=player_idx)
+    array_ctx = mock_ctx(
+        lap_dist_pct=lap_dist_pct, player_idx=player_idx, lap_dist_array=array
+    )
+
+    assert mock_service._find_closest_side_car(array_ctx) == (
+        mock_service._find_closest_side_car(ctx)
+    )
+
 def test_find_closest_side_car_no_player(mock_service, mock_ctx):
     ctx = mock_ctx(player_idx=None)
     assert mock_service._find_closest_side_car(ctx) is None
@@ -152,6 +178,13 @@ def test_find_closest_side_car_empty(mock_service, mock_ctx):
     ctx = mock_ctx(lap_dist_pct=[], player_idx=None)
     assert mock_service._find_closest_side_car(ctx) is None
 
+def test_find_closest_side_car_array_without_other_cars(mock_service, mock_ctx):
+    np = pytest.importorskip("numpy")
+    ctx = mock_ctx(
+        lap_dist_pct=[0.5], player_idx=0, lap_dist_array=np.array([0.5])
+    )
+    assert mock_service._find_closest_side_car(ctx) is None
+
 
 # --- _compute_side_offset tests ---
 
@@ -0,0 +1,70 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from backend.routers import apis
+from backend.services.irsdk.notifier import FrameNotifier
+from backend.services.track_map.assets import TrackAssets
+
+
+class FrameService:
+    """Snapshot service reading Speed from the current frame."""
+
+    SECTIONS = ("speed", "gear")
+
+    def __init__(self, irsdk_service):
+        self.irsdk = irsdk_service
+        self.builds = 0
+
+    def get_snapshot(self, sections=None) -> dict:
+        return self.get_versioned_snapshot(sections)[1]
+
+    def get_versioned_snapshot(self, sections=None) -> tuple[int, dict]:
+        self.builds += 1
+        with self.irsdk.pinned_frame() as frame:
+            if sections is None:
+                return frame.tick_count, {"speed": self.irsdk.get_value("Speed")}
+            return frame.tick_count, {section: 0 for section in sorted(sections)}
+
+    def resolve_sections(self, sections):
+        sections = frozenset(sections)
+        if not sections <= set(self.SECTIONS):
+            raise ValueError("Unknown sections")
+        return sections
+
+
+@pytest.fixture
+def radar_service(ticking_irsdk_service, monkeypatch) -> FrameService:
+    """
+    Returns the FrameService served as /api/radar.
+    """
+    service = FrameService(ticking_irsdk_service)
+    monkeypatch.setattr(apis, "irsdk_service", ticking_irsdk_service)
+    monkeypatch.setattr(
+        apis, "frame_notifier", FrameNotifier(ticking_irsdk_service)
+    )
+    monkeypatch.setattr(apis, "radar_service", service)
+    monkeypatch.setattr(apis, "snapshot_histories", {})
+    return service
+
+
+@pytest.fixture
+def track_assets(monkeypatch) -> TrackAssets:
+    """
+    Returns the TrackAssets served from /api/track-map/assets.
+    """
+    assets = TrackAssets()
+    service = type("TrackMapStub", (), {"assets": assets})()
+    monkeypatch.setattr(apis, "track_map_service", service)
+    return assets
+
+
+@pytest.fixture
+def api_client(radar_service):
+    """
+    Returns a TestClient of an app serving the /api router.
+    """
+    app = FastAPI()
+    app.include_router(apis.router)
+    with TestClient(app) as client:
+        yield client
@@ -0,0 +1,142 @@
+import threading
+import time
+
+import pytest
+
+from backend.services.push.delta import apply_delta
+from backend.utils import serialization
+
+
+# --- Positive tests ---
+
+
+def test_snapshot_has_tick_etag(api_client, ticking_irsdk_service):
+    response = api_client.get("/api/radar")
+
+    tick = ticking_irsdk_service.get_frame().tick_count
+    assert response.json() == {"speed": 10.0}
+    assert response.headers["etag"] == f'"{tick};all;json"'
+    assert response.headers["vary"] == "Accept"
+
+
+def test_not_modified_without_new_tick(api_client, radar_service):
+    etag = api_client.get("/api/radar").headers["etag"]
+
+    response = api_client.get("/api/radar", headers={"If-None-Match": etag})
+
+    assert response.status_code == 304
+    assert response.headers["etag"] == etag
+    assert radar_service.builds == 1
+
+
+def test_modified_after_new_tick(api_client, ticking_irsdk_service):
+    etag = api_client.get("/api/radar").headers["etag"]
+    ticking_irsdk_service.advance(Speed=20.0)
+
+    response = api_client.get("/api/radar", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json() == {"speed": 20.0}
+    assert response.headers["etag"] != etag
+
+
+def test_long_poll_returns_on_next_tick(api_client, ticking_irsdk_service):
+    etag = api_client.get("/api/radar").headers["etag"]
+    timer = threading.Timer(0.1, ticking_irsdk_service.advance, kwargs={"Speed": 30.0})
+    timer.start()
+
+    start = time.monotonic()
+    response = api_client.get(
+        "/api/radar?wait=5", headers={"If-None-Match": etag}
+    )
+    timer.join()
+
+    assert response.status_code == 200
+    assert response.json() == {"speed": 30.0}
+    assert time.monotonic() - start < 2
+
+
+def test_since_returns_delta(api_client, ticking_irsdk_service):
+    keyframe = api_client.get("/api/radar?since=-1").json()
+    ticking_irsdk_service.advance(Speed=40.0)
+
+    update = api_client.get(f"/api/radar?since={keyframe['tick']}").json()
+
+    assert keyframe["keyframe"] is True
+    assert update["base"] == keyframe["tick"]
+    assert apply_delta(keyframe["data"], update["delta"]) == {"speed": 40.0}
+
+
+def test_msgpack_negotiated(api_client):
+    msgpack = pytest.importorskip("msgpack")
+
+    response = api_client.get("/api/radar", headers={"Accept": "application/msgpack"})
+
+    assert response.headers["content-type"] == "application/msgpack"
+    assert msgpack.unpackb(response.content) == {"speed": 10.0}
+
+
+def test_sections_projection(api_client):
+    response = api_client.get("/api/radar?sections=gear")
+    assert response.json() == {"gear": 0}
+
+
+def test_etag_names_sections(api_client):
+    plain = api_client.get("/api/radar").headers["etag"]
+    projected = api_client.get("/api/radar?sections=gear").headers["etag"]
+
+    assert plain != projected
+    assert projected.endswith(';gear;json"')
+
+
+def test_etag_names_encoding(api_client):
+    pytest.importorskip("msgpack")
+
+    response = api_client.get("/api/radar", headers={"Accept": "application/msgpack"})
+
+    assert response.headers["etag"].endswith(';all;msgpack"')
+
+
+# --- Negative tests ---
+
+
+def test_long_poll_times_out_with_not_modified(api_client):
+    etag = api_client.get("/api/radar").headers["etag"]
+
+    response = api_client.get(
+        "/api/radar?wait=0.1", headers={"If-None-Match": etag}
+    )
+
+    assert response.status_code == 304
+
+
+def test_long_poll_wait_is_capped(api_client):
+    assert api_client.get("/api/radar?wait=3600").status_code == 422
+
+
+def test_msgpack_unavailable_falls_back_to_json(api_client, monkeypatch):
+    monkeypatch.setattr(serialization, "msgpack", None)
+
+    response = api_client.get("/api/radar", headers={"Accept": "application/msgpack"})
+
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"speed": 10.0}
+
+
+def test_unparsable_etag_is_ignored(api_client):
+    response = api_client.get("/api/radar", headers={"If-None-Match": '"abc"'})
+    assert response.status_code == 200
+
+
+def test_etag_of_other_representation_is_modified(api_client):
+    etag = api_client.get("/api/radar?sections=gear").headers["etag"]
+
+    response = api_client.get("/api/radar", headers={"If-None-Match": etag})
+
+    assert response.status_code == 200
+    assert response.json() == {"speed": 10.0}
+
+
+def test_unknown_section_is_bad_request(api_client):
+    response = api_client.get("/api/radar?sections=gear,weather")
+    assert response.status_code == 400
@@ -0,0 +1,63 @@
+from backend.services.track_map.assets import JSON_MEDIA_TYPE
+
+
+# --- Positive tests ---
+
+
+def test_asset_is_served_by_hash(api_client, track_assets):
+    asset_hash = track_assets.add("<svg>track</svg>")
+
+    response = api_client.get(f"/api/track-map/assets/{asset_hash}.svg")
+
+    assert response.status_code == 200
+    assert response.content == b"<svg>track</svg>"
+    assert response.headers["content-type"].startswith("image/svg+xml")
+    assert "immutable" in response.headers["cache-control"]
+    assert response.headers["etag"] == f'"{asset_hash}"'
+
+
+def test_racing_line_is_served_as_json(api_client, track_assets):
+    asset_hash = track_assets.add('{"resolution":1}', JSON_MEDIA_TYPE)
+
+    response = api_client.get(f"/api/track-map/assets/{asset_hash}.json")
+
+    assert response.json() == {"resolution": 1}
+    assert "immutable" in response.headers["cache-control"]
+
+
+def test_asset_hash_depends_on_content_only(track_assets):
+    first = track_assets.add("<svg>track</svg>")
+    second = track_assets.add("<svg>track</svg>")
+    other = track_assets.add("<svg>other</svg>")
+
+    assert first == second
+    assert first != other
+
+
+def test_oldest_assets_are_evicted(track_assets):
+    first = track_assets.add("<svg>0</svg>")
+    for i in range(1, track_assets.size + 1):
+        track_assets.add(f"<svg>{i}</svg>")
+
+    assert track_assets.get(first) is None
+
+
+# --- Negative tests ---
+
+
+def test_unknown_asset_is_not_found(api_client, track_assets):
+    response = api_client.get("/api/track-map/assets/0123456789abcdef.svg")
+
+    assert response.status_code == 404
+
+
+def test_asset_is_not_served_as_other_media_type(api_client, track_assets):
+    asset_hash = track_assets.add("<svg>track</svg>")
+
+    response = api_client.get(f"/api/track-map/assets/{asset_hash}.json")
+
+    assert response.status_code == 404
+
+
+def test_missing_svg_has_no_hash(track_assets):
+    assert track_assets.add(None) is None
@@ -1,5 +1,7 @@
 import pytest
+from dataclasses import FrozenInstanceError
 
+from backend.services.irsdk.frame import EMPTY_FRAME, TelemetryFrame
 from backend.services.irsdk.service import IRSDKService
 
 # --- Data tests ---
@@ -26,72 +28,6 @@ def test_get_value_existing(mock_irsdk_service):
     assert mock_irsdk_service.get_value("Speed") == pytest.approx(10.0)
 
 
-@pytest.mark.parametrize(
-    "idx,drivers,player_idx,multiclass,expected",
-    [
-        # no multiclass
-        (
-            0,
-            [
-                {"CarClassColor": 0xFF0000},
-                {"CarClassColor": 0x00FF00},
-                {"CarClassColor": 0x0000FF},
-            ],
-            None,
-            False,
-            "#1b2a3a",
-        ),
-        # multiclass, player car
-        (
-            1,
-            [
-                {"CarClassColor": 0xFF0000},
-                {"CarClassColor": 0x00FF00},
-                {"CarClassColor": 0x0000FF},
-            ],
-            1,
-            True,
-            "#1e6cff",
-        ),
-        # multiclass, another car
-        (
-            2,
-            [
-                {"CarClassColor": 0xFF0000},
-                {"CarClassColor": 0x00FF00},
-                {"CarClassColor": 0x0000FF},
-            ],
-            0,
-            True,
-            "rgb(0,0,255)",
-        ),
-        # idx out of bounds
-        (
-            10,
-            [
-                {"CarClassColor": 0xFF0000},
-                {"CarClassColor": 0x00FF00},
-                {"CarClassColor": 0x0000FF},
-            ],
-            None,
-            False,
-            "#1b2a3a",
-        ),
-        # CarClassColor None
-        (0, [{"CarClassColor": None}], None, True, "#1b2a3a"),
-    ],
-)
-def test_get_car_rgb(idx, drivers, player_idx, multiclass, expected):
-    assert (
-        IRSDKService.get_car_rgb(
-            idx=idx,
-            drivers=drivers,
-            player_idx=player_idx,
-            multiclass=multiclass,
-        )
-        == expected
-    )
-
 def test_get_speed_kmh_valid(mock_irsdk_service):
     result = mock_irsdk_service.get_speed_kmh()
     assert result == pytest.approx(36.0)
@@ -122,3 +58,64 @@ def test_get_speed_kmh_none(irsdk_mock_factory):
 
     result = service.get_speed_kmh()
     assert result == 0.0
+
+
+# --- Frame tests ---
+
+
+def _field_reads(mock_ir, field):
+    return [c for c in mock_ir.__getitem__.call_args_list if c.args == (field,)]
+
+
+def test_get_frame_captures_requested_fields(ticking_irsdk_service):
+    frame = ticking_irsdk_service.get_frame()
+
+    assert isinstance(frame, TelemetryFrame)
+    assert frame.tick_count == 1
+    assert frame.get("Speed") == pytest.approx(10.0)
+    assert frame.get("CarIdxLapDistPct") == (0.1, 0.2)
+
+
+def test_get_value_reads_irsdk_once_per_tick(ticking_irsdk_service):
+    mock_ir = ticking_irsdk_service.ir
+
+    for _ in range(5):
+        ticking_irsdk_service.get_value("Speed")
+    assert len(_field_reads(mock_ir, "Speed")) == 1
+
+    ticking_irsdk_service.advance(Speed=20.0)
+    assert ticking_irsdk_service.get_value("Speed") == pytest.approx(20.0)
+    assert len(_field_reads(mock_ir, "Speed")) == 2
+
+
+def test_pinned_frame_is_tick_consistent(ticking_irsdk_service):
+    with ticking_irsdk_service.pinned_frame() as frame:
+        ticking_irsdk_service.advance(Speed=99.0)
+        assert ticking_irsdk_service.get_value("Speed") == pytest.approx(10.0)
+        assert ticking_irsdk_service.get_frame() is frame
+
+    assert ticking_irsdk_service.get_value("Speed") == pytest.approx(99.0)
+
+
+def test_request_fields_invalidates_frame(ticking_irsdk_service):
+    ticking_irsdk_service.get_frame()
+    ticking_irsdk_service.ir.__getitem__.side_effect = lambda key: 4
+
+    ticking_irsdk_service.request_fields(["Gear"])
+
+    assert ticking_irsdk_service.get_frame().get("Gear") == 4
+
+
+def test_frame_is_read_only():
+    frame = TelemetryFrame(tick_count=1, session_time=0.0, values={"Gear": 3})
+
+    with pytest.raises(TypeError):
+        frame.values["Gear"] = 4
+    with pytest.raises(FrozenInstanceError):
+        frame.tick_count = 2
+
+
+def test_get_frame_when_not_connected(irsdk_mock_factory):
+    service = IRSDKService()
+    service.ir = irsdk_mock_factory(is_connected=False)
+    assert service.get_frame() is EMPTY_FRAME
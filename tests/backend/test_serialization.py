@@ -0,0 +1,98 @@
+import json
+import math
+
+import pytest
+
+from backend.utils import serialization
+
+SNAPSHOT = {
+    "status": "ok",
+    "cars": [{"car_idx": 1, "name": "Émile", "lap_dist_pct": 0.5, "pos": None}],
+    "positions": (1, 2, 3),
+    "multiclass": True,
+}
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    """
+    Runs a test with orjson (when installed) and with stdlib json.
+    """
+    if request.param == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(serialization, "orjson", None)
+    return request.param
+
+
+# --- Positive tests ---
+
+
+def test_dumps_json_round_trip(json_backend):
+    encoded = serialization.dumps_json(SNAPSHOT)
+
+    assert json.loads(encoded) == {**SNAPSHOT, "positions": [1, 2, 3]}
+    assert b" " not in encoded
+
+
+def test_dumps_json_falls_back_to_jsonable_encoder(json_backend):
+    assert json.loads(serialization.dumps_json({"ids": {7}})) == {"ids": [7]}
+
+
+def test_dumps_msgpack_round_trip():
+    msgpack = pytest.importorskip("msgpack")
+    encoded = serialization.dumps_msgpack(SNAPSHOT)
+    assert msgpack.unpackb(encoded) == {**SNAPSHOT, "positions": [1, 2, 3]}
+
+
+def test_negotiate_msgpack(monkeypatch):
+    monkeypatch.setattr(serialization, "msgpack", object())
+    accept = "application/json;q=0.5, application/msgpack"
+    assert serialization.negotiate(accept) == "application/msgpack"
+
+
+def test_snapshot_response_headers():
+    response = serialization.snapshot_response(SNAPSHOT, headers={"ETag": '"3"'})
+
+    assert response.media_type == "application/json"
+    assert response.headers["etag"] == '"3"'
+    assert response.headers["vary"] == "Accept"
+
+
+def test_body_cache_reuses_body_of_same_snapshot():
+    cache = serialization.BodyCache()
+    snapshot = {"speed": 10.0}
+
+    first = cache.encode("radar", snapshot, "application/json")
+    second = cache.encode("radar", snapshot, "application/json")
+    changed = cache.encode("radar", {"speed": 20.0}, "application/json")
+
+    assert second is first
+    assert json.loads(changed) == {"speed": 20.0}
+
+
+# --- Negative tests ---
+
+
+def test_negotiate_without_msgpack(monkeypatch):
+    monkeypatch.setattr(serialization, "msgpack", None)
+    assert serialization.negotiate("application/msgpack") == "application/json"
+
+
+def test_negotiate_refused_msgpack(monkeypatch):
+    monkeypatch.setattr(serialization, "msgpack", object())
+    assert serialization.negotiate("application/msgpack;q=0") == "application/json"
+    assert serialization.negotiate("text/html, */*") == "application/json"
+
+
+def test_dumps_msgpack_without_msgpack(monkeypatch):
+    monkeypatch.setattr(serialization, "msgpack", None)
+    with pytest.raises(RuntimeError):
+        serialization.dumps_msgpack(SNAPSHOT)
+
+
+def test_stdlib_json_rejects_nan(monkeypatch):
+    monkeypatch.setattr(serialization, "orjson", None)
+    with pytest.raises(ValueError):
+        serialization.dumps_json({"gap": math.nan})
+
@@ -1,5 +1,10 @@
+import threading
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+
 import pytest
 
+from backend.services.drivers import DriverTable
+from backend.services.track_map import svg_fetcher
 from backend.services.track_map.service import (
     TrackMapCarBuilder,
     TrackMapService,
@@ -7,6 +12,47 @@ from backend.services.track_map.service import (
 )
 
 
+@pytest.fixture(autouse=True)
+def offline_track_svgs(tmp_path, monkeypatch):
+    """
+    Keeps track SVG fetches off the network and the user cache.
+    """
+    monkeypatch.setenv("REDWAVE_CACHE_DIR", str(tmp_path / "cache"))
+    monkeypatch.setenv("REDWAVE_TRACK_BUNDLE", str(tmp_path / "missing.bin"))
+    monkeypatch.setattr(
+        svg_fetcher.track_url_generation, "TRACK_MAPS_URL", "http://127.0.0.1:9/"
+    )
+
+
+@pytest.fixture
+def svg_server(tmp_path):
+    """
+    Serves tmp_path/assets over HTTP in a thread, yields its base URL
+    and the list of requested paths.
+    """
+    root = tmp_path / "assets"
+    root.mkdir()
+    requests = []
+
+    class Handler(SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=str(root), **kwargs)
+
+        def do_GET(self):
+            requests.append(self.path)
+            super().do_GET()
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield root, f"http://127.0.0.1:{server.server_port}/", requests
+    server.shutdown()
+    server.server_close()
+
+
 @pytest.fixture
 def mock_service(mock_values: dict) -> TrackMapService:
     """
@@ -44,6 +90,7 @@ def mock_ctx(mock_values: dict) -> TrackMapContext:
 
     def _make_ctx(**overrides):
         data = {**defaults, **overrides}
+        data.setdefault("driver_table", DriverTable.from_drivers(data["drivers"]))
         return TrackMapContext(**data)
 
     return _make_ctx
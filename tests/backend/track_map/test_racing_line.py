@@ -0,0 +1,72 @@
+import pytest
+
+from backend.services.track_map.racing_line import RacingLine, flatten_path
+
+SQUARE = "M0 0 h10 v10 H0 Z"
+
+
+# --- Positive tests ---
+
+
+def test_flatten_path_resolves_relative_commands():
+    assert flatten_path(SQUARE) == [
+        (0.0, 0.0), (10.0, 0.0), (10.0, 10.0), (0.0, 10.0), (0.0, 0.0),
+    ]
+
+
+def test_flatten_path_keeps_first_subpath_only():
+    points = flatten_path("M0 0 L10 0 M50 50 L60 60")
+
+    assert points == [(0.0, 0.0), (10.0, 0.0)]
+
+
+def test_flatten_path_follows_curves_to_their_end():
+    points = flatten_path("M0,0 C0,10 10,10 10,0 s10,-10 20,0")
+
+    assert points[-1] == pytest.approx((30.0, 0.0))
+    assert max(y for _, y in points) == pytest.approx(7.5)
+
+
+def test_samples_are_equally_spaced_with_heading():
+    line = RacingLine.from_path(SQUARE, resolution=8)
+
+    assert line.length == 40.0
+    assert line.points[:3] == [(0.0, 0.0, 0.0), (5.0, 0.0, 0.0), (10.0, 0.0, 0.0)]
+    assert line.points[3] == (10.0, 5.0, 90.0)
+
+
+@pytest.mark.parametrize(
+    "fraction,expected",
+    [(0.0, (0.0, 0.0)), (0.125, (5.0, 0.0)), (0.5, (10.0, 10.0)), (1.25, (10.0, 0.0))],
+)
+def test_point_at_maps_fraction_to_position(fraction, expected):
+    line = RacingLine.from_path(SQUARE, resolution=64)
+
+    x, y, _ = line.point_at(fraction)
+
+    assert (x, y) == pytest.approx(expected)
+
+
+def test_project_returns_point_per_fraction():
+    line = RacingLine.from_path(SQUARE, resolution=64)
+
+    assert line.project([0.0, 0.25]) == [line.point_at(0.0), line.point_at(0.25)]
+
+
+def test_to_dict_flattens_points():
+    table = RacingLine.from_path(SQUARE, resolution=4).to_dict()
+
+    assert table["resolution"] == 4
+    assert table["length"] == 40.0
+    assert table["points"][:6] == [0.0, 0.0, 0.0, 10.0, 0.0, 0.0]
+
+
+# --- Negative tests ---
+
+
+def test_path_without_length_has_no_racing_line():
+    assert RacingLine.from_path("M5 5 Z") is None
+
+
+def test_invalid_path_has_no_racing_line():
+    assert RacingLine.from_path("10 10 L 20 20") is None
@@ -0,0 +1,170 @@
+import threading
+import time
+
+from backend.services.track_map.assets import JSON_MEDIA_TYPE
+from backend.services.track_map.service import TrackMapService
+from backend.services.track_map.svg_fetcher import TrackSvgFetcher
+
+TRACK_SVG = (
+    '<svg xmlns="http://www.w3.org/2000/svg">'
+    '<path d="M0 0 L10 10 Z M20 20 L30 30 Z"/>'
+    "</svg>"
+)
+START_FINISH_SVG = '<svg xmlns="http://www.w3.org/2000/svg"><g/></svg>'
+
+
+def write_track(root, track_id=123, name="Test Track", shortname="test_track"):
+    track_dir = root / f"tracks_{shortname}" / f"{track_id}-{name.lower().replace(' ', '-')}"
+    track_dir.mkdir(parents=True)
+    (track_dir / "active.svg").write_text(TRACK_SVG)
+    (track_dir / "start-finish.svg").write_text(START_FINISH_SVG)
+
+
+def wait_fetched(fetcher, track_id=123, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while fetcher.is_pending(track_id):
+        assert time.monotonic() < deadline, "fetch did not finish"
+        time.sleep(0.01)
+    return fetcher.result(track_id)
+
+
+# --- Positive tests ---
+
+
+def test_fetches_track_svgs_in_background(svg_server, tmp_path):
+    root, base_url, requests = svg_server
+    write_track(root)
+    fetcher = TrackSvgFetcher(cache_dir=tmp_path / "cache", base_url=base_url)
+
+    fetcher.request(123, "Test Track", "test_track")
+    svgs = wait_fetched(fetcher)
+
+    assert 'd="M0 0 L10 10 Z"' in svgs.track
+    assert "M20 20" not in svgs.track
+    assert svgs.start_finish == START_FINISH_SVG
+    assert svgs.racing_line.point_at(0.0)[:2] == (0.0, 0.0)
+    assert len(requests) == 2
+    fetcher.close()
+
+
+def test_second_request_of_track_is_not_fetched_again(svg_server, tmp_path):
+    root, base_url, requests = svg_server
+    write_track(root)
+    fetcher = TrackSvgFetcher(cache_dir=tmp_path / "cache", base_url=base_url)
+    fetcher.request(123, "Test Track", "test_track")
+    wait_fetched(fetcher)
+
+    fetcher.request(123, "Test Track", "test_track")
+
+    assert not fetcher.is_pending(123)
+    assert len(requests) == 2
+    fetcher.close()
+
+
+def test_restart_loads_svgs_from_disk_cache(svg_server, tmp_path):
+    root, base_url, requests = svg_server
+    write_track(root)
+    first = TrackSvgFetcher(cache_dir=tmp_path / "cache", base_url=base_url)
+    first.request(123, "Test Track", "test_track")
+    expected = wait_fetched(first)
+    first.close()
+
+    second = TrackSvgFetcher(cache_dir=tmp_path / "cache", base_url=base_url)
+    second.request(123, "Test Track", "test_track")
+
+    assert wait_fetched(second)[:2] == expected[:2]
+    assert len(requests) == 2
+    second.close()
+
+
+def test_snapshot_is_loading_until_svgs_arrive(
+    mock_values, svg_server, tmp_path
+):
+    root, base_url, _ = svg_server
+    write_track(root)
+    fetcher = TrackSvgFetcher(cache_dir=tmp_path / "cache", base_url=base_url)
+    release = threading.Event()
+    load = fetcher._load
+    fetcher._load = lambda *args: release.wait(5.0) and load(*args)
+    service = TrackMapService(mock_values, svg_fetcher=fetcher)
+
+    loading = service.get_snapshot()
+    release.set()
+    wait_fetched(fetcher)
+    loaded = service.get_snapshot()
+
+    assert loading["track_svg_loading"] is True
+    assert loading["track_svg_hash"] is None
+    assert loaded["track_svg_loading"] is False
+    assert service.assets.get(loaded["track_svg_hash"]).startswith(b"<svg")
+    assert service.assets.get(loaded["racing_line_hash"], JSON_MEDIA_TYPE)
+    fetcher.close()
+
+
+def test_previous_map_is_kept_on_session_change(
+    irsdk_mock_factory, svg_server, tmp_path
+):
+    root, base_url, _ = svg_server
+    write_track(root)
+    values = {
+        "PlayerCarIdx": 0,
+        "SessionNum": 0,
+        "CarIdxLapDistPct": [0.3],
+        "CarIdxOnPitRoad": [False],
+        "DriverInfo": {"Drivers": [{"CarNumber": "12", "CarClassID": 1}]},
+        "WeekendInfo": {
+            "SessionID": 1,
+            "TrackID": 123,
+            "TrackName": "Test Track",
+            "TrackDisplayShortName": "test_track",
+        },
+    }
+    fetcher = TrackSvgFetcher(cache_dir=tmp_path / "cache", base_url=base_url)
+    service = TrackMapService(irsdk_mock_factory(values), svg_fetcher=fetcher)
+    service.get_snapshot()
+    wait_fetched(fetcher)
+    first = service.get_snapshot()
+
+    values["SessionNum"] = 1
+    second = service.get_snapshot()
+
+    assert first["track_svg_hash"] is not None
+    assert second["track_svg_hash"] == first["track_svg_hash"]
+    fetcher.close()
+
+
+# --- Negative tests ---
+
+
+def test_failed_fetch_is_retried_on_next_request(svg_server, tmp_path):
+    root, base_url, requests = svg_server
+    fetcher = TrackSvgFetcher(cache_dir=tmp_path / "cache", base_url=base_url)
+    fetcher.request(123, "Test Track", "test_track")
+
+    assert wait_fetched(fetcher) is None
+
+    write_track(root)
+    fetcher.request(123, "Test Track", "test_track")
+
+    assert wait_fetched(fetcher) is not None
+    assert len(requests) == 4
+    fetcher.close()
+
+
+def test_track_change_drops_previous_map(mock_service):
+    mock_service._track_svg_hash = mock_service.assets.add("<svg>old</svg>")
+    mock_service._cached_track_id = 1
+
+    snapshot = mock_service.get_snapshot()
+
+    assert snapshot["track_svg_hash"] is None
+
+
+def test_unreachable_host_does_not_block_snapshot(mock_service):
+    start = time.monotonic()
+
+    snapshot = mock_service.get_snapshot()
+
+    assert time.monotonic() - start < 1.0
+    assert snapshot["status"] == "ok"
+    mock_service.svg_fetcher.close()
@@ -0,0 +1,132 @@
+import json
+import time
+from typing import NamedTuple
+
+import pytest
+
+from backend.services.track_map.bundle import (
+    BundledTrack,
+    TrackAssetBundle,
+    load_bundle,
+    write_bundle,
+)
+from backend.services.track_map.svg_fetcher import TrackSvgFetcher
+from tools import build_track_bundle
+
+
+def make_track(track_id: int) -> BundledTrack:
+    return BundledTrack(
+        track_id=track_id,
+        track_svg=f"<svg>{track_id}</svg>",
+        start_finish_svg="<svg>sf</svg>",
+        racing_line="M0 0 L10 10 Z",
+    )
+
+
+# --- Positive tests ---
+
+
+def test_bundle_round_trip(tmp_path):
+    path = tmp_path / "tracks.bin"
+    write_bundle(path, [make_track(214), make_track(5)])
+
+    bundle = TrackAssetBundle(path)
+
+    assert len(bundle) == 2
+    assert bundle.track_ids == [5, 214]
+    assert bundle.get(214) == make_track(214)
+    assert 5 in bundle
+    bundle.close()
+
+
+def test_fetcher_serves_bundled_track_without_network(svg_server, tmp_path):
+    _, base_url, requests = svg_server
+    path = tmp_path / "tracks.bin"
+    write_bundle(path, [make_track(123)])
+    fetcher = TrackSvgFetcher(
+        cache_dir=tmp_path / "cache",
+        base_url=base_url,
+        bundle=TrackAssetBundle(path),
+    )
+
+    fetcher.request(123, "Test Track", "test_track")
+
+    assert fetcher.result(123).track == "<svg>123</svg>"
+    deadline = time.monotonic() + 5
+    while fetcher.result(123).racing_line is None:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+    assert not fetcher.is_pending(123)
+    assert requests == []
+    fetcher.close()
+
+
+def test_build_tool_writes_fetched_tracks(svg_server, tmp_path, capsys):
+    root, base_url, _ = svg_server
+    track_dir = root / "tracks_test_track" / "214-test-track"
+    track_dir.mkdir(parents=True)
+    (track_dir / "active.svg").write_text(
+        '<svg xmlns="http://www.w3.org/2000/svg">'
+        '<path d="M0 0 L10 10 Z M20 20 L30 30 Z"/></svg>'
+    )
+    (track_dir / "start-finish.svg").write_text("<svg/>")
+    tracks = tmp_path / "tracks.json"
+    tracks.write_text(json.dumps([
+        {"track_id": 214, "track_name": "Test Track", "shortname": "test_track"},
+        {"track_id": 999, "track_name": "Missing", "shortname": "missing"},
+    ]))
+    output = tmp_path / "tracks.bin"
+
+    build_track_bundle.main([
+        str(tracks),
+        "--output", str(output),
+        "--cache-dir", str(tmp_path / "cache"),
+        "--base-url", base_url,
+    ])
+
+    bundle = TrackAssetBundle(output)
+    track = bundle.get(214)
+    assert bundle.track_ids == [214]
+    assert track.racing_line == "M0 0 L10 10 Z"
+    assert "M20 20" not in track.track_svg
+    assert "Wrote 1 of 2 tracks" in capsys.readouterr().out
+    bundle.close()
+
+
+def test_bundle_ignores_unknown_fields(tmp_path):
+    path = tmp_path / "tracks.bin"
+    legacy = NamedTuple(
+        "LegacyTrack",
+        [(name, object) for name in BundledTrack._fields] + [("direction", int)],
+    )
+    write_bundle(path, [legacy(*make_track(7), direction=-1)])
+
+    bundle = TrackAssetBundle(path)
+
+    assert bundle.get(7) == make_track(7)
+    bundle.close()
+
+
+# --- Negative tests ---
+
+
+def test_unknown_track_is_none(tmp_path):
+    path = tmp_path / "tracks.bin"
+    write_bundle(path, [make_track(1)])
+    bundle = TrackAssetBundle(path)
+
+    assert bundle.get(2) is None
+    bundle.close()
+
+
+def test_invalid_bundle_is_rejected(tmp_path):
+    path = tmp_path / "tracks.bin"
+    path.write_bytes(b"not a bundle at all")
+
+    with pytest.raises(ValueError):
+        TrackAssetBundle(path)
+    assert load_bundle(path) is None
+
+
+def test_missing_bundle_is_none(tmp_path):
+    assert load_bundle(tmp_path / "missing.bin") is None
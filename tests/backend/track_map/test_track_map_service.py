@@ -1,4 +1,8 @@
+from unittest.mock import MagicMock
+
+from backend.services.irsdk.frame import TelemetryFrame
 from backend.services.track_map.service import TrackMapService
+from backend.services.track_map.svg_fetcher import TrackSvgs
 
 
 # --- Positive tests ---
@@ -77,8 +81,8 @@ def test_track_svg_is_reused_from_cache_between_snapshots(mock_service):
 
     def fake_update(track_id, track_name, track_short_name):
         update_calls.append((track_id, track_name, track_short_name))
-        mock_service._cached_track_svg = "<svg>track</svg>"
-        mock_service._cached_start_finish_svg = "<svg>sf</svg>"
+        mock_service._track_svg_hash = mock_service.assets.add("<svg>track</svg>")
+        mock_service._start_finish_svg_hash = mock_service.assets.add("<svg>sf</svg>")
         mock_service._cached_track_id = track_id
 
     mock_service._update_track_svgs = fake_update
@@ -87,10 +91,12 @@ def test_track_svg_is_reused_from_cache_between_snapshots(mock_service):
     second_snapshot = mock_service.get_snapshot()
 
     assert len(update_calls) == 1
-    assert first_snapshot["track_svg"] == "<svg>track</svg>"
-    assert second_snapshot["track_svg"] == "<svg>track</svg>"
-    assert first_snapshot["start_finish_svg"] == "<svg>sf</svg>"
-    assert second_snapshot["start_finish_svg"] == "<svg>sf</svg>"
+    track_hash = first_snapshot["track_svg_hash"]
+    assert mock_service.assets.get(track_hash) == b"<svg>track</svg>"
+    assert second_snapshot["track_svg_hash"] == track_hash
+    assert mock_service.assets.get(
+        second_snapshot["start_finish_svg_hash"]
+    ) == b"<svg>sf</svg>"
 
 
 def test_track_svg_cache_is_refreshed_after_track_change(irsdk_mock_factory):
@@ -129,8 +135,10 @@ def test_track_svg_cache_is_refreshed_after_track_change(irsdk_mock_factory):
 
     def fake_update(track_id, track_name, track_short_name):
         update_calls.append(track_id)
-        service._cached_track_svg = f"<svg>{track_id}</svg>"
-        service._cached_start_finish_svg = f"<svg>sf-{track_id}</svg>"
+        service._track_svg_hash = service.assets.add(f"<svg>{track_id}</svg>")
+        service._start_finish_svg_hash = service.assets.add(
+            f"<svg>sf-{track_id}</svg>"
+        )
         service._cached_track_id = track_id
 
     service._update_track_svgs = fake_update
@@ -142,8 +150,53 @@ def test_track_svg_cache_is_refreshed_after_track_change(irsdk_mock_factory):
     second_snapshot = service.get_snapshot()
 
     assert update_calls == [123, 456]
-    assert first_snapshot["track_svg"] == "<svg>123</svg>"
-    assert second_snapshot["track_svg"] == "<svg>456</svg>"
+    assert service.assets.get(first_snapshot["track_svg_hash"]) == b"<svg>123</svg>"
+    assert service.assets.get(second_snapshot["track_svg_hash"]) == b"<svg>456</svg>"
+
+
+def test_cars_section_does_not_fetch_svgs(mock_service):
+    mock_service._update_track_svgs = MagicMock(side_effect=AssertionError)
+
+    snapshot = mock_service.get_snapshot(sections=["cars"])
+
+    assert "cars" in snapshot
+    assert "track_svg_hash" not in snapshot
+    mock_service._update_track_svgs.assert_not_called()
+
+
+def test_projections_share_session_change_of_tick(irsdk_mock_factory):
+    values = {
+        "PlayerCarIdx": 0,
+        "SessionNum": 0,
+        "CarIdxLapDistPct": [0.3],
+        "CarIdxOnPitRoad": [False],
+        "DriverInfo": {"Drivers": [{"CarNumber": "12", "CarClassID": 1}]},
+        "WeekendInfo": {"SessionID": 1234567890, "TrackID": 123},
+    }
+    irsdk = irsdk_mock_factory(values)
+    frame = TelemetryFrame(tick_count=5, session_time=None)
+    irsdk.get_frame.side_effect = lambda: frame
+    service = TrackMapService(irsdk)
+    service._update_track_svgs = MagicMock()
+
+    cars_only = service.get_snapshot(sections=["cars"])
+    full = service.get_snapshot()
+
+    assert cars_only["is_session_changed"] is True
+    assert full["is_session_changed"] is True
+    service._update_track_svgs.assert_called_once()
+
+
+def test_snapshot_carries_svg_hashes_only(mock_service):
+    svgs = TrackSvgs("<svg>track</svg>", "<svg>sf</svg>")
+    mock_service.svg_fetcher.result = MagicMock(return_value=svgs)
+
+    snapshot = mock_service.get_snapshot()
+
+    svg = mock_service.assets.get(snapshot["track_svg_hash"])
+    assert svg == b"<svg>track</svg>"
+    assert len(snapshot["track_svg_hash"]) == 16
+    assert "track_svg" not in snapshot
 
 
 # --- Negative tests ---
@@ -160,3 +213,13 @@ def test_build_context_returns_none_when_no_drivers(irsdk_mock_factory):
     service = TrackMapService(irsdk_mock_factory(values))
     ctx = service._build_context()
     assert ctx is None
+
+
+def test_snapshot_has_no_svg_hash_without_start_finish(mock_service):
+    svgs = TrackSvgs("<svg>track</svg>", None)
+    mock_service.svg_fetcher.result = MagicMock(return_value=svgs)
+
+    snapshot = mock_service.get_snapshot()
+
+    assert snapshot["track_svg_hash"] is not None
+    assert snapshot["start_finish_svg_hash"] is None
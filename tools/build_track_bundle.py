@@ -0,0 +1,81 @@
+"""
+Build the offline track asset bundle.
+
+Fetches the SVGs of every listed track (reusing the track SVG cache of
+the app), extracts the racing line and writes them into one bundle
+file that the backend memory-maps, see
+backend.services.track_map.bundle.
+
+The tracks file is a JSON list of {"track_id", "track_name",
+"shortname"} objects, the TrackID, TrackName and TrackDisplayShortName
+of WeekendInfo. Track ids of OVERRIDES and DIRECTION_OVERRIDES missing
+from it are reported, they are the tracks known to need special care.
+
+Usage:
+    python -m tools.build_track_bundle tracks.json [--output PATH]
+        [--cache-dir DIR] [--base-url URL]
+"""
+import argparse
+import json
+from pathlib import Path
+
+from backend.services.track_map.bundle import (
+    BundledTrack,
+    default_bundle_path,
+    write_bundle,
+)
+from backend.services.track_map.svg_fetcher import TrackSvgFetcher
+from backend.utils.track_url_generation import (
+    DIRECTION_OVERRIDES,
+    OVERRIDES,
+    extract_racing_line,
+)
+
+
+def build_tracks(tracks: list[dict], fetcher: TrackSvgFetcher) -> list[BundledTrack]:
+    """Fetch and pre-process the listed tracks, skipping unavailable ones."""
+    bundled = []
+    for track in tracks:
+        track_id = int(track["track_id"])
+        svgs = fetcher.fetch(track_id, track["track_name"], track["shortname"])
+        if svgs is None:
+            print(f"{track_id}: no track SVG, skipped")
+            continue
+        bundled.append(
+            BundledTrack(
+                track_id=track_id,
+                track_svg=svgs.track,
+                start_finish_svg=svgs.start_finish,
+                racing_line=extract_racing_line(svgs.track),
+            )
+        )
+    return bundled
+
+
+def main(argv: list[str] | None = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("tracks", help="JSON list of tracks")
+    parser.add_argument("--output", type=Path, default=None)
+    parser.add_argument("--cache-dir", type=Path, default=None)
+    parser.add_argument("--base-url", default=None)
+    args = parser.parse_args(argv)
+
+    tracks = json.loads(Path(args.tracks).read_text(encoding="utf-8"))
+    listed = {int(track["track_id"]) for track in tracks}
+    unlisted = sorted((set(OVERRIDES) | set(DIRECTION_OVERRIDES)) - listed)
+    if unlisted:
+        print(f"Known track ids missing from {args.tracks}: {unlisted}")
+
+    fetcher = TrackSvgFetcher(cache_dir=args.cache_dir, base_url=args.base_url)
+    try:
+        bundled = build_tracks(tracks, fetcher)
+    finally:
+        fetcher.close()
+
+    output = args.output or default_bundle_path()
+    count = write_bundle(output, bundled)
+    print(f"Wrote {count} of {len(tracks)} tracks to {output}")
+
+
+if __name__ == "__main__":
+    main()